@@ -0,0 +1,1153 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from json import dumps
+from json import loads
+from random import random
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from encommon.types import DictStrAny
+from encommon.types import NCNone
+from encommon.types import getate
+from encommon.types import sort_dict
+
+from httpx import Response
+
+from websockets.asyncio.client import ClientConnection
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosedOK
+
+from .buckets import ClientBuckets
+from .cache import ClientCache
+from .inflate import ClientInflate
+from .latency import ClientLatency
+from .models import ClientEvent
+from .outbox import ClientOutbox
+from .session import ClientFileStore
+from .session import ClientStore
+from ..utils import HTTPClient
+from ..utils import dumlog
+from ..utils import http_client
+from ..utils.http import _FILES
+from ..utils.http import _JSON
+from ..utils.http import _METHODS
+from ..utils.http import _PAYLOAD
+
+if TYPE_CHECKING:
+    from .params import ClientParams
+
+
+
+class AsyncClient:
+    """
+    Establish and maintain connection with the chat service.
+
+    .. note::
+       Heartbeats are sent from their own task, independent of
+       when the events are received from the upstream server.
+
+    :param params: Parameters used to instantiate the class.
+    :param logger: Callback for logging the related events.
+    :param shard: Optional shard identifier and shard count.
+    :param store: Optional store used for persisting session.
+    """
+
+    __params: 'ClientParams'
+    __logger: Callable[..., None]
+
+    __client: HTTPClient
+    __buckets: ClientBuckets
+    __cache: ClientCache
+    __socket: Optional[ClientConnection]
+    __conned: asyncio.Event
+    __exited: asyncio.Event
+    __mynick: Optional[tuple[str, str]]
+    __lsnick: Optional[tuple[str, str]]
+    __resume: asyncio.Event
+
+    __ping: Optional[float]
+    __path: Optional[str]
+    __sesid: Optional[str]
+    __seqno: Optional[int]
+    __inflate: Optional[ClientInflate]
+    __latency: ClientLatency
+    __store: Optional[ClientStore]
+    __restored: bool
+    __outbox: ClientOutbox
+    __flusher: Optional[asyncio.Task[None]]
+    __shard: Optional[tuple[int, int]]
+
+    __mqueue: asyncio.Queue[ClientEvent]
+    __cancel: asyncio.Event
+
+
+    def __init__(
+        self,
+        params: 'ClientParams',
+        logger: Optional[Callable[..., None]] = None,
+        *,
+        shard: Optional[tuple[int, int]] = None,
+        store: Optional[ClientStore] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__params = params
+        self.__logger = (
+            logger or dumlog)
+
+        client = http_client(
+            params,
+            logger=self.__logger)
+
+        self.__client = client
+        self.__buckets = ClientBuckets()
+        self.__cache = ClientCache(
+            params.cache_members)
+        self.__socket = None
+        self.__conned = asyncio.Event()
+        self.__exited = asyncio.Event()
+        self.__mynick = None
+        self.__lsnick = None
+        self.__resume = asyncio.Event()
+
+        self.__ping = None
+        self.__path = None
+        self.__sesid = None
+        self.__seqno = None
+        self.__inflate = None
+        self.__latency = ClientLatency()
+        self.__store = store
+        self.__restored = False
+        self.__outbox = ClientOutbox(
+            coalesce=params.send_coalesce)
+        self.__flusher = None
+
+        if (store is None
+                and params.session_file):
+
+            path = params.session_file
+
+            if shard is not None:
+                path += f'.{shard[0]}'
+
+            self.__store = (
+                ClientFileStore(path))
+        self.__shard = shard
+
+        self.__mqueue = asyncio.Queue(
+            params.queue_size)
+
+        self.__cancel = asyncio.Event()
+
+
+    @property
+    def params(
+        self,
+    ) -> 'ClientParams':
+        """
+        Return the Pydantic model containing the configuration.
+
+        :returns: Pydantic model containing the configuration.
+        """
+
+        return self.__params
+
+
+    @property
+    def connected(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return (
+            not self.__exited.is_set()
+            and self.__conned.is_set())
+
+
+    @property
+    def nickname(
+        self,
+    ) -> Optional[tuple[str, str]]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__mynick or self.__lsnick
+
+
+    @property
+    def latency(
+        self,
+    ) -> ClientLatency:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__latency
+
+
+    @property
+    def outbox(
+        self,
+    ) -> ClientOutbox:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__outbox
+
+
+    @property
+    def shard(
+        self,
+    ) -> Optional[tuple[int, int]]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__shard
+
+
+    @property
+    def cache(
+        self,
+    ) -> ClientCache:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__cache
+
+
+    @property
+    def mqueue(
+        self,
+    ) -> asyncio.Queue[ClientEvent]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__mqueue
+
+
+    @property
+    def canceled(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return (
+            self.__cancel.is_set()
+            or self.__exited.is_set())
+
+
+    async def events(
+        self,
+    ) -> AsyncIterator[ClientEvent]:
+        """
+        Return the events from the queue as they are received.
+
+        :returns: Events from the queue as they are received.
+        """
+
+        mqueue = self.__mqueue
+
+        while True:
+
+            event = await mqueue.get()
+
+            yield event
+
+
+    async def operate(
+        self,
+        *,
+        intents: int = 4609,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+
+        :param intents: Determine what content will be received.
+        """
+
+        logger = self.__logger
+
+        try:
+
+            logger(item='initial')
+
+            self.__mynick = None
+
+            self.__ping = None
+            self.__path = None
+            self.__sesid = None
+            self.__seqno = None
+
+            self.__recover()
+
+            await asyncio.sleep(0)
+
+            while not self.canceled:
+
+                logger(item='operate')
+
+                self.__socket = None
+                self.__conned.clear()
+                self.__exited.clear()
+
+                self.__cancel.clear()
+
+                await self.__operate(intents)
+
+                await asyncio.sleep(1)
+
+        finally:
+
+            self.__socket = None
+            self.__conned.clear()
+            self.__exited.clear()
+            self.__mynick = None
+
+            self.__ping = None
+            self.__path = None
+
+            self.__cancel.clear()
+
+            logger(item='finish')
+
+
+    async def __operate(
+        self,
+        intents: int,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+
+        :param intents: Determine what content will be received.
+        """
+
+        logger = self.__logger
+        resume = self.__resume
+
+
+        await self.__connect()
+
+        socket = self.__socket
+
+        assert socket is not None
+
+
+        watcher = asyncio.create_task(
+            self.__watcher(socket))
+
+        heartbeat: Optional[
+            asyncio.Task[None]] = None
+
+
+        try:
+
+            receive: Optional[DictStrAny] = None
+
+            while (receive is None
+                   and not self.canceled):
+                receive = await (
+                    self.socket_recv())
+
+            if receive is None:
+                await socket.close(1000)
+                return None
+
+            await self.__event(receive)
+
+
+            beat = getate(
+                receive,
+                'd/heartbeat_interval')
+
+            if beat is not None:
+                self.__ping = beat / 1000
+
+            if self.__ping is None:  # NOCVR
+                raise ConnectionError
+
+
+            await self.__identify(intents)
+
+            heartbeat = asyncio.create_task(
+                self.__heartbeat())
+
+
+            def _continue() -> bool:
+
+                return all([
+                    not resume.is_set()
+                    and not self.canceled])
+
+
+            while _continue():
+
+                receive = await (
+                    self.socket_recv())
+
+                if receive is not None:
+                    await self.__event(receive)
+
+                await self.socket_flush()
+
+
+            code = (
+                4000
+                if (resume.is_set()
+                    or self.__store)
+                else 1000)
+
+            await self.__persist()
+
+            logger(
+                item='close',
+                code=code)
+
+            await socket.close(code)
+
+        finally:
+
+            watcher.cancel()
+
+            if heartbeat is not None:
+                heartbeat.cancel()
+
+            flusher = self.__flusher
+
+            if flusher is not None:
+                flusher.cancel()
+
+
+        if self.__exited.is_set():
+            raise ConnectionError
+
+
+    async def __watcher(
+        self,
+        socket: ClientConnection,
+    ) -> None:
+        """
+        Close the socket connection once cancel is requested.
+
+        :param socket: Connection which is closed upon cancel.
+        """
+
+        await self.__cancel.wait()
+
+        await self.__persist()
+
+        await socket.close(
+            4000 if self.__store
+            else 1000)
+
+
+    async def __heartbeat(
+        self,
+    ) -> None:
+        """
+        Transmit the heartbeat to server using provided interval.
+
+        .. note::
+           First heartbeat is delayed by random portion of interval
+           and connection is resumed when one is not acknowledged.
+        """
+
+        logger = self.__logger
+        latency = self.__latency
+        resume = self.__resume
+        socket = self.__socket
+        ping = self.__ping
+
+        assert socket is not None
+        assert ping is not None
+
+        latency.reset()
+
+        wait = (
+            ping
+            * random())  # noqa: S311
+
+        while not self.canceled:
+
+            await asyncio.sleep(wait)
+
+            wait = ping
+
+            if latency.missed:
+
+                logger(item='zombie')
+
+                resume.set()
+
+                await socket.close(4000)
+
+                break
+
+            await self.__beat()
+
+        await asyncio.sleep(0)
+
+
+    async def __beat(
+        self,
+    ) -> None:
+        """
+        Transmit the heartbeat to server recording when it sent.
+        """
+
+        logger = self.__logger
+        latency = self.__latency
+
+        logger(item='ping')
+
+        latency.sent()
+
+        await self.socket_send({
+            'op': 1,
+            'd': self.__seqno})
+
+
+    async def __event(
+        self,
+        event: DictStrAny,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+
+        :param event: Raw event received from the network peer.
+        """
+
+        logger = self.__logger
+        mqueue = self.__mqueue
+        cache = self.__cache
+
+        type = event.get('t')
+        opcode = event.get('op')
+
+        model = ClientEvent
+
+
+        await asyncio.sleep(0)
+
+        if opcode == 11:
+            return None
+
+
+        if type in ['READY', 'RESUMED']:
+            self.__restored = False
+
+        if type == 'READY':
+
+            logger(item='helo')
+
+
+            sesid = getate(
+                event,
+                'd/session_id')
+
+            assert sesid is not None
+
+            self.__sesid = sesid
+
+
+            path = getate(
+                event,
+                'd/resume_gateway_url')
+
+            if path is not None:
+                self.__path = path
+
+            await self.__persist()
+
+
+            user = getate(
+                event, 'd/user')
+
+            assert user is not None
+
+            self.__mynick = (
+                user['username'],
+                user['id'])
+
+            self.__lsnick = (
+                user['username'],
+                user['id'])
+
+
+        cache.ingest(event)
+
+        object = model(
+            self, event)
+
+        await mqueue.put(object)
+
+
+    def __recover(
+        self,
+    ) -> None:
+        """
+        Restore the session state from store to attempt resume.
+        """
+
+        logger = self.__logger
+        store = self.__store
+
+        state = (
+            store.load()
+            if store is not None
+            else None)
+
+        if state is None:
+            return None
+
+        sesid = state.get('session_id')
+        seqno = state.get('sequence')
+        path = state.get('resume_url')
+
+        if not sesid or not path:
+            return None
+
+        logger(
+            item='recover',
+            session=sesid,
+            sequence=seqno)
+
+        self.__sesid = sesid
+        self.__seqno = seqno
+        self.__path = path
+
+        self.__restored = True
+
+        self.__resume.set()
+
+
+    async def __persist(
+        self,
+    ) -> None:
+        """
+        Store the session state so connection could be resumed.
+
+        .. note::
+           State is stored when the session is established and when
+           the connection is closed, using thread to avoid blocking.
+        """
+
+        store = self.__store
+        sesid = self.__sesid
+
+        await asyncio.sleep(0)
+
+        if (store is None
+                or sesid is None):
+            return None
+
+        state = {
+            'session_id': sesid,
+            'sequence': self.__seqno,
+            'resume_url': self.__path}
+
+        await asyncio.to_thread(
+            store.save, state)
+
+
+    def __invalid(
+        self,
+    ) -> None:
+        """
+        Forget the session state after invalidated by upstream.
+
+        .. note::
+           Session restored from the store is not considered fatal
+           when invalidated, instead falling back to identifying.
+        """
+
+        logger = self.__logger
+        store = self.__store
+
+        restored = self.__restored
+
+        logger(
+            item='invalid',
+            restored=restored)
+
+        if store is not None:
+            store.clear()
+
+        self.__sesid = None
+        self.__seqno = None
+        self.__restored = False
+
+        if not restored:
+            self.__exited.set()
+            return None
+
+        self.__path = None
+
+        self.__resume.set()
+
+
+    def stop(
+        self,
+    ) -> None:
+        """
+        Gracefully close the connection with the server socket.
+        """
+
+        logger = self.__logger
+
+        logger(item='stop')
+
+        self.__cancel.set()
+
+
+    async def __setpath(
+        self,
+    ) -> None:
+        """
+        Collect and store the relevant path for the websockets.
+        """
+
+        request = self.request
+
+        response = await request(
+            'get', 'gateway')
+
+        (response
+         .raise_for_status())
+
+
+        fetch = response.json()
+
+        assert isinstance(fetch, dict)
+
+        path = fetch['url']
+
+
+        self.__path = path
+
+
+    async def __connect(
+        self,
+    ) -> None:
+        """
+        Establish the connection with the upstream using socket.
+        """
+
+        logger = self.__logger
+
+        if self.__path is None:
+            await self.__setpath()
+
+        path = self.__path
+
+        assert path is not None
+
+        logger(item='connect')
+
+        self.__inflate = None
+
+        if self.__params.compress:
+
+            self.__inflate = ClientInflate()
+
+            path = ClientInflate.location(path)
+
+        socket = await connect(path)
+
+        self.__socket = socket
+
+        self.__outbox.reset()
+
+        self.__conned.set()
+        self.__exited.clear()
+
+
+    async def __resumify(
+        self,
+    ) -> None:
+        """
+        Identify the client once the connection is established.
+        """
+
+        logger = self.__logger
+        sesid = self.__sesid
+        seqno = self.__seqno
+
+        _params = self.__params
+        token = _params.token
+
+        data = {
+            'token': token,
+            'session_id': sesid,
+            'seq': seqno}
+
+        logger(item='resumify')
+
+        await self.socket_send({
+            'op': 6, 'd': data})
+
+
+    async def __identify(
+        self,
+        intents: int,
+        client: str = 'enconnect',
+    ) -> None:
+        """
+        Identify the client once the connection is established.
+
+        :param intents: Determine what content will be received.
+        :param client: Value for browser and device properties.
+        """
+
+        logger = self.__logger
+        resume = self.__resume
+
+        resuming = (
+            resume.is_set()
+            and self.__sesid is not None)
+
+        resume.clear()
+
+        if resuming:
+
+            await self.__resumify()
+
+            return None
+
+        props = {
+            '$os': 'linux',
+            '$browser': client,
+            '$device': client}
+
+        _params = self.__params
+        token = _params.token
+
+        data = {
+            'intents': intents,
+            'properties': props,
+            'token': token}
+
+        shard = self.__shard
+
+        if shard is not None:
+            data['shard'] = list(shard)
+
+        logger(item='identify')
+
+        await self.socket_send({
+            'op': 2, 'd': data})
+
+
+    async def socket_send(
+        self,
+        send: DictStrAny,
+        priority: Optional[int] = None,
+    ) -> None:
+        """
+        Transmit provided content through the socket connection.
+
+        .. note::
+           Content is queued and sent within the limits permitted
+           by the gateway, with the remaining sent once permitted.
+
+        :param send: Content which will be sent through socket.
+        :param priority: Optional override for command priority.
+        """
+
+        await asyncio.sleep(0)
+
+        if self.__socket is None:
+            return NCNone
+
+        (self.__outbox
+         .put(send, priority))
+
+        await self.socket_flush()
+
+
+    async def socket_flush(
+        self,
+    ) -> float:
+        """
+        Transmit the queued content permitted by gateway limits.
+
+        :returns: Seconds until next queued content is permitted.
+        """
+
+        logger = self.__logger
+        exited = self.__exited
+        outbox = self.__outbox
+        socket = self.__socket
+
+        await asyncio.sleep(0)
+
+        if socket is None:
+            return 0.0
+
+
+        send, wait = outbox.pop()
+
+        while send is not None:
+
+            transmit = dumps(send)
+
+            logger(
+                item='transmit',
+                value=transmit)
+
+            try:
+                await socket.send(transmit)
+
+            except ConnectionClosedOK:
+                exited.set()
+                return 0.0
+
+            send, wait = outbox.pop()
+
+        if wait > 0:
+            self.__deferred(wait)
+
+        return wait
+
+
+    def __deferred(
+        self,
+        wait: float,
+    ) -> None:
+        """
+        Schedule the flush for when next content is permitted.
+
+        :param wait: Seconds until next content will be permitted.
+        """
+
+        flusher = self.__flusher
+
+        if (flusher is not None
+                and not flusher.done()):
+            return None
+
+
+        async def _flush() -> None:
+
+            await asyncio.sleep(wait)
+
+            await self.socket_flush()
+
+
+        self.__flusher = (
+            asyncio.create_task(
+                _flush()))
+
+
+    async def socket_recv(  # noqa: CFQ004
+        self,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the content received from the socket connection.
+
+        :returns: Content received from the socket connection.
+        """
+
+        logger = self.__logger
+        exited = self.__exited
+        resume = self.__resume
+        cancel = self.__cancel
+        socket = self.__socket
+
+        await asyncio.sleep(0)
+
+        if socket is None:
+            return NCNone
+
+
+        try:
+
+            recv = await socket.recv()
+
+            logger(
+                item='receive',
+                value=recv)
+
+        except ConnectionClosed as reason:
+
+            if (not resume.is_set()
+                    and not isinstance(
+                        reason, ConnectionClosedOK)):
+                raise
+
+            if (not cancel.is_set()
+                    and not resume.is_set()):
+                exited.set()
+
+            return None
+
+
+        inflate = self.__inflate
+
+        if (inflate is not None
+                and isinstance(recv, bytes)):
+
+            decoded = inflate.feed(recv)
+
+            if decoded is None:
+                return None
+
+            recv = decoded
+
+        event = loads(recv)
+
+        assert isinstance(event, dict)
+
+        opcode = event.get('op')
+        seqno = event.get('s')
+
+        if seqno is not None:
+            self.__seqno = seqno
+
+        if opcode == 1:
+            await self.__beat()
+
+        if opcode == 11:
+            self.__latency.acked()
+
+        if opcode == 7:
+            resume.set()
+
+        if opcode == 9:
+            self.__invalid()
+
+        return sort_dict(event)
+
+
+    async def request(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        path: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
+        timeout: Optional[int] = None,
+    ) -> Response:
+        """
+        Return the response for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param path: Path for the location to upstream endpoint.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param files: Optional file payload included in request.
+        :param timeout: Timeout waiting for the server response.
+            This will override the default client instantiated.
+        :returns: Response from upstream request to the server.
+        """
+
+        params = dict(params or {})
+        json = (
+            list(json)
+            if isinstance(json, list)
+            else dict(json or {}))
+
+        logger = self.__logger
+        client = self.__client
+
+        logger(
+            item='request',
+            method=method,
+            path=path,
+            params=params,
+            json=(
+                dumps(json)
+                if len(json) >= 1
+                else None))
+
+        request = client.request_async
+
+        location = (
+            'https://discord.com'
+            f'/api/v10/{path}')
+
+        _params = self.__params
+        token = _params.token
+
+        tokey = 'Authorization'
+        _token = f'Bot {token}'
+        ctkey = 'Content-Type'
+        content = 'application/json'
+
+        headers = {tokey: _token}
+
+        if files is NCNone:
+            headers[ctkey] = content
+
+        buckets = self.__buckets
+
+        wait = buckets.reserve(
+            method, path)
+
+        while wait > 0:
+
+            logger(
+                item='ratelimit',
+                path=path,
+                wait=wait)
+
+            await asyncio.sleep(wait)
+
+            wait = buckets.reserve(
+                method, path)
+
+        response = await request(
+            method=method,
+            location=location,
+            params=params,
+            headers=headers,
+            json=json,
+            data=data,
+            files=files,
+            timeout=timeout)
+
+        buckets.update(
+            method, path,
+            response)
+
+        return response
@@ -0,0 +1,322 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+from httpx import Response
+
+
+
+MAJORS = {
+    'channels': 2,
+    'guilds': 2,
+    'webhooks': 3}
+
+REFRESH = 10.0
+
+POLLING = 0.05
+
+
+
+class ClientBucket:
+    """
+    Contain the state for bucket as reported by the upstream.
+    """
+
+    remaining: Optional[int]
+    resets: float
+    refresh: float
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.remaining = None
+        self.resets = 0.0
+        self.refresh = 0.0
+
+
+
+class ClientBuckets:
+    """
+    Delay requests before they would exceed the route limits.
+
+    .. note::
+       Buckets are keyed by the hash returned from the server
+       for the route template, along with the major parameter,
+       so requests to different channels do not block others.
+
+    .. note::
+       Once the bucket resets only one request is permitted,
+       which refreshes the bucket, with others held until the
+       response is received, or the refresh is abandoned.
+    """
+
+    __routes: dict[str, str]
+    __buckets: dict[str, ClientBucket]
+    __global: float
+    __lock: Lock
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__routes = {}
+        self.__buckets = {}
+        self.__global = 0.0
+        self.__lock = Lock()
+
+
+    def keyed(
+        self,
+        method: str,
+        path: str,
+    ) -> str:
+        """
+        Return the unique key for the bucket used with request.
+
+        :param method: Method for operation with the API server.
+        :param path: Path for the location to upstream endpoint.
+        :returns: Unique key for the bucket used with request.
+        """
+
+        route, major = (
+            routed(method, path))
+
+        hashed = (
+            self.__routes
+            .get(route, route))
+
+        return f'{hashed}:{major}'
+
+
+    def reserve(  # noqa: CFQ004
+        self,
+        method: str,
+        path: str,
+    ) -> float:
+        """
+        Return the seconds to wait or zero when request reserved.
+
+        .. note::
+           Request is only reserved when returning zero, otherwise
+           the caller should wait and then attempt reserving again.
+
+        :param method: Method for operation with the API server.
+        :param path: Path for the location to upstream endpoint.
+        :returns: Seconds to wait or zero when request reserved.
+        """
+
+        buckets = self.__buckets
+
+        key = self.keyed(
+            method, path)
+
+        with self.__lock:
+
+            current = monotonic()
+
+            wait = max(
+                0.0,
+                self.__global
+                - current)
+
+            bucket = buckets.get(key)
+
+            if (wait > 0
+                    or bucket is None
+                    or bucket.remaining is None):
+                return wait
+
+            if bucket.resets <= current:
+
+                if bucket.refresh > current:
+                    return POLLING
+
+                bucket.refresh = (
+                    current + REFRESH)
+
+                bucket.remaining = 0
+
+                return 0.0
+
+            if bucket.remaining >= 1:
+                bucket.remaining -= 1
+                return 0.0
+
+            return (
+                bucket.resets
+                - current)
+
+
+    def update(
+        self,
+        method: str,
+        path: str,
+        response: Response,
+    ) -> None:
+        """
+        Update the buckets using headers returned from upstream.
+
+        :param method: Method for operation with the API server.
+        :param path: Path for the location to upstream endpoint.
+        :param response: Response from upstream request to server.
+        """
+
+        headers = response.headers
+        routes = self.__routes
+        buckets = self.__buckets
+
+        route, major = (
+            routed(method, path))
+
+        hashed = headers.get(
+            'x-ratelimit-bucket')
+
+        remain = headers.get(
+            'x-ratelimit-remaining')
+
+        after = headers.get(
+            'x-ratelimit-reset-after')
+
+        retry = headers.get(
+            'retry-after', after)
+
+        isglobal = headers.get(
+            'x-ratelimit-global')
+
+
+        with self.__lock:
+
+            current = monotonic()
+
+            if hashed is not None:
+                routes[route] = hashed
+
+            key = (
+                f'{routes.get(route, route)}'
+                f':{major}')
+
+            bucket = buckets.get(key)
+
+            if bucket is not None:
+                bucket.refresh = 0.0
+
+            if (remain is not None
+                    and after is not None):
+
+                bucket = (
+                    buckets.setdefault(
+                        key, ClientBucket()))
+
+                bucket.remaining = int(remain)
+                bucket.resets = (
+                    current + float(after))
+
+            if (response.status_code == 429
+                    and isglobal == 'true'
+                    and retry is not None):
+
+                self.__global = (
+                    current + float(retry))
+
+
+    def stats(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the current state for the buckets being tracked.
+
+        :returns: Current state for the buckets being tracked.
+        """
+
+        current = monotonic()
+
+        with self.__lock:
+
+            return {
+                key: {
+                    'remaining': x.remaining,
+                    'resets': max(
+                        0.0,
+                        x.resets - current)}
+                for key, x in
+                self.__buckets.items()}
+
+
+
+def routed(
+    method: str,
+    path: str,
+) -> tuple[str, str]:
+    """
+    Return the route template and major parameter for request.
+
+    .. note::
+       Identifiers are replaced in the template, other than the
+       major parameter, which Discord limits separately from
+       the other requests using the same route template.
+
+    :param method: Method for operation with the API server.
+    :param path: Path for the location to upstream endpoint.
+    :returns: Route template and major parameter for request.
+    """
+
+    parts = (
+        path.split('?')[0]
+        .strip('/')
+        .split('/'))
+
+    keep = MAJORS.get(parts[0], 0)
+
+    major = '/'.join(parts[:keep])
+
+    template: list[str] = []
+
+
+    for index, part in enumerate(parts):
+
+        prior = (
+            parts[index - 1]
+            if index >= 1 else None)
+
+        if 1 <= index < keep:
+            template.append('{major}')
+
+        elif part.isdigit():
+            template.append('{id}')
+
+        elif prior == 'reactions':
+            template.append('{emoji}')
+
+        elif (parts[0] == 'interactions'
+                and index == 2):
+            template.append('{token}')
+
+        else:
+            template.append(part)
+
+
+    route = '/'.join(template)
+
+    return (
+        f'{method.upper()} {route}',
+        major)
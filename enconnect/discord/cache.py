@@ -0,0 +1,403 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+from encommon.types import DictStrAny
+from encommon.types import getate
+
+
+
+_MEMBER = tuple[str, str]
+
+
+
+NESTED = [
+    'channels',
+    'threads',
+    'members']
+
+CHANNEL = [
+    'CHANNEL_CREATE',
+    'CHANNEL_UPDATE',
+    'THREAD_CREATE',
+    'THREAD_UPDATE']
+
+MEMBER = [
+    'GUILD_MEMBER_ADD',
+    'GUILD_MEMBER_UPDATE']
+
+
+
+class ClientCache:
+    """
+    Store the guilds, channels, and members from the gateway.
+
+    .. note::
+       Guilds and channels are kept until deleted upstream, as
+       they are bounded, while members are evicted using least
+       recently used once the maximum number is exceeded.
+
+    :param members: Maximum number of members kept in cache.
+    """
+
+    __guilds: dict[str, DictStrAny]
+    __channels: dict[str, DictStrAny]
+    __members: OrderedDict[_MEMBER, DictStrAny]
+    __maximum: int
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        members: int = 10000,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert members >= 0
+
+        self.__guilds = {}
+        self.__channels = {}
+        self.__members = OrderedDict()
+        self.__maximum = members
+        self.__lock = Lock()
+
+
+    @property
+    def maximum(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__maximum
+
+
+    def stats(
+        self,
+    ) -> dict[str, int]:
+        """
+        Return the number of the entities kept within the cache.
+
+        :returns: Number of the entities kept within the cache.
+        """
+
+        with self.__lock:
+
+            return {
+                'guilds': len(self.__guilds),
+                'channels': len(self.__channels),
+                'members': len(self.__members)}
+
+
+    def guild(
+        self,
+        unique: str,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the guild from cache when it has been received.
+
+        :param unique: Unique identifier to locate with Discord.
+        :returns: Guild from cache when it has been received.
+        """
+
+        with self.__lock:
+            return self.__guilds.get(unique)
+
+
+    def channel(
+        self,
+        unique: str,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the channel from cache when it has been received.
+
+        :param unique: Unique identifier to locate with Discord.
+        :returns: Channel from cache when it has been received.
+        """
+
+        with self.__lock:
+            return self.__channels.get(unique)
+
+
+    def member(
+        self,
+        guild: str,
+        unique: str,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the member from cache when it has been received.
+
+        :param guild: Unique identifier for guild with member.
+        :param unique: Unique identifier to locate with Discord.
+        :returns: Member from cache when it has been received.
+        """
+
+        members = self.__members
+
+        key = (guild, unique)
+
+        with self.__lock:
+
+            member = members.get(key)
+
+            if member is not None:
+                members.move_to_end(key)
+
+            return member
+
+
+    def put_guild(
+        self,
+        guild: DictStrAny,
+    ) -> None:
+        """
+        Store the guild with its channels and members in cache.
+
+        :param guild: Guild payload as received from upstream.
+        """
+
+        unique = guild['id']
+
+        stored = {
+            k: v for k, v
+            in guild.items()
+            if k not in NESTED}
+
+        with self.__lock:
+
+            self.__guilds[unique] = stored
+
+            for channel in [
+                    *guild.get('channels', []),
+                    *guild.get('threads', [])]:
+
+                channel = {
+                    **channel,
+                    'guild_id': unique}
+
+                self.__put_channel(channel)
+
+            for member in (
+                    guild.get('members', [])):
+                self.__put_member(
+                    unique, member)
+
+
+    def put_channel(
+        self,
+        channel: DictStrAny,
+    ) -> None:
+        """
+        Store the channel within the cache replacing existing.
+
+        :param channel: Channel payload as received from upstream.
+        """
+
+        with self.__lock:
+            self.__put_channel(channel)
+
+
+    def __put_channel(
+        self,
+        channel: DictStrAny,
+    ) -> None:
+        """
+        Store the channel within the cache replacing existing.
+
+        :param channel: Channel payload as received from upstream.
+        """
+
+        unique = channel['id']
+
+        self.__channels[unique] = channel
+
+
+    def __put_member(
+        self,
+        guild: str,
+        member: DictStrAny,
+    ) -> None:
+        """
+        Store the member within the cache evicting when needed.
+
+        :param guild: Unique identifier for guild with member.
+        :param member: Member payload as received from upstream.
+        """
+
+        members = self.__members
+        maximum = self.__maximum
+
+        if maximum == 0:
+            return None
+
+        unique = getate(
+            member, 'user/id')
+
+        if unique is None:
+            return None
+
+        key = (guild, unique)
+
+        members[key] = member
+
+        members.move_to_end(key)
+
+        while len(members) > maximum:
+            members.popitem(last=False)
+
+
+    def __unavailable(
+        self,
+        unique: str,
+    ) -> None:
+        """
+        Mark the guild unavailable retaining it within the cache.
+
+        .. note::
+           Discord sends the delete with unavailable flag during an
+           outage, rather than when the client leaves the guild.
+
+        :param unique: Unique identifier to locate with Discord.
+        """
+
+        guilds = self.__guilds
+
+        guild = guilds.get(unique)
+
+        if guild is not None:
+            guilds[unique] = {
+                **guild,
+                'unavailable': True}
+
+
+    def __delete_guild(
+        self,
+        unique: str,
+    ) -> None:
+        """
+        Remove the guild and its related entities from cache.
+
+        :param unique: Unique identifier to locate with Discord.
+        """
+
+        channels = self.__channels
+        members = self.__members
+
+        self.__guilds.pop(unique, None)
+
+        for key in [
+                k for k, v
+                in channels.items()
+                if v.get('guild_id') == unique]:
+            del channels[key]
+
+        for member in [
+                k for k in members
+                if k[0] == unique]:
+            del members[member]
+
+
+    def ingest(
+        self,
+        event: DictStrAny,
+    ) -> None:
+        """
+        Update the cache using the event received from gateway.
+
+        :param event: Raw event received from the network peer.
+        """
+
+        type = event.get('t')
+        data = event.get('d')
+
+        if not isinstance(data, dict):
+            return None
+
+        if type in ['GUILD_CREATE',
+                    'GUILD_UPDATE']:
+            return self.__ingest_guild(
+                type, data)
+
+        guild = data.get('guild_id')
+
+
+        with self.__lock:
+
+            if type in CHANNEL:
+                self.__put_channel(data)
+
+            elif type in [
+                    'CHANNEL_DELETE',
+                    'THREAD_DELETE']:
+                (self.__channels
+                 .pop(data['id'], None))
+
+            elif (type == 'GUILD_DELETE'
+                    and data.get('unavailable')):
+                self.__unavailable(
+                    data['id'])
+
+            elif type == 'GUILD_DELETE':
+                self.__delete_guild(
+                    data['id'])
+
+            elif (type in MEMBER
+                    and guild is not None):
+                self.__put_member(
+                    guild, data)
+
+            elif (type == 'GUILD_MEMBERS_CHUNK'
+                    and guild is not None):
+                for member in data['members']:
+                    self.__put_member(
+                        guild, member)
+
+            elif (type == 'GUILD_MEMBER_REMOVE'
+                    and guild is not None):
+                self.__members.pop(
+                    (guild, data['user']['id']),
+                    None)
+
+
+    def __ingest_guild(
+        self,
+        type: str,
+        data: DictStrAny,
+    ) -> None:
+        """
+        Update the cache using the event received from gateway.
+
+        :param type: Type of the event received from gateway.
+        :param data: Payload with the event data from gateway.
+        """
+
+        if type == 'GUILD_CREATE':
+            return self.put_guild(data)
+
+        unique = data['id']
+
+        with self.__lock:
+
+            existing = (
+                self.__guilds
+                .get(unique, {}))
+
+            self.__guilds[unique] = {
+                **existing,
+                **{k: v for k, v
+                   in data.items()
+                   if k not in NESTED}}
@@ -0,0 +1,203 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from queue import Empty
+from queue import Queue
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+
+
+class ClientChunks:
+    """
+    Yield the members from chunks received for the request.
+
+    .. note::
+       Members are yielded as each chunk arrives, allowing the
+       consumer to begin processing before the guild completes.
+
+    :param nonce: Unique identifier included with the request.
+    :param timeout: Seconds waiting for each chunk to arrive.
+    :param finish: Callback when iteration has been completed.
+    """
+
+    __nonce: str
+    __timeout: float
+    __finish: Callable[[str], None]
+
+    __queue: Queue[DictStrAny]
+    __index: Optional[int]
+    __count: Optional[int]
+    __received: int
+    __missing: list[str]
+
+
+    def __init__(
+        self,
+        nonce: str,
+        timeout: float,
+        finish: Callable[[str], None],
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__nonce = nonce
+        self.__timeout = timeout
+        self.__finish = finish
+
+        self.__queue = Queue()
+        self.__index = None
+        self.__count = None
+        self.__received = 0
+        self.__missing = []
+
+
+    @property
+    def nonce(
+        self,
+    ) -> str:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__nonce
+
+
+    @property
+    def index(
+        self,
+    ) -> Optional[int]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__index
+
+
+    @property
+    def count(
+        self,
+    ) -> Optional[int]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__count
+
+
+    @property
+    def received(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__received
+
+
+    @property
+    def missing(
+        self,
+    ) -> list[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return list(self.__missing)
+
+
+    @property
+    def complete(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        index = self.__index
+        count = self.__count
+
+        if index is None:
+            return False
+
+        assert count is not None
+
+        return index + 1 >= count
+
+
+    def put(
+        self,
+        chunk: DictStrAny,
+    ) -> None:
+        """
+        Queue the chunk received from gateway for the iteration.
+
+        :param chunk: Payload with the event data from gateway.
+        """
+
+        self.__queue.put(chunk)
+
+
+    def __iter__(
+        self,
+    ) -> Iterator[DictStrAny]:
+        """
+        Return the members from chunks as they are received.
+
+        :returns: Members from chunks as they are received.
+        """
+
+        queue = self.__queue
+        timeout = self.__timeout
+
+        try:
+
+            while not self.complete:
+
+                try:
+                    chunk = queue.get(
+                        timeout=timeout)
+
+                except Empty:
+                    raise TimeoutError from None
+
+                self.__index = (
+                    chunk['chunk_index'])
+
+                self.__count = (
+                    chunk['chunk_count'])
+
+                self.__missing.extend(
+                    chunk.get('not_found', []))
+
+                members = chunk['members']
+
+                self.__received += len(members)
+
+                yield from members
+
+        finally:
+            self.__finish(self.__nonce)
@@ -10,15 +10,18 @@ is permitted, for more information consult the project license file.
 from json import dumps
 from json import loads
 from queue import Queue
+from random import random
 from threading import Event
+from threading import Lock
+from threading import Thread
 from time import sleep as block_sleep
 from typing import Any
 from typing import Callable
 from typing import Optional
 from typing import TYPE_CHECKING
 from urllib.parse import quote
+from uuid import uuid4
 
-from encommon.times import Timer
 from encommon.types import DictStrAny
 from encommon.types import NCNone
 from encommon.types import getate
@@ -30,20 +33,38 @@ from websockets.exceptions import ConnectionClosedOK
 from websockets.sync.client import ClientConnection
 from websockets.sync.client import connect
 
+from .buckets import ClientBuckets
+from .cache import ClientCache
+from .chunks import ClientChunks
+from .inflate import ClientInflate
+from .latency import ClientLatency
 from .models import ClientEvent
+from .outbox import ClientOutbox
+from .session import ClientFileStore
+from .session import ClientStore
 from ..utils import HTTPClient
+from ..utils import HTTPUpload
 from ..utils import dumlog
+from ..utils import http_client
+from ..utils.http import _FILES
+from ..utils.http import _JSON
 from ..utils.http import _METHODS
 from ..utils.http import _PAYLOAD
+from ..utils.upload import _SOURCE
 
 if TYPE_CHECKING:
     from .params import ClientParams
+    from .shards import ClientShards
 
 
 
-PING = {
-    'op': 1,
-    'd': None}
+DEFAULTS: DictStrAny = {
+    'autocomplete': False,
+    'default_member_permissions': None,
+    'dm_permission': True,
+    'nsfw': False,
+    'options': [],
+    'required': False}
 
 
 
@@ -52,12 +73,18 @@ class Client:
     Establish and maintain connection with the chat service.
 
     :param params: Parameters used to instantiate the class.
+    :param logger: Callback for logging the related events.
+    :param shard: Optional shard identifier and shard count.
+    :param shards: Optional manager the shard is a member of.
+    :param store: Optional store used for persisting session.
     """
 
     __params: 'ClientParams'
     __logger: Callable[..., None]
 
     __client: HTTPClient
+    __buckets: ClientBuckets
+    __cache: ClientCache
     __socket: Optional[ClientConnection]
     __conned: Event
     __exited: Event
@@ -65,10 +92,20 @@ class Client:
     __lsnick: Optional[tuple[str, str]]
     __resume: Event
 
-    __ping: Optional[int]
+    __ping: Optional[float]
     __path: Optional[str]
     __sesid: Optional[str]
     __seqno: Optional[int]
+    __inflate: Optional[ClientInflate]
+    __latency: ClientLatency
+    __store: Optional[ClientStore]
+    __restored: bool
+    __outbox: ClientOutbox
+    __sender: Lock
+    __chunks: dict[str, ClientChunks]
+
+    __shard: Optional[tuple[int, int]]
+    __shards: Optional['ClientShards']
 
     __mqueue: Queue[ClientEvent]
     __cancel: Event
@@ -78,6 +115,10 @@ class Client:
         self,
         params: 'ClientParams',
         logger: Optional[Callable[..., None]] = None,
+        *,
+        shard: Optional[tuple[int, int]] = None,
+        shards: Optional['ClientShards'] = None,
+        store: Optional[ClientStore] = None,
     ) -> None:
         """
         Initialize instance for class using provided parameters.
@@ -87,12 +128,20 @@ class Client:
         self.__logger = (
             logger or dumlog)
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params,
+            logger=self.__logger)
 
         self.__client = client
+        self.__buckets = (
+            shards.buckets
+            if shards is not None
+            else ClientBuckets())
+        self.__cache = (
+            shards.cache
+            if shards is not None
+            else ClientCache(
+                params.cache_members))
         self.__socket = None
         self.__conned = Event()
         self.__exited = Event()
@@ -104,9 +153,33 @@ class Client:
         self.__path = None
         self.__sesid = None
         self.__seqno = None
+        self.__inflate = None
+        self.__latency = ClientLatency()
+        self.__store = store
+        self.__restored = False
+        self.__outbox = ClientOutbox(
+            coalesce=params.send_coalesce)
+        self.__sender = Lock()
+        self.__chunks = {}
+
+        if (store is None
+                and params.session_file):
+
+            path = params.session_file
+
+            if shard is not None:
+                path += f'.{shard[0]}'
+
+            self.__store = (
+                ClientFileStore(path))
 
-        self.__mqueue = Queue(
-            params.queue_size)
+        self.__shard = shard
+        self.__shards = shards
+
+        self.__mqueue = (
+            shards.mqueue
+            if shards is not None
+            else Queue(params.queue_size))
 
         self.__cancel = Event()
 
@@ -152,6 +225,58 @@ class Client:
         return self.__mynick or self.__lsnick
 
 
+    @property
+    def latency(
+        self,
+    ) -> ClientLatency:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__latency
+
+
+    @property
+    def outbox(
+        self,
+    ) -> ClientOutbox:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__outbox
+
+
+    @property
+    def shard(
+        self,
+    ) -> Optional[tuple[int, int]]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__shard
+
+
+    @property
+    def cache(
+        self,
+    ) -> ClientCache:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__cache
+
+
     @property
     def mqueue(
         self,
@@ -204,7 +329,7 @@ class Client:
             self.__sesid = None
             self.__seqno = None
 
-            self.__setpath()
+            self.__recover()
 
             while not self.canceled:
 
@@ -256,10 +381,15 @@ class Client:
         assert socket is not None
 
 
-        receive = (
-            self.socket_recv())
+        receive: Optional[DictStrAny] = None
 
-        assert receive is not None
+        while (receive is None
+               and not self.canceled):
+            receive = self.socket_recv()
+
+        if receive is None:
+            socket.close(1000)
+            return None
 
         self.__event(receive)
 
@@ -272,16 +402,21 @@ class Client:
             self.__ping = beat / 1000
 
 
-        ping = self.__ping
-
-        if ping is None:  # NOCVR
+        if self.__ping is None:  # NOCVR
             raise ConnectionError
 
-        timer = Timer(ping)
-
 
         self.__identify(intents)
 
+        halt = Event()
+
+        heartbeat = Thread(
+            target=self.__heartbeat,
+            args=(halt,),
+            daemon=True)
+
+        heartbeat.start()
+
 
         def _continue() -> bool:
 
@@ -290,27 +425,30 @@ class Client:
                 and not self.canceled])
 
 
-        while _continue():
+        try:
 
-            receive = (
-                self.socket_recv())
+            while _continue():
 
-            if receive is not None:
-                self.__event(receive)
+                receive = (
+                    self.socket_recv())
 
-            if timer.pause():
-                continue  # NOCVR
+                if receive is not None:
+                    self.__event(receive)
 
-            logger(item='ping')
+                self.socket_flush()
 
-            self.socket_send(PING)
+        finally:
+            halt.set()
 
 
         code = (
             4000
-            if resume.is_set()
+            if (resume.is_set()
+                or self.__store)
             else 1000)
 
+        self.__persist()
+
         logger(
             item='close',
             code=code)
@@ -322,6 +460,67 @@ class Client:
             raise ConnectionError
 
 
+    def __heartbeat(
+        self,
+        halt: Event,
+    ) -> None:
+        """
+        Transmit the heartbeat to server using provided interval.
+
+        .. note::
+           First heartbeat is delayed by random portion of interval
+           and connection is resumed when one is not acknowledged.
+
+        :param halt: Event which is set when connection closes.
+        """
+
+        logger = self.__logger
+        latency = self.__latency
+        resume = self.__resume
+        ping = self.__ping
+
+        assert ping is not None
+
+        latency.reset()
+
+        wait = (
+            ping
+            * random())  # noqa: S311
+
+        while not halt.wait(wait):
+
+            wait = ping
+
+            if latency.missed:
+
+                logger(item='zombie')
+
+                resume.set()
+
+                break
+
+            self.__beat()
+
+
+    def __beat(
+        self,
+    ) -> None:
+        """
+        Transmit the heartbeat to server recording when it sent.
+        """
+
+        logger = self.__logger
+        latency = self.__latency
+
+        logger(item='ping')
+
+        latency.sent()
+
+        self.socket_send({
+            'op': 1,
+            'd': self.__seqno})
+
+
     def __event(
         self,
         event: DictStrAny,
@@ -334,6 +533,7 @@ class Client:
 
         logger = self.__logger
         mqueue = self.__mqueue
+        cache = self.__cache
 
         type = event.get('t')
         opcode = event.get('op')
@@ -345,6 +545,9 @@ class Client:
             return None
 
 
+        if type in ['READY', 'RESUMED']:
+            self.__restored = False
+
         if type == 'READY':
 
             logger(item='helo')
@@ -366,6 +569,8 @@ class Client:
             if path is not None:
                 self.__path = path
 
+            self.__persist()
+
 
             user = getate(
                 event, 'd/user')
@@ -381,12 +586,138 @@ class Client:
                 user['id'])
 
 
+        cache.ingest(event)
+
+        if type == 'GUILD_MEMBERS_CHUNK':
+            self.__chunked(event)
+
         object = model(
             self, event)
 
         mqueue.put(object)
 
 
+    def __recover(
+        self,
+    ) -> None:
+        """
+        Restore the session state from store to attempt resume.
+        """
+
+        logger = self.__logger
+        store = self.__store
+
+        state = (
+            store.load()
+            if store is not None
+            else None)
+
+        if state is None:
+            return None
+
+        sesid = state.get('session_id')
+        seqno = state.get('sequence')
+        path = state.get('resume_url')
+
+        if not sesid or not path:
+            return None
+
+        logger(
+            item='recover',
+            session=sesid,
+            sequence=seqno)
+
+        self.__sesid = sesid
+        self.__seqno = seqno
+        self.__path = path
+
+        self.__restored = True
+
+        self.__resume.set()
+
+
+    def __persist(
+        self,
+    ) -> None:
+        """
+        Store the session state so connection could be resumed.
+
+        .. note::
+           State is stored when the session is established and when
+           the connection is closed, rather than with each heartbeat.
+        """
+
+        store = self.__store
+        sesid = self.__sesid
+
+        if (store is None
+                or sesid is None):
+            return None
+
+        store.save({
+            'session_id': sesid,
+            'sequence': self.__seqno,
+            'resume_url': self.__path})
+
+
+    def __invalid(
+        self,
+    ) -> None:
+        """
+        Forget the session state after invalidated by upstream.
+
+        .. note::
+           Session restored from the store is not considered fatal
+           when invalidated, instead falling back to identifying.
+        """
+
+        logger = self.__logger
+        store = self.__store
+
+        restored = self.__restored
+
+        logger(
+            item='invalid',
+            restored=restored)
+
+        if store is not None:
+            store.clear()
+
+        self.__sesid = None
+        self.__seqno = None
+        self.__restored = False
+
+        if not restored:
+            self.__exited.set()
+            return None
+
+        self.__path = None
+
+        self.__resume.set()
+
+
+    def __chunked(
+        self,
+        event: DictStrAny,
+    ) -> None:
+        """
+        Route the chunk to the request that included the nonce.
+
+        :param event: Raw event received from the network peer.
+        """
+
+        chunks = self.__chunks
+
+        nonce = getate(
+            event, 'd/nonce')
+
+        if nonce not in chunks:
+            return None
+
+        (chunks[nonce]
+         .put(event['d']))
+
+
     def stop(
         self,
     ) -> None:
@@ -408,6 +739,13 @@ class Client:
         Collect and store the relevant path for the websockets.
         """
 
+        shards = self.__shards
+
+        if (shards is not None
+                and shards.path):
+            self.__path = shards.path
+            return None
+
         request = self.request
 
         response = request(
@@ -435,16 +773,30 @@ class Client:
         """
 
         logger = self.__logger
+
+        if self.__path is None:
+            self.__setpath()
+
         path = self.__path
 
         assert path is not None
 
         logger(item='connect')
 
+        self.__inflate = None
+
+        if self.__params.compress:
+
+            self.__inflate = ClientInflate()
+
+            path = ClientInflate.location(path)
+
         socket = connect(path)
 
         self.__socket = socket
 
+        self.__outbox.reset()
+
         self.__conned.set()
         self.__exited.clear()
 
@@ -492,9 +844,13 @@ class Client:
         logger = self.__logger
         resume = self.__resume
 
-        if resume.is_set():
+        resuming = (
+            resume.is_set()
+            and self.__sesid is not None)
 
-            resume.clear()
+        resume.clear()
+
+        if resuming:
 
             self.__resumify()
 
@@ -513,6 +869,16 @@ class Client:
             'properties': props,
             'token': token}
 
+        shard = self.__shard
+        shards = self.__shards
+
+        if shard is not None:
+            data['shard'] = list(shard)
+
+        if (shard is not None
+                and shards is not None):
+            shards.identify(shard[0])
+
         logger(item='identify')
 
         self.socket_send({
@@ -522,32 +888,67 @@ class Client:
     def socket_send(
         self,
         send: DictStrAny,
+        priority: Optional[int] = None,
     ) -> None:
         """
         Transmit provided content through the socket connection.
 
+        .. note::
+           Content is queued and sent within the limits permitted
+           by the gateway, with the remaining sent once permitted.
+
         :param send: Content which will be sent through socket.
+        :param priority: Optional override for command priority.
+        """
+
+        if self.__socket is None:
+            return NCNone
+
+        (self.__outbox
+         .put(send, priority))
+
+        self.socket_flush()
+
+
+    def socket_flush(
+        self,
+    ) -> float:
+        """
+        Transmit the queued content permitted by gateway limits.
+
+        :returns: Seconds until next queued content is permitted.
         """
 
         logger = self.__logger
         exited = self.__exited
+        outbox = self.__outbox
         socket = self.__socket
 
         if socket is None:
-            return NCNone
+            return 0.0
 
-        transmit = dumps(send)
 
-        logger(
-            item='transmit',
-            value=transmit)
+        with self.__sender:
 
-        try:
-            socket.send(transmit)
+            while True:
 
-        except ConnectionClosedOK:
-            exited.set()
-            return None
+                send, wait = outbox.pop()
+
+                if send is None:
+                    return wait
+
+                transmit = dumps(send)
+
+                logger(
+                    item='transmit',
+                    value=transmit)
+
+                try:
+                    socket.send(transmit)
+
+                except ConnectionClosedOK:
+                    exited.set()
+                    return 0.0
 
 
     def socket_recv(  # noqa: CFQ004
@@ -584,6 +985,18 @@ class Client:
             return None
 
 
+        inflate = self.__inflate
+
+        if (inflate is not None
+                and isinstance(recv, bytes)):
+
+            decoded = inflate.feed(recv)
+
+            if decoded is None:
+                return None
+
+            recv = decoded
+
         event = loads(recv)
 
         assert isinstance(event, dict)
@@ -594,11 +1007,17 @@ class Client:
         if seqno is not None:
             self.__seqno = seqno
 
+        if opcode == 1:
+            self.__beat()
+
+        if opcode == 11:
+            self.__latency.acked()
+
         if opcode == 7:
             resume.set()
 
         if opcode == 9:
-            exited.set()
+            self.__invalid()
 
         return sort_dict(event)
 
@@ -608,10 +1027,10 @@ class Client:
         method: _METHODS,
         path: str,
         params: Optional[_PAYLOAD] = None,
-        json: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
         *,
         data: Optional[_PAYLOAD] = None,
-        files: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
         timeout: Optional[int] = None,
     ) -> Response:
         """
@@ -629,7 +1048,10 @@ class Client:
         """
 
         params = dict(params or {})
-        json = dict(json or {})
+        json = (
+            list(json)
+            if isinstance(json, list)
+            else dict(json or {}))
 
         logger = self.__logger
         client = self.__client
@@ -663,7 +1085,24 @@ class Client:
         if files is NCNone:
             headers[ctkey] = content
 
-        return request(
+        buckets = self.__buckets
+
+        wait = buckets.reserve(
+            method, path)
+
+        while wait > 0:
+
+            logger(
+                item='ratelimit',
+                path=path,
+                wait=wait)
+
+            block_sleep(wait)
+
+            wait = buckets.reserve(
+                method, path)
+
+        response = request(
             method=method,
             location=location,
             params=params,
@@ -673,6 +1112,81 @@ class Client:
             files=files,
             timeout=timeout)
 
+        buckets.update(
+            method, path,
+            response)
+
+        return response
+
+
+    def request_members(  # noqa: CFQ002
+        self,
+        guild: str,
+        query: str = '',
+        limit: int = 0,
+        *,
+        users: Optional[list[str]] = None,
+        presences: bool = False,
+        timeout: float = 30,
+    ) -> ClientChunks:
+        """
+        Request the members for guild using the gateway opcode.
+
+        .. note::
+           Members are also stored in the cache as chunks arrive,
+           in addition to being yielded by the returned iterator.
+
+        :param guild: Unique identifier in the Discord server.
+        :param query: Return members whose username starts with.
+        :param limit: Maximum number of members to be returned.
+        :param users: Optional identifiers to return instead.
+        :param presences: Whether the presences are included.
+        :param timeout: Seconds waiting for each chunk to arrive.
+        :returns: Iterator yielding members as chunks arrive.
+        """
+
+        chunks = self.__chunks
+
+        nonce = uuid4().hex
+
+        data: DictStrAny = {
+            'guild_id': guild,
+            'limit': limit,
+            'presences': presences,
+            'nonce': nonce}
+
+        if users is not None:
+            data['user_ids'] = users
+
+        else:
+            data['query'] = query
+
+
+        chunk = ClientChunks(
+            nonce, timeout,
+            self.__unchunk)
+
+        chunks[nonce] = chunk
+
+        self.socket_send({
+            'op': 8, 'd': data})
+
+        return chunk
+
+
+    def __unchunk(
+        self,
+        nonce: str,
+    ) -> None:
+        """
+        Remove the request once iteration has been completed.
+
+        :param nonce: Unique identifier included with the request.
+        """
+
+        (self.__chunks
+         .pop(nonce, None))
+
 
     def slash_create(
         # NOCVR
@@ -774,20 +1288,122 @@ class Client:
              .raise_for_status())
 
 
+    def slash_sync(
+        self,
+        commands: list[DictStrAny],
+        guild: Optional[str] = None,
+    ) -> dict[str, list[str]]:
+        """
+        Converge the registered commands with those provided.
+
+        .. note::
+           Registered commands are compared with those provided and
+           when any differ they are replaced using bulk overwrite,
+           so convergence takes at most two upstream requests.
+           Providing no commands will remove those registered.
+
+        :param commands: Parameters for registering the commands.
+        :param guild: Discord guild for registering the command.
+        :returns: Names of commands grouped by how they changed.
+        """
+
+        params = self.params
+        appid = params.appid
+
+        assert appid is not None
+
+        request = self.request
+
+        path = (
+            f'applications/{appid}'
+            '/commands')
+
+        if guild is not None:
+            path = path.replace(
+                '/commands',
+                (f'/guilds/{guild}'
+                 '/commands'))
+
+
+        response = request(
+            'get', path)
+
+        (response
+         .raise_for_status())
+
+        current = {
+            (x['name'], x.get('type', 1)): x
+            for x in response.json()}
+
+        desired = {
+            (x['name'], x.get('type', 1)): x
+            for x in commands}
+
+
+        changes: dict[str, list[str]] = {
+            'created': [],
+            'updated': [],
+            'deleted': [],
+            'unchanged': []}
+
+        for key, command in desired.items():
+
+            exists = current.get(key)
+
+            change = (
+                'created'
+                if exists is None
+                else 'updated'
+                if _differs(command, exists)
+                else 'unchanged')
+
+            changes[change].append(key[0])
+
+        changes['deleted'] = [
+            x[0] for x in current
+            if x not in desired]
+
+
+        changed = any([
+            changes['created'],
+            changes['updated'],
+            changes['deleted']])
+
+        if changed:
+
+            response = request(
+                'put', path,
+                json=commands)
+
+            (response
+             .raise_for_status())
+
+
+        return changes
+
+
     def get_guild(
-        # NOCVR
         self,
         unique: str,
+        refresh: bool = False,
     ) -> DictStrAny:
         """
         Return the information about the object within Discord.
 
         :param unique: Unique identifier to locate with Discord.
+        :param refresh: Ignore the cache and request from server.
         :returns: Response from upstream request to the server.
         """
 
+        cache = self.__cache
         request = self.request
 
+        cached = cache.guild(unique)
+
+        if (cached is not None
+                and not refresh):
+            return cached
+
         path = f'guilds/{unique}'
 
         response = request(
@@ -800,23 +1416,33 @@ class Client:
 
         assert isinstance(fetch, dict)
 
+        cache.put_guild(fetch)
+
         return fetch
 
 
     def get_channel(
-        # NOCVR
         self,
         unique: str,
+        refresh: bool = False,
     ) -> DictStrAny:
         """
         Return the information about the object within Discord.
 
         :param unique: Unique identifier to locate with Discord.
+        :param refresh: Ignore the cache and request from server.
         :returns: Response from upstream request to the server.
         """
 
+        cache = self.__cache
         request = self.request
 
+        cached = cache.channel(unique)
+
+        if (cached is not None
+                and not refresh):
+            return cached
+
         path = f'channels/{unique}'
 
         response = request(
@@ -829,6 +1455,8 @@ class Client:
 
         assert isinstance(fetch, dict)
 
+        cache.put_channel(fetch)
+
         return fetch
 
 
@@ -862,6 +1490,64 @@ class Client:
         return response
 
 
+    def message_attach(
+        self,
+        channel: str,
+        sources: list[_SOURCE],
+        payload: Optional[DictStrAny] = None,
+    ) -> Response:
+        """
+        Create the message with files streamed from the sources.
+
+        .. note::
+           Files are streamed from disk while request is sent,
+           avoiding reading the complete files into the memory.
+
+        :param channel: Unique identifier in the Discord server.
+        :param sources: Paths to files or the binary file objects.
+        :param payload: Message payload with the Discord syntax.
+        :returns: Response from upstream request to the server.
+        """
+
+        request = self.request
+
+        path = (
+            f'channels/{channel}'
+            '/messages')
+
+        upload = HTTPUpload()
+
+        for index, source in enumerate(sources):
+            upload.add(
+                source,
+                field=f'files[{index}]')
+
+        attachments = [
+            {'id': index,
+             'filename': name}
+            for index, name
+            in enumerate(upload.names)]
+
+        payload = {
+            **(payload or {}),
+            'attachments': attachments}
+
+        data = {
+            'payload_json': dumps(payload)}
+
+        with upload:
+
+            response = request(
+                'post', path,
+                data=data,
+                files=upload)
+
+        (response
+         .raise_for_status())
+
+        return response
+
+
     def message_update(
         # NOCVR
         self,
@@ -1021,3 +1707,45 @@ class Client:
 
         (response
          .raise_for_status())
+
+
+
+def _differs(
+    desired: Any,  # noqa: ANN401
+    current: Any,  # noqa: ANN401
+) -> bool:
+    """
+    Return whether the desired value differs from the current.
+
+    .. note::
+       Only keys present in desired value are compared, because
+       the upstream includes additional keys with the defaults.
+       Keys omitted by the upstream are compared with defaults.
+
+    :param desired: Value which is expected to be registered.
+    :param current: Value which is currently registered.
+    :returns: Whether the desired value differs from current.
+    """
+
+    if isinstance(desired, dict):
+
+        return (
+            not isinstance(current, dict)
+            or any(
+                _differs(v, current.get(
+                    k, DEFAULTS.get(k)))
+                for k, v in desired.items()))
+
+    if isinstance(desired, list):
+
+        return (
+            not isinstance(current, list)
+            or len(desired) != len(current)
+            or any(
+                _differs(x, y) for x, y
+                in zip(desired, current)))
+
+    matched: bool = (
+        desired == current)
+
+    return not matched
@@ -0,0 +1,92 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from typing import Optional
+from typing import TYPE_CHECKING
+from zlib import decompressobj
+
+if TYPE_CHECKING:
+    from zlib import _Decompress
+
+
+
+SUFFIX = b'\x00\x00\xff\xff'
+
+
+
+class ClientInflate:
+    """
+    Decompress the frames received using the zlib-stream mode.
+
+    .. note::
+       Same context is shared across all frames on connection,
+       and frames are buffered until the sync flush is received.
+    """
+
+    __buffer: bytearray
+    __inflate: '_Decompress'
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__buffer = bytearray()
+        self.__inflate = decompressobj()
+
+
+    @staticmethod
+    def location(
+        path: str,
+    ) -> str:
+        """
+        Return the location with compression requested in query.
+
+        :param path: Location for the gateway from the upstream.
+        :returns: Location with compression requested in query.
+        """
+
+        separate = (
+            '&' if '?' in path
+            else '?')
+
+        return (
+            f'{path}{separate}'
+            'compress=zlib-stream')
+
+
+    def feed(
+        self,
+        frame: bytes,
+    ) -> Optional[str]:
+        """
+        Return the payload once the complete message is received.
+
+        :param frame: Frame received from the socket connection.
+        :returns: Payload once the complete message is received.
+        """
+
+        buffer = self.__buffer
+        inflate = self.__inflate
+
+        buffer.extend(frame)
+
+        if buffer[-4:] != SUFFIX:
+            return None
+
+        decoded = (
+            inflate
+            .decompress(buffer))
+
+        buffer.clear()
+
+        return decoded.decode('utf-8')
@@ -0,0 +1,162 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from collections import deque
+from math import ceil
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+
+
+class ClientLatency:
+    """
+    Track the heartbeats sent and when they are acknowledged.
+
+    .. note::
+       Heartbeat is missed when another one is about to be sent
+       and the previous heartbeat was never acknowledged, which
+       indicates the connection has become zombied upstream.
+
+    :param samples: Number of samples kept for percentiles.
+    """
+
+    __sent: Optional[float]
+    __last: Optional[float]
+    __samples: deque[float]
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        samples: int = 100,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert samples >= 1
+
+        self.__sent = None
+        self.__last = None
+        self.__samples = deque(
+            maxlen=samples)
+        self.__lock = Lock()
+
+
+    @property
+    def last(
+        self,
+    ) -> Optional[float]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__last
+
+
+    @property
+    def missed(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__sent is not None
+
+
+    def reset(
+        self,
+    ) -> None:
+        """
+        Forget the heartbeat pending when connection is created.
+        """
+
+        with self.__lock:
+            self.__sent = None
+
+
+    def sent(
+        self,
+    ) -> None:
+        """
+        Record the time when heartbeat was sent to the upstream.
+        """
+
+        with self.__lock:
+            self.__sent = monotonic()
+
+
+    def acked(
+        self,
+    ) -> Optional[float]:
+        """
+        Record the acknowledgement and return the elapsed time.
+
+        :returns: Seconds elapsed since heartbeat was sent.
+        """
+
+        with self.__lock:
+
+            sent = self.__sent
+
+            if sent is None:
+                return None
+
+            elapsed = (
+                monotonic() - sent)
+
+            self.__samples.append(elapsed)
+            self.__last = elapsed
+            self.__sent = None
+
+            return elapsed
+
+
+    def stats(
+        self,
+    ) -> dict[str, Optional[float]]:
+        """
+        Return the recent and percentiles for recorded samples.
+
+        :returns: Recent and percentiles for recorded samples.
+        """
+
+        with self.__lock:
+
+            samples = sorted(
+                self.__samples)
+
+            last = self.__last
+
+
+        def _percent(
+            percent: float,
+        ) -> Optional[float]:
+
+            if not samples:
+                return None
+
+            index = ceil(
+                percent
+                * len(samples))
+
+            return samples[
+                max(index, 1) - 1]
+
+
+        return {
+            'last': last,
+            'p50': _percent(0.50),
+            'p99': _percent(0.99)}
@@ -22,6 +22,7 @@ from encommon.types import NCNone
 from pydantic import Field
 
 if TYPE_CHECKING:
+    from .aclient import AsyncClient
     from .client import Client
 
 
@@ -66,6 +67,12 @@ class ClientEvent(BaseModel, extra='ignore'):
               description='Event number within squence',
               ge=0)]
 
+    shard: Annotated[
+        Optional[int],
+        Field(None,
+              description='Shard which received the event',
+              ge=0)]
+
     original: Annotated[
         DictStrAny,
         Field(...,
@@ -115,7 +122,7 @@ class ClientEvent(BaseModel, extra='ignore'):
     def __init__(
         self,
         /,
-        client: 'Client',
+        client: 'Client | AsyncClient',
         event: DictStrAny,
     ) -> None:
         """
@@ -145,6 +152,11 @@ class ClientEvent(BaseModel, extra='ignore'):
         if seqno is not None:
             data['seqno'] = seqno
 
+        shard = client.shard
+
+        if shard is not None:
+            data['shard'] = shard[0]
+
 
         super().__init__(**data)
 
@@ -282,7 +294,7 @@ class ClientEvent(BaseModel, extra='ignore'):
 
     def __set_isme(
         self,
-        client: 'Client',
+        client: 'Client | AsyncClient',
     ) -> None:
         """
         Update the value for the attribute from class instance.
@@ -307,7 +319,7 @@ class ClientEvent(BaseModel, extra='ignore'):
 
     def __set_hasme(
         self,
-        client: 'Client',
+        client: 'Client | AsyncClient',
     ) -> None:
         """
         Update the value for the attribute from class instance.
@@ -350,7 +362,7 @@ class ClientEvent(BaseModel, extra='ignore'):
 
     def __set_whome(
         self,
-        client: 'Client',
+        client: 'Client | AsyncClient',
     ) -> None:
         """
         Update the value for the attribute from class instance.
@@ -0,0 +1,199 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from collections import deque
+from heapq import heappop
+from heapq import heappush
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+
+
+_QUEUED = tuple[int, int, DictStrAny]
+
+
+
+PRIORITY = {
+    1: 0,
+    2: 0,
+    6: 0}
+
+COALESCE = [3]
+
+
+
+class ClientOutbox:
+    """
+    Queue the commands sent to gateway within allowed limits.
+
+    .. note::
+       Commands with priority, like heartbeats and identifies,
+       are sent ahead of the others and can use the headroom,
+       which remains unavailable for the other commands.
+
+    :param limit: Maximum commands sent within each period.
+    :param period: Seconds over which the limit is enforced.
+    :param headroom: Commands reserved for those prioritized.
+    :param coalesce: Replace presence updates already queued.
+    """
+
+    __limit: int
+    __period: float
+    __headroom: int
+    __coalesce: bool
+
+    __queue: list[_QUEUED]
+    __count: int
+    __sent: deque[float]
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        limit: int = 120,
+        period: float = 60,
+        headroom: int = 5,
+        coalesce: bool = False,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert limit > headroom >= 0
+        assert period > 0
+
+        self.__limit = limit
+        self.__period = float(period)
+        self.__headroom = headroom
+        self.__coalesce = coalesce
+
+        self.__queue = []
+        self.__count = 0
+        self.__sent = deque()
+        self.__lock = Lock()
+
+
+    @property
+    def size(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return len(self.__queue)
+
+
+    def put(
+        self,
+        send: DictStrAny,
+        priority: Optional[int] = None,
+    ) -> None:
+        """
+        Queue the command which will be sent through the socket.
+
+        :param send: Content which will be sent through socket.
+        :param priority: Optional override for command priority.
+            Commands with lower number are sent before others.
+        """
+
+        queue = self.__queue
+
+        opcode = send.get('op')
+
+        if priority is None:
+            priority = (
+                PRIORITY.get(opcode, 1)
+                if isinstance(opcode, int)
+                else 1)
+
+        with self.__lock:
+
+            if (self.__coalesce
+                    and opcode in COALESCE):
+
+                for index, item in enumerate(queue):
+
+                    if item[2].get('op') != opcode:
+                        continue
+
+                    queue[index] = (
+                        item[0], item[1], send)
+
+                    return None
+
+            self.__count += 1
+
+            heappush(
+                queue,
+                (priority,
+                 self.__count,
+                 send))
+
+
+    def pop(
+        self,
+    ) -> tuple[Optional[DictStrAny], float]:
+        """
+        Return the next command when permitted or seconds to wait.
+
+        :returns: Next command when permitted or seconds to wait.
+        """
+
+        queue = self.__queue
+        sent = self.__sent
+        period = self.__period
+
+        with self.__lock:
+
+            current = monotonic()
+
+            while (sent and sent[0]
+                   <= current - period):
+                sent.popleft()
+
+            if not queue:
+                return (None, 0.0)
+
+            allowed = self.__limit
+
+            if queue[0][0] >= 1:
+                allowed -= self.__headroom
+
+            if len(sent) >= allowed:
+
+                oldest = sent[
+                    len(sent) - allowed]
+
+                return (
+                    None,
+                    oldest + period
+                    - current)
+
+            sent.append(current)
+
+            return (
+                heappop(queue)[2],
+                0.0)
+
+
+    def reset(
+        self,
+    ) -> None:
+        """
+        Forget the commands sent when new connection is created.
+        """
+
+        with self.__lock:
+            self.__sent.clear()
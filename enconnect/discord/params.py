@@ -11,14 +11,15 @@ from typing import Annotated
 from typing import Any
 from typing import Optional
 
-from encommon.types import BaseModel
 from encommon.types import NCNone
 
 from pydantic import Field
 
+from ..utils import HTTPParams
 
 
-class ClientParams(BaseModel, extra='forbid'):
+
+class ClientParams(HTTPParams, extra='forbid'):
     """
     Process and validate the class configuration parameters.
     """
@@ -35,23 +36,28 @@ class ClientParams(BaseModel, extra='forbid'):
               description='Parameter for the integration',
               min_length=1)]
 
-    timeout: Annotated[
-        int,
-        Field(30,
-              description='Timeout connecting to server',
-              ge=1, le=300)]
-
-    ssl_verify: Annotated[
+    compress: Annotated[
         bool,
-        Field(True,
-              description='Verify the ceritifcate valid')]
+        Field(False,
+              description='Compress gateway using zlib-stream')]
+
+    cache_members: Annotated[
+        int,
+        Field(10000,
+              description='Maximum members kept in the cache',
+              ge=0, le=1000000)]
 
-    ssl_capem: Annotated[
+    session_file: Annotated[
         Optional[str],
         Field(None,
-              description='Verify the ceritifcate valid',
+              description='Path where session state is kept',
               min_length=1)]
 
+    send_coalesce: Annotated[
+        bool,
+        Field(False,
+              description='Replace presence updates queued')]
+
     queue_size: Annotated[
         int,
         Field(10000,
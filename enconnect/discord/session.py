@@ -0,0 +1,154 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from abc import ABC
+from abc import abstractmethod
+from json import dumps
+from json import loads
+from os import replace
+from pathlib import Path
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+
+
+class ClientStore(ABC):
+    """
+    Persist the session state so connection can be resumed.
+
+    .. note::
+       Implementations only need to override the methods below,
+       with state including session, sequence, and resume path.
+    """
+
+    @abstractmethod
+    def load(
+        self,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the session state previously saved to the store.
+
+        :returns: Session state previously saved to the store.
+        """
+
+
+    @abstractmethod
+    def save(
+        self,
+        state: DictStrAny,
+    ) -> None:
+        """
+        Store the session state replacing what was previously.
+
+        :param state: Session state including the identifiers.
+        """
+
+
+    @abstractmethod
+    def clear(
+        self,
+    ) -> None:
+        """
+        Remove the session state previously saved to the store.
+        """
+
+
+
+class ClientFileStore(ClientStore):
+    """
+    Persist the session state within file on local filesystem.
+
+    :param path: Complete path to file where state is stored.
+    """
+
+    __path: Path
+
+
+    def __init__(
+        self,
+        path: str | Path,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__path = Path(path)
+
+
+    @property
+    def path(
+        self,
+    ) -> Path:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__path
+
+
+    def load(
+        self,
+    ) -> Optional[DictStrAny]:
+        """
+        Return the session state previously saved to the store.
+
+        :returns: Session state previously saved to the store.
+        """
+
+        path = self.__path
+
+        try:
+
+            state = loads(
+                path.read_text(
+                    encoding='utf-8'))
+
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(state, dict):
+            return None
+
+        return state
+
+
+    def save(
+        self,
+        state: DictStrAny,
+    ) -> None:
+        """
+        Store the session state replacing what was previously.
+
+        :param state: Session state including the identifiers.
+        """
+
+        path = self.__path
+
+        temp = path.with_name(
+            f'.{path.name}.tmp')
+
+        temp.write_text(
+            dumps(state),
+            encoding='utf-8')
+
+        replace(temp, path)
+
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Remove the session state previously saved to the store.
+        """
+
+        (self.__path
+         .unlink(missing_ok=True))
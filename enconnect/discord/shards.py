@@ -0,0 +1,347 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from queue import Queue
+from threading import Lock
+from threading import Thread
+from time import sleep as block_sleep
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from encommon.types import DictStrAny
+from encommon.types import getate
+
+from .buckets import ClientBuckets
+from .cache import ClientCache
+from .client import Client
+from .models import ClientEvent
+from ..utils import dumlog
+from ..utils.limiter import HTTPBucket
+
+if TYPE_CHECKING:
+    from .params import ClientParams
+
+
+
+IDENTIFY = 5.0
+
+
+
+class ClientShards:
+    """
+    Establish and maintain the connections for multiple shards.
+
+    .. note::
+       Shards are identified in buckets using the concurrency
+       returned by the server, with one identify per interval.
+
+    :param params: Parameters used to instantiate the class.
+    :param logger: Callback for logging the related events.
+    """
+
+    __params: 'ClientParams'
+    __logger: Callable[..., None]
+
+    __mqueue: Queue[ClientEvent]
+    __buckets: ClientBuckets
+    __cache: ClientCache
+    __starts: dict[int, HTTPBucket]
+    __lock: Lock
+
+    __client: Client
+    __clients: list[Client]
+    __threads: list[Thread]
+
+    __path: Optional[str]
+    __concur: int
+
+
+    def __init__(
+        self,
+        params: 'ClientParams',
+        logger: Optional[Callable[..., None]] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__params = params
+        self.__logger = (
+            logger or dumlog)
+
+        self.__mqueue = Queue(
+            params.queue_size)
+
+        self.__buckets = ClientBuckets()
+        self.__cache = ClientCache(
+            params.cache_members)
+        self.__starts = {}
+        self.__lock = Lock()
+
+        self.__client = Client(
+            params, self.__logger,
+            shards=self)
+
+        self.__clients = []
+        self.__threads = []
+
+        self.__path = None
+        self.__concur = 1
+
+
+    @property
+    def params(
+        self,
+    ) -> 'ClientParams':
+        """
+        Return the Pydantic model containing the configuration.
+
+        :returns: Pydantic model containing the configuration.
+        """
+
+        return self.__params
+
+
+    @property
+    def clients(
+        self,
+    ) -> list[Client]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return list(self.__clients)
+
+
+    @property
+    def path(
+        self,
+    ) -> Optional[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__path
+
+
+    @property
+    def concurrency(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__concur
+
+
+    @property
+    def buckets(
+        self,
+    ) -> ClientBuckets:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__buckets
+
+
+    @property
+    def cache(
+        self,
+    ) -> ClientCache:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__cache
+
+
+    @property
+    def mqueue(
+        self,
+    ) -> Queue[ClientEvent]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__mqueue
+
+
+    def gateway(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the recommendations for sharding from the server.
+
+        :returns: Recommendations for sharding from the server.
+        """
+
+        request = (
+            self.__client
+            .request)
+
+        response = request(
+            'get', 'gateway/bot')
+
+        (response
+         .raise_for_status())
+
+        fetch = response.json()
+
+        assert isinstance(fetch, dict)
+
+        return fetch
+
+
+    def operate(
+        self,
+        *,
+        intents: int = 4609,
+        count: Optional[int] = None,
+    ) -> None:
+        """
+        Operate the shards and populate queue with the messages.
+
+        :param intents: Determine what content will be received.
+        :param count: Optionally override the recommended count.
+        """
+
+        logger = self.__logger
+
+        fetch = self.gateway()
+
+        concur = getate(
+            fetch,
+            ('session_start_limit'
+             '/max_concurrency'),
+            1)
+
+        count = (
+            count
+            or fetch.get('shards', 1))
+
+        assert count is not None
+
+        self.__path = fetch['url']
+        self.__concur = concur
+
+        logger(
+            item='shards',
+            count=count,
+            concurrency=concur)
+
+
+        clients = [
+            Client(
+                self.__params,
+                self.__logger,
+                shard=(index, count),
+                shards=self)
+            for index in
+            range(count)]
+
+        threads = [
+            Thread(
+                target=self.__operate,
+                args=(client, intents))
+            for client in clients]
+
+        self.__clients = clients
+        self.__threads = threads
+
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+
+    def __operate(
+        self,
+        client: Client,
+        intents: int,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+
+        :param client: Class instance for connecting to service.
+        :param intents: Determine what content will be received.
+        """
+
+        logger = self.__logger
+
+        try:
+            client.operate(
+                intents=intents)
+
+        except ConnectionError:
+
+            logger(
+                item='shard',
+                status='closed',
+                shard=client.shard)
+
+
+    def identify(
+        self,
+        shard: int,
+    ) -> float:
+        """
+        Block until the shard is permitted to identify upstream.
+
+        :param shard: Unique identifier for the shard to start.
+        :returns: Seconds that were waited before identifying.
+        """
+
+        starts = self.__starts
+        concur = self.__concur
+
+        bucket = shard % concur
+
+        with self.__lock:
+
+            if bucket not in starts:
+                starts[bucket] = (
+                    HTTPBucket(
+                        1 / IDENTIFY, 1))
+
+            wait = (
+                starts[bucket]
+                .reserve())
+
+        if wait > 0:
+            block_sleep(wait)
+
+        return wait
+
+
+    def stop(
+        self,
+    ) -> None:
+        """
+        Gracefully close the connection with the server sockets.
+        """
+
+        for client in self.__clients:
+            client.stop()
@@ -10,6 +10,7 @@ is permitted, for more information consult the project license file.
 from .helpers import DSCClientSocket
 from .helpers import EVENTS
 from .helpers import RVENTS
+from .helpers import client_dscasock
 from .helpers import client_dscsock
 
 
@@ -17,5 +18,6 @@ from .helpers import client_dscsock
 __all__ = [
     'DSCClientSocket',
     'client_dscsock',
+    'client_dscasock',
     'EVENTS',
     'RVENTS']
@@ -14,6 +14,7 @@ from typing import Iterator
 from typing import Optional
 from typing import Protocol
 from typing import overload
+from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 
@@ -79,7 +80,7 @@ RVENTS: LDictStrAny = [
      's': 1,
      'op': 0,
      'd': {
-         'heartbeat_interval': 100,
+         'heartbeat_interval': 1000,
          'resume_gateway_url': (
              'wss://resume.dsc.gg'),
          'session_id': 'mocked',
@@ -93,7 +94,7 @@ RVENTS: LDictStrAny = [
      's': None,
      'op': 10,
      'd': {
-         'heartbeat_interval': 100,
+         'heartbeat_interval': 1000,
          '_trace': ['["g....0}]']}},
 
     {'t': 'RESUMED',
@@ -237,3 +238,83 @@ def client_dscsock(  # noqa: CFQ004
 
 
     return _fixture
+
+
+
+@fixture
+def client_dscasock(
+    mocker: MockerFixture,
+    respx_mock: MockRouter,
+) -> DSCClientSocket:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :param mocker: Object for mocking the Python routines.
+    :param respx_mock: Object for mocking request operation.
+    :returns: Newly constructed instance of related class.
+    """
+
+    content = dumps({
+        'url': 'mocked'})
+
+    (respx_mock
+     .get(
+         'https://discord.com'
+         '/api/v10/gateway')
+     .mock(Response(
+         status_code=200,
+         content=content)))
+
+
+    socmod = mocker.patch(
+        ('enconnect.discord'
+         '.aclient.connect'),
+        new_callable=AsyncMock)
+
+
+    def _delayed(
+        events: list[str],
+    ) -> Iterator[str]:
+
+        while True:
+
+            yield from events
+
+            yield dumps({'op': 9})
+
+
+    def _factory(
+        rvents: LDictStrAny,
+    ) -> MagicMock:
+
+        effect = _delayed([
+            dumps(x) for x
+            in rvents])
+
+        socket = MagicMock()
+
+        socket.send = AsyncMock()
+
+        socket.recv = AsyncMock(
+            side_effect=effect)
+
+        socket.close = AsyncMock()
+
+        return socket
+
+
+    def _fixture(
+        rvents: _EVENTS = None,
+    ) -> _SOCKET:
+
+        rvents = rvents or []
+
+        socket = _factory(
+            RVENTS + rvents)
+
+        socmod.return_value = socket
+
+        return (socmod, socket)
+
+
+    return _fixture
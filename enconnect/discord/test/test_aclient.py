@@ -0,0 +1,340 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+
+from websockets.exceptions import ConnectionClosedOK
+
+from ..aclient import AsyncClient
+from ..outbox import ClientOutbox
+from ..params import ClientParams
+from ...fixtures import DSCClientSocket
+
+
+
+@fixture
+def client() -> AsyncClient:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    return AsyncClient(params)
+
+
+
+def test_AsyncClient(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+
+    attrs = lattrs(client)
+
+    assert attrs == [
+        '_AsyncClient__params',
+        '_AsyncClient__logger',
+        '_AsyncClient__client',
+        '_AsyncClient__buckets',
+        '_AsyncClient__cache',
+        '_AsyncClient__socket',
+        '_AsyncClient__conned',
+        '_AsyncClient__exited',
+        '_AsyncClient__mynick',
+        '_AsyncClient__lsnick',
+        '_AsyncClient__resume',
+        '_AsyncClient__ping',
+        '_AsyncClient__path',
+        '_AsyncClient__sesid',
+        '_AsyncClient__seqno',
+        '_AsyncClient__inflate',
+        '_AsyncClient__latency',
+        '_AsyncClient__store',
+        '_AsyncClient__restored',
+        '_AsyncClient__outbox',
+        '_AsyncClient__flusher',
+        '_AsyncClient__shard',
+        '_AsyncClient__mqueue',
+        '_AsyncClient__cancel']
+
+
+    assert inrepr(
+        'aclient.AsyncClient object',
+        client)
+
+    assert isinstance(
+        hash(client), int)
+
+    assert instr(
+        'aclient.AsyncClient object',
+        client)
+
+
+    assert client.params
+
+    assert not client.connected
+
+    assert not client.nickname
+
+    assert client.mqueue.qsize() == 0
+
+    assert not client.canceled
+
+
+
+@mark.asyncio
+async def test_AsyncClient_connect(
+    client: AsyncClient,
+    client_dscasock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    :param client_dscasock: Object to mock client connection.
+    """
+
+    _, socket = client_dscasock()
+
+
+    with raises(ConnectionError):
+        await client.operate()
+
+    assert not client.canceled
+    assert not client.connected
+
+    mqueue = client.mqueue
+
+    assert mqueue.qsize() == 5
+
+
+    events = client.events()
+
+    event = await anext(events)
+
+    assert event.type == 'READY'
+
+    assert client.nickname == (
+        'dscbot', 'dscunq')
+
+
+    sent = [
+        x.args[0] for x in
+        socket.send.call_args_list]
+
+    assert '"op": 2' in sent[0]
+    assert '"op": 6' in sent[1]
+
+
+
+@mark.asyncio
+async def test_AsyncClient_cancel(
+    client: AsyncClient,
+    client_dscasock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    :param client_dscasock: Object to mock client connection.
+    """
+
+    _, socket = client_dscasock()
+
+    closed = asyncio.Event()
+
+    events = iter([
+        ('{"op": 10, "d": '
+         '{"heartbeat_interval": 50}}')])
+
+
+    async def _recv() -> str:
+
+        await asyncio.sleep(0)
+
+        event = next(events, None)
+
+        if event is not None:
+            return event
+
+        await closed.wait()
+
+        raise ConnectionClosedOK(
+            None, None)
+
+
+    async def _close(
+        code: int,
+    ) -> None:
+
+        await asyncio.sleep(0)
+
+        closed.set()
+
+
+    socket.recv.side_effect = _recv
+    socket.close.side_effect = _close
+
+
+    task = asyncio.create_task(
+        client.operate())
+
+    while socket.send.call_count < 2:
+        await asyncio.sleep(0.01)
+
+    client.stop()
+
+    await asyncio.wait_for(task, 5)
+
+
+    socket.close.assert_any_call(1000)
+
+    assert not client.canceled
+    assert not client.connected
+
+
+    sent = [
+        x.args[0] for x in
+        socket.send.call_args_list]
+
+    assert '"op": 2' in sent[0]
+    assert '"op": 1' in sent[1]
+
+
+
+@mark.asyncio
+async def test_AsyncClient_zombie(
+    client: AsyncClient,
+    client_dscasock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    :param client_dscasock: Object to mock client connection.
+    """
+
+    _, socket = client_dscasock()
+
+    closed = asyncio.Event()
+
+    events = iter([
+        ('{"op": 10, "d": '
+         '{"heartbeat_interval": 20}}')])
+
+
+    async def _recv() -> str:
+
+        await asyncio.sleep(0)
+
+        event = next(events, None)
+
+        if event is not None:
+            return event
+
+        await closed.wait()
+
+        raise ConnectionClosedOK(
+            None, None)
+
+
+    async def _close(
+        code: int,
+    ) -> None:
+
+        await asyncio.sleep(0)
+
+        closed.set()
+
+
+    socket.recv.side_effect = _recv
+    socket.close.side_effect = _close
+
+
+    task = asyncio.create_task(
+        client.operate())
+
+    while not closed.is_set():
+        await asyncio.sleep(0.01)
+
+    client.stop()
+
+    await asyncio.wait_for(task, 5)
+
+
+    socket.close.assert_any_call(4000)
+
+    assert client.latency.missed
+
+
+
+@mark.asyncio
+async def test_AsyncClient_outbox(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+    socket = AsyncMock()
+
+    client._AsyncClient__socket = socket  # type: ignore
+
+    outbox = ClientOutbox(
+        limit=2, period=0.2,
+        headroom=0)
+
+    client._AsyncClient__outbox = outbox  # type: ignore
+
+
+    for index in range(3):
+        await client.socket_send({
+            'op': 8, 'd': index})
+
+    assert socket.send.call_count == 2
+
+    assert outbox.size == 1
+
+
+    for _ in range(100):
+
+        if socket.send.call_count >= 3:
+            break
+
+        await asyncio.sleep(0.05)
+
+    assert socket.send.call_count == 3
+
+    assert outbox.size == 0
+
+    sent = (
+        socket.send
+        .call_args_list[-1]
+        .args[0])
+
+    assert '"d": 2' in sent
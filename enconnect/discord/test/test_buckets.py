@@ -0,0 +1,266 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from time import sleep as block_sleep
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Response
+
+from pytest_mock import MockerFixture
+
+from respx import MockRouter
+
+from ..buckets import ClientBuckets
+from ..buckets import routed
+from ..client import Client
+from ..params import ClientParams
+
+
+
+PATH = 'channels/123/messages'
+
+
+
+def test_ClientBuckets() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    buckets = ClientBuckets()
+
+
+    attrs = lattrs(buckets)
+
+    assert attrs == [
+        '_ClientBuckets__routes',
+        '_ClientBuckets__buckets',
+        '_ClientBuckets__global',
+        '_ClientBuckets__lock']
+
+
+    assert inrepr(
+        'buckets.ClientBuckets object',
+        buckets)
+
+    assert isinstance(
+        hash(buckets), int)
+
+    assert instr(
+        'buckets.ClientBuckets object',
+        buckets)
+
+
+    assert buckets.stats() == {}
+
+    assert buckets.keyed(
+        'post', PATH) == (
+            'POST channels/{major}'
+            '/messages:channels/123')
+
+
+
+def test_ClientBuckets_reserve() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    buckets = ClientBuckets()
+
+    reserve = buckets.reserve
+    update = buckets.update
+
+
+    assert reserve('post', PATH) == 0
+
+    update(
+        'post', PATH,
+        Response(
+            status_code=200,
+            headers={
+                'X-RateLimit-Bucket': 'abcd',
+                'X-RateLimit-Remaining': '1',
+                'X-RateLimit-Reset-After': '2'}))
+
+    assert buckets.keyed(
+        'post', PATH) == (
+            'abcd:channels/123')
+
+    assert reserve('post', PATH) == 0
+
+    wait = reserve('post', PATH)
+
+    assert 1.9 <= wait <= 2
+
+
+    assert reserve(
+        'post',
+        'channels/456/messages') == 0
+
+
+    stats = buckets.stats()
+
+    assert stats[
+        'abcd:channels/123'][
+            'remaining'] == 0
+
+
+    update(
+        'post', PATH,
+        Response(
+            status_code=429,
+            headers={
+                'Retry-After': '3',
+                'X-RateLimit-Global': 'true'}))
+
+    wait = reserve(
+        'get', 'gateway')
+
+    assert 2.9 <= wait <= 3
+
+
+
+def test_ClientBuckets_reset() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    buckets = ClientBuckets()
+
+    reserve = buckets.reserve
+
+    buckets.update(
+        'post', PATH,
+        Response(
+            status_code=200,
+            headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset-After': '0'}))
+
+    assert reserve('post', PATH) == 0
+
+    assert reserve('post', PATH) > 0
+    assert reserve('post', PATH) > 0
+
+
+    buckets.update(
+        'post', PATH,
+        Response(
+            status_code=200,
+            headers={
+                'X-RateLimit-Remaining': '1',
+                'X-RateLimit-Reset-After': '2'}))
+
+    assert reserve('post', PATH) == 0
+
+    wait = reserve('post', PATH)
+
+    assert 1.9 <= wait <= 2
+
+
+    buckets.update(
+        'post', PATH,
+        Response(
+            status_code=200,
+            headers={
+                'X-RateLimit-Remaining': '0',
+                'X-RateLimit-Reset-After': '0'}))
+
+    assert reserve('post', PATH) == 0
+
+    buckets.update(
+        'post', PATH,
+        Response(status_code=500))
+
+    assert reserve('post', PATH) == 0
+
+
+
+def test_routed() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    assert routed(
+        'put',
+        ('channels/123/messages'
+         '/456/reactions/%F0/@me')) == (
+             'PUT channels/{major}'
+             '/messages/{id}/reactions'
+             '/{emoji}/@me',
+             'channels/123')
+
+    assert routed(
+        'post',
+        ('interactions/123'
+         '/mocked/callback')) == (
+             'POST interactions/{id}'
+             '/{token}/callback',
+             '')
+
+    assert routed(
+        'patch',
+        ('webhooks/123/mocked'
+         '/messages/@original')) == (
+             'PATCH webhooks/{major}'
+             '/{major}/messages/@original',
+             'webhooks/123/mocked')
+
+
+
+def test_Client_buckets(
+    mocker: MockerFixture,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param mocker: Object for mocking the Python routines.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    client = Client(params)
+
+    headers = {
+        'X-RateLimit-Bucket': 'abcd',
+        'X-RateLimit-Remaining': '0',
+        'X-RateLimit-Reset-After': '0.2'}
+
+    (respx_mock
+     .post(
+         'https://discord.com'
+         f'/api/v10/{PATH}')
+     .mock(Response(
+         status_code=200,
+         headers=headers)))
+
+    sleeper = mocker.patch(
+        ('enconnect.discord'
+         '.client.block_sleep'),
+        side_effect=block_sleep)
+
+
+    client.request('post', PATH)
+
+    sleeper.assert_not_called()
+
+    client.request('post', PATH)
+
+    sleeper.assert_called_once()
+
+    wait = (
+        sleeper.call_args
+        .args[0])
+
+    assert 0.1 <= wait <= 0.2
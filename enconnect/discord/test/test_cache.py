@@ -0,0 +1,327 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from json import dumps
+
+from encommon.types import DictStrAny
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Response
+
+from respx import MockRouter
+
+from ..cache import ClientCache
+from ..client import Client
+from ..params import ClientParams
+
+
+
+def _member(
+    unique: str,
+) -> DictStrAny:
+    """
+    Return the member payload using the provided identifier.
+
+    :param unique: Unique identifier for the member in guild.
+    :returns: Member payload using the provided identifier.
+    """
+
+    return {
+        'nick': None,
+        'user': {
+            'id': unique,
+            'username': unique}}
+
+
+
+GUILD: DictStrAny = {
+    't': 'GUILD_CREATE',
+    'op': 0,
+    'd': {
+        'id': 'guldid',
+        'name': 'Guild',
+        'channels': [
+            {'id': 'chanid',
+             'name': 'general'}],
+        'threads': [
+            {'id': 'thrdid',
+             'name': 'thread'}],
+        'members': [
+            _member('userid'),
+            _member('dscunq')]}}
+
+
+
+def test_ClientCache() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = ClientCache(3)
+
+
+    attrs = lattrs(cache)
+
+    assert attrs == [
+        '_ClientCache__guilds',
+        '_ClientCache__channels',
+        '_ClientCache__members',
+        '_ClientCache__maximum',
+        '_ClientCache__lock']
+
+
+    assert inrepr(
+        'cache.ClientCache object',
+        cache)
+
+    assert isinstance(
+        hash(cache), int)
+
+    assert instr(
+        'cache.ClientCache object',
+        cache)
+
+
+    assert cache.maximum == 3
+
+    assert cache.stats() == {
+        'guilds': 0,
+        'channels': 0,
+        'members': 0}
+
+
+
+def test_ClientCache_ingest() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = ClientCache(3)
+
+    ingest = cache.ingest
+
+
+    ingest({'op': 11})
+
+    ingest(GUILD)
+
+    guild = cache.guild('guldid')
+
+    assert guild == {
+        'id': 'guldid',
+        'name': 'Guild'}
+
+    channel = cache.channel('thrdid')
+
+    assert channel is not None
+    assert channel['guild_id'] == 'guldid'
+
+    assert cache.member(
+        'guldid', 'userid')
+
+
+    ingest({
+        't': 'GUILD_UPDATE',
+        'd': {
+            'id': 'guldid',
+            'name': 'Renamed'}})
+
+    guild = cache.guild('guldid')
+
+    assert guild is not None
+    assert guild['name'] == 'Renamed'
+
+
+    ingest({
+        't': 'CHANNEL_UPDATE',
+        'd': {
+            'id': 'chanid',
+            'guild_id': 'guldid',
+            'name': 'renamed'}})
+
+    channel = cache.channel('chanid')
+
+    assert channel is not None
+    assert channel['name'] == 'renamed'
+
+    ingest({
+        't': 'THREAD_DELETE',
+        'd': {'id': 'thrdid'}})
+
+    assert not cache.channel('thrdid')
+
+
+    ingest({
+        't': 'GUILD_MEMBERS_CHUNK',
+        'd': {
+            'guild_id': 'guldid',
+            'members': [
+                _member('first'),
+                _member('second')]}})
+
+    assert not cache.member(
+        'guldid', 'dscunq')
+
+    assert cache.member(
+        'guldid', 'first')
+
+    ingest({
+        't': 'GUILD_MEMBER_ADD',
+        'd': {
+            'guild_id': 'guldid',
+            **_member('third')}})
+
+    assert not cache.member(
+        'guldid', 'userid')
+
+    ingest({
+        't': 'GUILD_MEMBER_REMOVE',
+        'd': {
+            'guild_id': 'guldid',
+            'user': {'id': 'third'}}})
+
+    assert cache.stats() == {
+        'guilds': 1,
+        'channels': 1,
+        'members': 2}
+
+
+    ingest({
+        't': 'GUILD_DELETE',
+        'd': {'id': 'guldid'}})
+
+    assert cache.stats() == {
+        'guilds': 0,
+        'channels': 0,
+        'members': 0}
+
+
+
+def test_ClientCache_unavailable() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = ClientCache(3)
+
+    ingest = cache.ingest
+
+    ingest(GUILD)
+
+
+    ingest({
+        't': 'GUILD_DELETE',
+        'd': {
+            'id': 'guldid',
+            'unavailable': True}})
+
+    assert cache.stats() == {
+        'guilds': 1,
+        'channels': 2,
+        'members': 2}
+
+    guild = cache.guild('guldid')
+
+    assert guild is not None
+    assert guild['unavailable'] is True
+
+
+    ingest(GUILD)
+
+    guild = cache.guild('guldid')
+
+    assert guild is not None
+    assert 'unavailable' not in guild
+
+
+    ingest({
+        't': 'GUILD_DELETE',
+        'd': {'id': 'guldid'}})
+
+    assert cache.stats() == {
+        'guilds': 0,
+        'channels': 0,
+        'members': 0}
+
+
+
+def test_ClientCache_disable() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = ClientCache(0)
+
+    cache.ingest(GUILD)
+
+    cache.ingest({
+        't': 'GUILD_MEMBER_ADD',
+        'd': {
+            'guild_id': 'guldid',
+            'user': {}}})
+
+    assert cache.stats() == {
+        'guilds': 1,
+        'channels': 2,
+        'members': 0}
+
+
+
+def test_Client_cache(
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    client = Client(params)
+
+    client.cache.ingest(GUILD)
+
+    content = dumps({
+        'id': 'chanid',
+        'name': 'fetched'})
+
+    route = (
+        respx_mock
+        .get(
+            'https://discord.com'
+            '/api/v10/channels/chanid')
+        .mock(Response(
+            status_code=200,
+            content=content)))
+
+
+    channel = client.get_channel('chanid')
+
+    assert channel['name'] == 'general'
+
+    assert not route.called
+
+
+    channel = client.get_channel(
+        'chanid', refresh=True)
+
+    assert channel['name'] == 'fetched'
+
+    assert route.call_count == 1
+
+    channel = client.get_channel('chanid')
+
+    assert channel['name'] == 'fetched'
+
+
+    assert client.get_guild('guldid')
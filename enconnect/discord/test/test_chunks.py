@@ -0,0 +1,205 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from json import loads
+from unittest.mock import Mock
+
+from encommon.types import DictStrAny
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from pytest import raises
+
+from ..chunks import ClientChunks
+from ..client import Client
+from ..params import ClientParams
+
+
+
+def _chunk(
+    nonce: str,
+    index: int,
+    count: int,
+) -> DictStrAny:
+    """
+    Return the chunk payload using the provided parameters.
+
+    :param nonce: Unique identifier included with the request.
+    :param index: Index of the chunk within those expected.
+    :param count: Number of the chunks that are expected.
+    :returns: Chunk payload using the provided parameters.
+    """
+
+    unique = f'user{index}'
+
+    return {
+        'guild_id': 'guldid',
+        'nonce': nonce,
+        'chunk_index': index,
+        'chunk_count': count,
+        'members': [{
+            'user': {
+                'id': unique,
+                'username': unique}}]}
+
+
+
+def test_ClientChunks() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    finish = Mock()
+
+    chunks = ClientChunks(
+        'mocked', 1, finish)
+
+
+    attrs = lattrs(chunks)
+
+    assert attrs == [
+        '_ClientChunks__nonce',
+        '_ClientChunks__timeout',
+        '_ClientChunks__finish',
+        '_ClientChunks__queue',
+        '_ClientChunks__index',
+        '_ClientChunks__count',
+        '_ClientChunks__received',
+        '_ClientChunks__missing']
+
+
+    assert inrepr(
+        'chunks.ClientChunks object',
+        chunks)
+
+    assert isinstance(
+        hash(chunks), int)
+
+    assert instr(
+        'chunks.ClientChunks object',
+        chunks)
+
+
+    assert chunks.nonce == 'mocked'
+
+    assert chunks.index is None
+
+    assert chunks.count is None
+
+    assert chunks.received == 0
+
+    assert chunks.missing == []
+
+    assert not chunks.complete
+
+
+    chunks.put(_chunk('mocked', 0, 2))
+
+    chunks.put({
+        **_chunk('mocked', 1, 2),
+        'not_found': ['absent']})
+
+    members = list(chunks)
+
+    assert len(members) == 2
+
+    assert chunks.complete
+
+    assert chunks.received == 2
+
+    assert chunks.missing == ['absent']
+
+    finish.assert_called_once_with('mocked')
+
+
+
+def test_ClientChunks_timeout() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    finish = Mock()
+
+    chunks = ClientChunks(
+        'mocked', 0.01, finish)
+
+    with raises(TimeoutError):
+        list(chunks)
+
+    finish.assert_called_once()
+
+
+
+def test_Client_request_members() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    client = Client(params)
+
+    socket = Mock()
+
+    client._Client__socket = socket  # type: ignore
+
+    event = (
+        client  # type: ignore
+        ._Client__event)
+
+
+    chunks = client.request_members(
+        'guldid', users=['user0'])
+
+    sent = loads(
+        socket.send
+        .call_args_list[0]
+        .args[0])
+
+    assert sent['op'] == 8
+
+    nonce = sent['d']['nonce']
+
+    assert nonce == chunks.nonce
+
+    assert sent['d']['user_ids'] == ['user0']
+
+
+    event({
+        't': 'GUILD_MEMBERS_CHUNK',
+        'op': 0,
+        'd': _chunk('other', 0, 1)})
+
+    event({
+        't': 'GUILD_MEMBERS_CHUNK',
+        'op': 0,
+        'd': _chunk(nonce, 0, 1)})
+
+
+    members = list(chunks)
+
+    assert members[0]['user']['id'] == 'user0'
+
+    assert client.cache.member(
+        'guldid', 'user0')
+
+    assert client.mqueue.qsize() == 2
+
+
+    chunks = client.request_members(
+        'guldid', 'user')
+
+    sent = loads(
+        socket.send
+        .call_args_list[1]
+        .args[0])
+
+    assert sent['d']['query'] == 'user'
@@ -7,17 +7,30 @@ is permitted, for more information consult the project license file.
 
 
 
+from json import dumps
+from json import loads
+from pathlib import Path
+from time import sleep as block_sleep
+from typing import Iterator
 from unittest.mock import Mock
+from zlib import Z_SYNC_FLUSH
+from zlib import compressobj
 
+from encommon.types import LDictStrAny
 from encommon.types import inrepr
 from encommon.types import instr
 from encommon.types import lattrs
 
+from httpx import Response
+
 from pytest import fixture
 from pytest import raises
 
+from respx import MockRouter
+
 from ..client import Client
 from ..params import ClientParams
+from ..test.helpers import RVENTS
 from ...fixtures import DSCClientSocket
 
 
@@ -53,6 +66,8 @@ def test_Client(
         '_Client__params',
         '_Client__logger',
         '_Client__client',
+        '_Client__buckets',
+        '_Client__cache',
         '_Client__socket',
         '_Client__conned',
         '_Client__exited',
@@ -63,6 +78,15 @@ def test_Client(
         '_Client__path',
         '_Client__sesid',
         '_Client__seqno',
+        '_Client__inflate',
+        '_Client__latency',
+        '_Client__store',
+        '_Client__restored',
+        '_Client__outbox',
+        '_Client__sender',
+        '_Client__chunks',
+        '_Client__shard',
+        '_Client__shards',
         '_Client__mqueue',
         '_Client__cancel']
 
@@ -132,3 +156,334 @@ def test_Client_connect(
     mqueue = client.mqueue
 
     assert mqueue.qsize() == 5
+
+
+
+def test_Client_compress(
+    client_dscsock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client_dscsock: Object to mock client connection.
+    """
+
+    params = ClientParams(
+        token='mocked',
+        compress=True)
+
+    client = Client(params)
+
+
+    def _deflate(
+        events: LDictStrAny,
+    ) -> Iterator[bytes]:
+
+        deflate = compressobj()
+
+        for event in events:
+
+            frame = (
+                deflate.compress(
+                    dumps(event)
+                    .encode('utf-8'))
+                + deflate.flush(Z_SYNC_FLUSH))
+
+            yield frame[:4]
+            yield frame[4:]
+
+
+    socmod, socket = (
+        client_dscsock())
+
+    socket.recv.side_effect = [
+        *_deflate(RVENTS[:2]),
+        *_deflate([
+            *RVENTS[2:],
+            {'op': 9}])]
+
+
+    with raises(ConnectionError):
+        client.operate()
+
+    path = (
+        'mocked?compress'
+        '=zlib-stream')
+
+    call = (
+        socmod  # type: ignore
+        .call_args_list)
+
+    assert call[0].args == (path,)
+
+    assert call[1].args == (
+        'wss://resume.dsc.gg'
+        '?compress=zlib-stream',)
+
+    mqueue = client.mqueue
+
+    assert mqueue.qsize() == 5
+
+
+
+def test_Client_zombie(
+    client_dscsock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client_dscsock: Object to mock client connection.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    logger = Mock()
+
+    client = Client(
+        params, logger)
+
+    hello = dumps({
+        'op': 10,
+        'd': {
+            'heartbeat_interval': 50}})
+
+    first = [hello]
+
+    events = iter([
+        hello,
+        dumps({'op': 1}),
+        dumps({'op': 11}),
+        dumps({'op': 9})])
+
+
+    def _zombied() -> bool:
+
+        return any(
+            x.kwargs.get('item') == 'zombie'
+            for x in
+            logger.call_args_list)
+
+
+    def _recv(
+        timeout: int,
+    ) -> str:
+
+        if first:
+            return first.pop()
+
+        if not _zombied():
+            block_sleep(0.01)
+            raise TimeoutError
+
+        return next(events)
+
+
+    _, socket = client_dscsock()
+
+    socket.recv.side_effect = _recv
+
+
+    with raises(ConnectionError):
+        client.operate()
+
+    assert _zombied()
+
+    assert client.latency.last is not None
+
+
+
+def test_Client_slash_sync(
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    params = ClientParams(
+        token='mocked',
+        appid='123')
+
+    client = Client(params)
+
+    path = (
+        'https://discord.com/api/v10'
+        '/applications/123/guilds'
+        '/guldid/commands')
+
+    content = dumps([
+        {'id': '1',
+         'name': 'ping',
+         'type': 1,
+         'description': 'Ping',
+         'options': [{
+             'name': 'target',
+             'type': 3,
+             'required': False}],
+         'version': '1'},
+        {'id': '2',
+         'name': 'old',
+         'type': 1,
+         'description': 'Old'}])
+
+    (respx_mock
+     .get(path)
+     .mock(Response(
+         status_code=200,
+         content=content)))
+
+    putted = (
+        respx_mock
+        .put(path)
+        .mock(Response(200)))
+
+    ping = {
+        'name': 'ping',
+        'description': 'Ping',
+        'options': [{
+            'name': 'target',
+            'type': 3}]}
+
+
+    changes = client.slash_sync(
+        [ping, {'name': 'new',
+                'description': 'New'}],
+        guild='guldid')
+
+    assert changes == {
+        'created': ['new'],
+        'updated': [],
+        'deleted': ['old'],
+        'unchanged': ['ping']}
+
+    assert putted.call_count == 1
+
+    request = putted.calls[0].request
+
+    assert len(loads(request.content)) == 2
+
+
+    changes = client.slash_sync(
+        [{**ping, 'description': 'Pong'}],
+        guild='guldid')
+
+    assert changes['updated'] == ['ping']
+
+    assert putted.call_count == 2
+
+
+    changes = client.slash_sync(
+        [], guild='guldid')
+
+    assert changes['deleted'] == [
+        'ping', 'old']
+
+    assert putted.call_count == 3
+
+    request = putted.calls[2].request
+
+    assert loads(request.content) == []
+
+
+
+def test_Client_slash_sync_unchanged(
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    params = ClientParams(
+        token='mocked',
+        appid='123')
+
+    client = Client(params)
+
+    path = (
+        'https://discord.com/api/v10'
+        '/applications/123/commands')
+
+    content = dumps([
+        {'id': '1',
+         'name': 'ping',
+         'description': 'Ping',
+         'options': [{
+             'name': 'target',
+             'type': 3}]}])
+
+    (respx_mock
+     .get(path)
+     .mock(Response(
+         status_code=200,
+         content=content)))
+
+    putted = (
+        respx_mock
+        .put(path)
+        .mock(Response(200)))
+
+
+    changes = client.slash_sync([
+        {'name': 'ping',
+         'description': 'Ping',
+         'dm_permission': True,
+         'options': [{
+             'name': 'target',
+             'type': 3,
+             'required': False}]}])
+
+    assert changes['unchanged'] == ['ping']
+
+    assert not putted.called
+
+
+
+def test_Client_message_attach(
+    tmp_path: Path,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param tmp_path: pytest object for temporal filesystem.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    params = ClientParams(
+        token='mocked',
+        appid='123')
+
+    client = Client(params)
+
+    path = tmp_path / 'bundle.txt'
+
+    path.write_bytes(b'content')
+
+    route = (
+        respx_mock
+        .post(
+            'https://discord.com/api/v10'
+            '/channels/chanid/messages')
+        .mock(Response(200)))
+
+
+    client.message_attach(
+        'chanid', [path],
+        {'content': 'Hello'})
+
+
+    request = route.calls[0].request
+
+    content = request.read()
+
+    assert 'multipart' in (
+        request.headers[
+            'content-type'])
+
+    assert b'name="files[0]"' in content
+    assert b'"filename": "bundle.txt"' in content
+    assert b'"content": "Hello"' in content
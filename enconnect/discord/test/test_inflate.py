@@ -0,0 +1,91 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from zlib import Z_SYNC_FLUSH
+from zlib import compressobj
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from ..inflate import ClientInflate
+
+
+
+def test_ClientInflate() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    inflate = ClientInflate()
+
+
+    attrs = lattrs(inflate)
+
+    assert attrs == [
+        '_ClientInflate__buffer',
+        '_ClientInflate__inflate']
+
+
+    assert inrepr(
+        'inflate.ClientInflate object',
+        inflate)
+
+    assert isinstance(
+        hash(inflate), int)
+
+    assert instr(
+        'inflate.ClientInflate object',
+        inflate)
+
+
+    location = inflate.location
+
+    assert location('wss://mocked') == (
+        'wss://mocked'
+        '?compress=zlib-stream')
+
+    assert location('wss://mocked?v=10') == (
+        'wss://mocked?v=10'
+        '&compress=zlib-stream')
+
+
+
+def test_ClientInflate_feed() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    inflate = ClientInflate()
+
+    deflate = compressobj()
+
+
+    def _deflate(
+        source: str,
+    ) -> bytes:
+
+        return (
+            deflate.compress(
+                source.encode('utf-8'))
+            + deflate.flush(Z_SYNC_FLUSH))
+
+
+    frame = _deflate('{"op": 10}')
+
+    assert inflate.feed(frame[:5]) is None
+
+    assert inflate.feed(frame[5:]) == (
+        '{"op": 10}')
+
+
+    frame = _deflate('{"op": 11}')
+
+    assert inflate.feed(frame) == (
+        '{"op": 11}')
@@ -0,0 +1,95 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from ..latency import ClientLatency
+
+
+
+def test_ClientLatency() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    latency = ClientLatency(3)
+
+
+    attrs = lattrs(latency)
+
+    assert attrs == [
+        '_ClientLatency__sent',
+        '_ClientLatency__last',
+        '_ClientLatency__samples',
+        '_ClientLatency__lock']
+
+
+    assert inrepr(
+        'latency.ClientLatency object',
+        latency)
+
+    assert isinstance(
+        hash(latency), int)
+
+    assert instr(
+        'latency.ClientLatency object',
+        latency)
+
+
+    assert latency.last is None
+
+    assert not latency.missed
+
+    assert latency.stats() == {
+        'last': None,
+        'p50': None,
+        'p99': None}
+
+
+
+def test_ClientLatency_acked() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    latency = ClientLatency(3)
+
+    assert latency.acked() is None
+
+
+    for _ in range(4):
+
+        latency.sent()
+
+        assert latency.missed
+
+        elapsed = latency.acked()
+
+        assert elapsed is not None
+
+        assert not latency.missed
+
+
+    stats = latency.stats()
+
+    assert stats['last'] == elapsed
+
+    assert stats['p50'] is not None
+    assert stats['p99'] is not None
+
+    assert stats['p50'] <= stats['p99']
+
+
+    latency.sent()
+
+    latency.reset()
+
+    assert not latency.missed
@@ -47,6 +47,7 @@ def test_ClientEvent() -> None:
         'opcode',
         'data',
         'seqno',
+        'shard',
         'original',
         'kind',
         'isme',
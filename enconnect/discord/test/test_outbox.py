@@ -0,0 +1,175 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from json import loads
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from ..client import Client
+from ..outbox import ClientOutbox
+from ..params import ClientParams
+
+
+
+def test_ClientOutbox() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox()
+
+
+    attrs = lattrs(outbox)
+
+    assert attrs == [
+        '_ClientOutbox__limit',
+        '_ClientOutbox__period',
+        '_ClientOutbox__headroom',
+        '_ClientOutbox__coalesce',
+        '_ClientOutbox__queue',
+        '_ClientOutbox__count',
+        '_ClientOutbox__sent',
+        '_ClientOutbox__lock']
+
+
+    assert inrepr(
+        'outbox.ClientOutbox object',
+        outbox)
+
+    assert isinstance(
+        hash(outbox), int)
+
+    assert instr(
+        'outbox.ClientOutbox object',
+        outbox)
+
+
+    assert outbox.size == 0
+
+    assert outbox.pop() == (None, 0)
+
+
+
+def test_ClientOutbox_pop() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox(
+        limit=3, period=10,
+        headroom=1)
+
+    put = outbox.put
+    pop = outbox.pop
+
+
+    put({'op': 8, 'd': 1})
+    put({'op': 8, 'd': 2})
+    put({'op': 8, 'd': 3})
+    put({'op': 1, 'd': 4})
+    put({'op': 8, 'd': 5}, 0)
+
+    assert outbox.size == 5
+
+
+    assert pop()[0] == {'op': 1, 'd': 4}
+    assert pop()[0] == {'op': 8, 'd': 5}
+
+    send, wait = pop()
+
+    assert send is None
+    assert 9.9 <= wait <= 10
+
+
+    put({'op': 6})
+
+    assert pop()[0] == {'op': 6}
+
+    send, wait = pop()
+
+    assert send is None
+    assert 9.9 <= wait <= 10
+
+
+    outbox.reset()
+
+    assert pop()[0] == {'op': 8, 'd': 1}
+
+    assert outbox.size == 2
+
+
+
+def test_ClientOutbox_coalesce() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox(
+        coalesce=True)
+
+    put = outbox.put
+
+
+    put({'op': 3, 'd': 'idle'})
+    put({'op': 8, 'd': 1})
+    put({'op': 3, 'd': 'online'})
+
+    assert outbox.size == 2
+
+    assert outbox.pop()[0] == {
+        'op': 3, 'd': 'online'}
+
+    assert outbox.pop()[0] == {
+        'op': 8, 'd': 1}
+
+
+
+def test_Client_outbox() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    client = Client(params)
+
+    socket = Mock()
+
+    client._Client__socket = socket  # type: ignore
+
+
+    for index in range(120):
+        client.socket_send({
+            'op': 8, 'd': index})
+
+    assert socket.send.call_count == 115
+
+    assert client.outbox.size == 5
+
+
+    client.socket_send({
+        'op': 1, 'd': None})
+
+    assert socket.send.call_count == 116
+
+    sent = loads(
+        socket.send
+        .call_args_list[-1]
+        .args[0])
+
+    assert sent['op'] == 1
+
+
+    wait = client.socket_flush()
+
+    assert 59 <= wait <= 60
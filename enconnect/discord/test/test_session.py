@@ -0,0 +1,295 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from json import dumps
+from json import loads
+from pathlib import Path
+from typing import Optional
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from pytest import raises
+
+from ..client import Client
+from ..params import ClientParams
+from ..session import ClientFileStore
+from ..session import ClientStore
+from ...fixtures import DSCClientSocket
+
+
+
+STATE = {
+    'session_id': 'mocked',
+    'sequence': 42,
+    'resume_url': 'wss://resume.dsc.gg'}
+
+HELLO = dumps({
+    'op': 10,
+    'd': {
+        'heartbeat_interval': 1000}})
+
+
+
+def test_ClientFileStore(
+    tmp_path: Path,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param tmp_path: pytest object for temporal filesystem.
+    """
+
+    path = tmp_path / 'session'
+
+    store = ClientFileStore(path)
+
+
+    attrs = lattrs(store)
+
+    assert attrs == [
+        '_ClientFileStore__path']
+
+
+    assert inrepr(
+        'session.ClientFileStore object',
+        store)
+
+    assert isinstance(
+        hash(store), int)
+
+    assert instr(
+        'session.ClientFileStore object',
+        store)
+
+
+    assert store.path == path
+
+    assert store.load() is None
+
+
+    store.save(STATE)
+
+    assert store.load() == STATE
+
+    assert loads(
+        path.read_text()) == STATE
+
+
+    path.write_text('[]')
+
+    assert store.load() is None
+
+    path.write_text('invalid')
+
+    assert store.load() is None
+
+
+    store.clear()
+
+    assert not path.exists()
+
+    store.clear()
+
+
+
+def test_ClientStore() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    with raises(TypeError):
+        ClientStore()  # type: ignore
+
+
+
+def test_Client_resume(
+    client_dscsock: DSCClientSocket,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client_dscsock: Object to mock client connection.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    store = Mock()
+
+    store.load.return_value = STATE
+
+    client = Client(
+        params, store=store)
+
+
+    socmod, socket = (
+        client_dscsock())
+
+    socket.recv.side_effect = [
+        HELLO,
+        dumps({
+            't': 'RESUMED',
+            's': 43,
+            'op': 0,
+            'd': {}}),
+        dumps({'op': 9})]
+
+
+    with raises(ConnectionError):
+        client.operate()
+
+
+    call = (
+        socmod  # type: ignore
+        .call_args_list)
+
+    assert call[0].args == (
+        'wss://resume.dsc.gg',)
+
+    sent = loads(
+        socket.send
+        .call_args_list[0]
+        .args[0])
+
+    assert sent['op'] == 6
+
+    assert sent['d']['seq'] == 42
+
+    store.clear.assert_called_once()
+
+    socket.close.assert_called_with(4000)
+
+
+
+def test_Client_resume_invalid(
+    client_dscsock: DSCClientSocket,
+    tmp_path: Path,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client_dscsock: Object to mock client connection.
+    :param tmp_path: pytest object for temporal filesystem.
+    """
+
+    path = tmp_path / 'session'
+
+    params = ClientParams(
+        token='mocked',
+        session_file=str(path))
+
+    store = ClientFileStore(
+        f'{path}.0')
+
+    store.save(STATE)
+
+    client = Client(
+        params, shard=(0, 1))
+
+
+    ready = dumps({
+        't': 'READY',
+        's': 1,
+        'op': 0,
+        'd': {
+            'resume_gateway_url': (
+                'wss://other.dsc.gg'),
+            'session_id': 'other',
+            'user': {
+                'username': 'dscbot',
+                'id': 'dscunq'}}})
+
+    events = iter([
+        HELLO,
+        dumps({'op': 9}),
+        HELLO,
+        ready,
+        None])
+
+
+    def _recv(
+        timeout: int,
+    ) -> Optional[str]:
+
+        event = next(events)
+
+        if event is not None:
+            return event
+
+        assert store.load() == {
+            'session_id': 'other',
+            'sequence': 1,
+            'resume_url': (
+                'wss://other.dsc.gg')}
+
+        return dumps({'op': 9})
+
+
+    socmod, socket = (
+        client_dscsock())
+
+    socket.recv.side_effect = _recv
+
+
+    with raises(ConnectionError):
+        client.operate()
+
+
+    call = (
+        socmod  # type: ignore
+        .call_args_list)
+
+    assert call[0].args == (
+        'wss://resume.dsc.gg',)
+
+    assert call[1].args == (
+        'mocked',)
+
+    sent = [
+        loads(x.args[0])['op']
+        for x in
+        socket.send.call_args_list]
+
+    assert sent[:2] == [6, 2]
+
+    assert store.load() is None
+
+
+
+def test_Client_persist() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    store = Mock()
+
+    client = Client(
+        params, store=store)
+
+    client._Client__socket = Mock()  # type: ignore
+    client._Client__sesid = 'mocked'  # type: ignore
+
+
+    client._Client__beat()  # type: ignore
+
+    store.save.assert_not_called()
+
+
+    client._Client__persist()  # type: ignore
+
+    store.save.assert_called_once_with({
+        'session_id': 'mocked',
+        'sequence': None,
+        'resume_url': None})
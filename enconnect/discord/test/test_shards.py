@@ -0,0 +1,195 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from json import dumps
+from json import loads
+from unittest.mock import MagicMock
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Response
+
+from pytest import fixture
+
+from pytest_mock import MockerFixture
+
+from respx import MockRouter
+
+from .helpers import RVENTS
+from ..params import ClientParams
+from ..shards import ClientShards
+
+
+
+@fixture
+def shards() -> ClientShards:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    params = ClientParams(
+        token='mocked')
+
+    return ClientShards(params)
+
+
+
+def test_ClientShards(
+    shards: ClientShards,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param shards: Class instance for connecting to service.
+    """
+
+
+    attrs = lattrs(shards)
+
+    assert attrs == [
+        '_ClientShards__params',
+        '_ClientShards__logger',
+        '_ClientShards__mqueue',
+        '_ClientShards__buckets',
+        '_ClientShards__cache',
+        '_ClientShards__starts',
+        '_ClientShards__lock',
+        '_ClientShards__client',
+        '_ClientShards__clients',
+        '_ClientShards__threads',
+        '_ClientShards__path',
+        '_ClientShards__concur']
+
+
+    assert inrepr(
+        'shards.ClientShards object',
+        shards)
+
+    assert isinstance(
+        hash(shards), int)
+
+    assert instr(
+        'shards.ClientShards object',
+        shards)
+
+
+    assert shards.params
+
+    assert shards.clients == []
+
+    assert shards.path is None
+
+    assert shards.concurrency == 1
+
+    assert shards.mqueue.qsize() == 0
+
+    assert shards.buckets.stats() == {}
+
+
+
+def test_ClientShards_operate(
+    shards: ClientShards,
+    mocker: MockerFixture,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param shards: Class instance for connecting to service.
+    :param mocker: Object for mocking the Python routines.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    content = dumps({
+        'url': 'mocked',
+        'shards': 3,
+        'session_start_limit': {
+            'max_concurrency': 2}})
+
+    (respx_mock
+     .get(
+         'https://discord.com'
+         '/api/v10/gateway/bot')
+     .mock(Response(
+         status_code=200,
+         content=content)))
+
+
+    sockets: list[MagicMock] = []
+
+    def _connect(
+        path: str,
+    ) -> MagicMock:
+
+        events = [
+            RVENTS[0],
+            {'op': 11},
+            {'op': 9}]
+
+        socket = MagicMock()
+
+        socket.recv = Mock(
+            side_effect=[
+                dumps(x) for x
+                in events])
+
+        sockets.append(socket)
+
+        return socket
+
+
+    mocker.patch(
+        ('enconnect.discord'
+         '.client.connect'),
+        side_effect=_connect)
+
+    sleeper = mocker.patch(
+        ('enconnect.discord'
+         '.shards.block_sleep'))
+
+
+    shards.operate()
+
+    assert shards.path == 'mocked'
+
+    assert shards.concurrency == 2
+
+    assert len(shards.clients) == 3
+
+    assert len(sockets) == 3
+
+    sleeper.assert_called_once()
+
+
+    identify = sorted(
+        loads(x.send.call_args_list[0].args[0])
+        ['d']['shard'] for x in sockets)
+
+    assert identify == [
+        [0, 3], [1, 3], [2, 3]]
+
+
+    mqueue = shards.mqueue
+
+    assert mqueue.qsize() == 6
+
+    received = sorted(
+        mqueue.get().shard or 0
+        for _ in range(6))
+
+    assert received == [
+        0, 0, 1, 1, 2, 2]
+
+
+    shards.stop()
@@ -8,6 +8,7 @@ is permitted, for more information consult the project license file.
 
 
 from .discord.test import DSCClientSocket
+from .discord.test import client_dscasock
 from .discord.test import client_dscsock
 from .irc.test import IRCClientSocket
 from .irc.test import client_ircsock
@@ -21,5 +22,6 @@ __all__ = [
     'client_ircsock',
     'DSCClientSocket',
     'client_dscsock',
+    'client_dscasock',
     'MTMClientSocket',
     'client_mtmsock']
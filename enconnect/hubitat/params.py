@@ -9,15 +9,14 @@ is permitted, for more information consult the project license file.
 
 from typing import Annotated
 from typing import Any
-from typing import Optional
-
-from encommon.types import BaseModel
 
 from pydantic import Field
 
+from ..utils import HTTPParams
+
 
 
-class BridgeParams(BaseModel, extra='forbid'):
+class BridgeParams(HTTPParams, extra='forbid'):
     """
     Process and validate the class configuration parameters.
     """
@@ -28,12 +27,6 @@ class BridgeParams(BaseModel, extra='forbid'):
               description='Server address for connection',
               min_length=1)]
 
-    timeout: Annotated[
-        int,
-        Field(30,
-              description='Timeout connecting to server',
-              ge=1, le=300)]
-
     appid: Annotated[
         int,
         Field(...,
@@ -51,12 +44,6 @@ class BridgeParams(BaseModel, extra='forbid'):
         Field(False,
               description='Verify the ceritifcate valid')]
 
-    ssl_capem: Annotated[
-        Optional[str],
-        Field(None,
-              description='Verify the ceritifcate valid',
-              min_length=1)]
-
 
     def __init__(
         self,
@@ -16,6 +16,7 @@ from httpx import Response
 from .models import InstagramMedia
 from .models import MEDIA_FIELDS
 from ..utils import HTTPClient
+from ..utils import http_client
 from ..utils.http import _PAYLOAD
 
 if TYPE_CHECKING:
@@ -44,10 +45,8 @@ class Instagram:
 
         self.__params = params
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params)
 
         self.__client = client
 
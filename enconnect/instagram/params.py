@@ -9,42 +9,29 @@ is permitted, for more information consult the project license file.
 
 from typing import Annotated
 from typing import Any
-from typing import Optional
-
-from encommon.types import BaseModel
 
 from pydantic import Field
 
+from ..utils import HTTPCacheParams
+from ..utils import HTTPParams
+
 
 
-class InstagramParams(BaseModel, extra='forbid'):
+class InstagramParams(
+    HTTPParams,
+    HTTPCacheParams,
+    extra='forbid',
+):
     """
     Process and validate the class configuration parameters.
     """
 
-    timeout: Annotated[
-        int,
-        Field(30,
-              description='Timeout connecting to server',
-              ge=1, le=300)]
-
     token: Annotated[
         str,
         Field(...,
               description='Parameter for the integration',
               min_length=1)]
 
-    ssl_verify: Annotated[
-        bool,
-        Field(True,
-              description='Verify the ceritifcate valid')]
-
-    ssl_capem: Annotated[
-        Optional[str],
-        Field(None,
-              description='Verify the ceritifcate valid',
-              min_length=1)]
-
 
     def __init__(
         self,
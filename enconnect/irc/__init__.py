@@ -7,13 +7,17 @@ is permitted, for more information consult the project license file.
 
 
 
+from .aclient import AsyncClient
 from .client import Client
 from .models import ClientEvent
 from .params import ClientParams
+from .parser import ClientLine
 
 
 
 __all__ = [
+    'AsyncClient',
     'Client',
     'ClientParams',
-    'ClientEvent']
+    'ClientEvent',
+    'ClientLine']
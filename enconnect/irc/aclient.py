@@ -0,0 +1,700 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from ssl import CERT_NONE
+from ssl import CERT_REQUIRED
+from ssl import SSLContext
+from ssl import create_default_context as default
+from typing import AsyncIterator
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from encommon.times import Time
+from encommon.types import NCFalse
+
+from .models import ClientEvent
+from .outbox import ClientOutbox
+from .parser import parse_line
+from ..utils import dumlog
+
+if TYPE_CHECKING:
+    from .params import ClientParams
+
+
+
+class AsyncClient:
+    """
+    Establish and maintain connection with the chat service.
+
+    .. note::
+       Similar to the other client but using asyncio streams,
+       allowing for many connections from within same thread.
+
+    :param params: Parameters used to instantiate the class.
+    :param logger: Callback for logging the related events.
+    """
+
+    __params: 'ClientParams'
+    __logger: Callable[..., None]
+
+    __reader: Optional[asyncio.StreamReader]
+    __writer: Optional[asyncio.StreamWriter]
+    __conned: asyncio.Event
+    __exited: asyncio.Event
+    __mynick: Optional[str]
+    __lsnick: Optional[str]
+    __ponged: Optional[Time]
+    __outbox: ClientOutbox
+    __flusher: Optional[asyncio.Task[None]]
+
+    __mqueue: asyncio.Queue[ClientEvent]
+    __cancel: asyncio.Event
+
+
+    def __init__(
+        self,
+        params: 'ClientParams',
+        logger: Optional[Callable[..., None]] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__params = params
+        self.__logger = (
+            logger or dumlog)
+
+        self.__reader = None
+        self.__writer = None
+        self.__conned = asyncio.Event()
+        self.__exited = asyncio.Event()
+        self.__mynick = None
+        self.__lsnick = None
+        self.__ponged = None
+        self.__outbox = ClientOutbox(
+            penalty=params.flood_penalty,
+            burst=params.flood_burst,
+            flood=(
+                params.operate
+                == 'normal'))
+        self.__flusher = None
+
+        self.__mqueue = asyncio.Queue(
+            params.queue_size)
+
+        self.__cancel = asyncio.Event()
+
+
+    @property
+    def params(
+        self,
+    ) -> 'ClientParams':
+        """
+        Return the Pydantic model containing the configuration.
+
+        :returns: Pydantic model containing the configuration.
+        """
+
+        return self.__params
+
+
+    @property
+    def connected(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return (
+            not self.__exited.is_set()
+            and self.__conned.is_set())
+
+
+    @property
+    def nickname(
+        self,
+    ) -> Optional[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        params = self.__params
+
+        operate = params.operate
+        serverid = params.serverid
+
+        if operate == 'service':
+            return serverid
+
+        return (
+            self.__mynick
+            or self.__lsnick)
+
+
+    @property
+    def outbox(
+        self,
+    ) -> ClientOutbox:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__outbox
+
+
+    @property
+    def mqueue(
+        self,
+    ) -> asyncio.Queue[ClientEvent]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__mqueue
+
+
+    @property
+    def canceled(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return (
+            self.__cancel.is_set()
+            or self.__exited.is_set())
+
+
+    async def events(
+        self,
+    ) -> AsyncIterator[ClientEvent]:
+        """
+        Return the events from the queue as they are received.
+
+        :returns: Events from the queue as they are received.
+        """
+
+        mqueue = self.__mqueue
+
+        while True:
+
+            event = await mqueue.get()
+
+            yield event
+
+
+    async def operate(
+        self,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+        """
+
+        logger = self.__logger
+
+        try:
+
+            logger(item='initial')
+
+            self.__reader = None
+            self.__writer = None
+            self.__conned.clear()
+            self.__exited.clear()
+            self.__mynick = None
+
+            self.__cancel.clear()
+
+            logger(item='operate')
+
+            await self.__operate()
+
+        finally:
+
+            self.__reader = None
+            self.__writer = None
+            self.__conned.clear()
+            self.__exited.clear()
+            self.__mynick = None
+
+            self.__cancel.clear()
+
+            logger(item='finish')
+
+
+    async def __operate(
+        self,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+        """
+
+        logger = self.__logger
+
+
+        await self.__connect()
+
+        writer = self.__writer
+
+        assert writer is not None
+
+        self.__ponged = Time()
+
+
+        watcher = asyncio.create_task(
+            self.__watcher(writer))
+
+
+        def _timeout() -> bool:
+
+            ponged = self.__ponged
+
+            if ponged is None:
+                return NCFalse
+
+            since = ponged.since
+
+            return since > 300
+
+
+        try:
+
+            while (not self.canceled
+                   and not _timeout()):
+
+                receive = await (
+                    self.socket_recv())
+
+                if receive is not None:
+                    await self.__event(receive)
+
+        finally:
+
+            watcher.cancel()
+
+            flusher = self.__flusher
+
+            if flusher is not None:
+                flusher.cancel()
+
+
+        logger(item='close')
+
+        writer.close()
+
+
+        if self.__exited.is_set():
+            raise ConnectionError
+
+
+    async def __watcher(
+        self,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Close the socket connection once cancel is requested.
+
+        :param writer: Connection which is closed upon cancel.
+        """
+
+        await self.__cancel.wait()
+
+        writer.close()
+
+
+    async def __event(
+        self,
+        event: str,
+    ) -> None:
+        """
+        Operate the client and populate queue with the messages.
+
+        :param event: Raw event received from the network peer.
+        """
+
+        params = self.__params
+        logger = self.__logger
+        mqueue = self.__mqueue
+        crrnt = self.__mynick
+
+        model = ClientEvent
+
+        operate = params.operate
+
+        line = parse_line(event)
+
+        prefix = line.prefix
+        command = line.command
+        _params = line.params
+
+
+        if (operate == 'normal'
+                and prefix is not None
+                and len(_params) >= 1):
+
+
+            if command == '001':
+
+                crrnt = _params[0]
+
+                logger(item='helo')
+
+                self.__mynick = crrnt
+                self.__lsnick = crrnt
+
+
+            if command == 'NICK':
+
+                nick1 = prefix.split(
+                    '!', maxsplit=1)[0]
+
+                nick2 = _params[0]
+
+                if nick1 == crrnt:
+                    self.__mynick = nick2
+                    self.__lsnick = nick2
+
+
+        if (command == 'PING'
+                and prefix is None
+                and len(_params) >= 1):
+
+            self.__ponged = Time()
+
+            ping = _params[0]
+            pong = f'PONG {ping}'
+
+            logger(item='ping')
+
+            await self.socket_send(pong)
+
+            return None
+
+
+        object = model.parsed(
+            self, line)
+
+        await mqueue.put(object)
+
+
+    def stop(
+        self,
+    ) -> None:
+        """
+        Gracefully close the connection with the server socket.
+        """
+
+        logger = self.__logger
+        writer = self.__writer
+
+        logger(item='stop')
+
+        if (self.connected
+                and writer is not None):
+
+            writer.write(
+                b'QUIT :Adios\r\n')
+
+        self.__cancel.set()
+
+
+    def __context(
+        self,
+    ) -> SSLContext:
+        """
+        Construct the object from wrapping SSL context settings.
+
+        :returns: Context used when establishing the connection.
+        """
+
+        params = self.__params
+
+        verify = params.ssl_verify
+
+        context = default()
+
+
+        setattr(
+            context,
+            'check_hostname',
+            verify)
+
+
+        _verify = (
+            CERT_REQUIRED
+            if verify is True
+            else CERT_NONE)
+
+        setattr(
+            context,
+            'verify_mode',
+            _verify)
+
+
+        return context
+
+
+    async def __connect(
+        self,
+    ) -> None:
+        """
+        Establish the connection with the upstream using socket.
+        """
+
+        params = self.__params
+        logger = self.__logger
+
+        server = params.server
+        port = params.port
+        operate = params.operate
+        nick = params.nickname
+        user = params.username
+        real = params.realname
+        passwd = params.password
+        sname = params.servername
+        serverid = params.serverid
+        senable = params.ssl_enable
+
+
+        context = (
+            self.__context()
+            if senable is True
+            else None)
+
+
+        logger(item='connect')
+
+        reader, writer = await (
+            asyncio.open_connection(
+                server, port,
+                ssl=context))
+
+
+        self.__reader = reader
+        self.__writer = writer
+
+        self.__outbox.reset()
+
+
+        if operate == 'normal':
+
+            await self.socket_send(
+                f'NICK {nick}')
+
+            await self.socket_send(
+                f'USER {user} . '
+                f'{nick} :{real}')
+
+
+        if passwd is not None:
+
+            await self.socket_send(
+                f'PASS {passwd}')
+
+
+        if operate == 'service':
+
+            await self.socket_send(
+                'PROTOCTL'
+                f' EAUTH={sname}'
+                f' SID={serverid}')
+
+            await self.socket_send(
+                'PROTOCTL'
+                ' NOQUIT'
+                ' NICKv2'
+                ' SJOIN'
+                ' SJ3'
+                ' NICKIP'
+                ' TKLEXT'
+                ' TKLEXT2'
+                ' NEXTBANS'
+                ' CLK'
+                ' ESVID'
+                ' MLOCK'
+                ' MTAGS'
+                ' EXTSWHOIS')
+
+            await self.socket_send(
+                f'SERVER {sname}'
+                f' 1 :{real}')
+
+
+        self.__conned.set()
+        self.__exited.clear()
+
+        self.__mynick = None
+
+
+    async def socket_send(
+        self,
+        send: str,
+        priority: Optional[int] = None,
+    ) -> None:
+        """
+        Transmit provided content through the socket connection.
+
+        .. note::
+           Content is queued within the outbox and then sent when
+           the flood allowance permits, otherwise upon next flush.
+
+        :param send: Content which will be sent through socket.
+        :param priority: Optional override for line priority.
+        """
+
+        self.__outbox.put(
+            send, priority)
+
+        await self.socket_flush()
+
+
+    async def socket_flush(
+        self,
+    ) -> float:
+        """
+        Transmit the content from outbox permitted by allowance.
+
+        :returns: Seconds until next content will be permitted.
+        """
+
+        logger = self.__logger
+        writer = self.__writer
+        outbox = self.__outbox
+
+        assert writer is not None
+
+        lines, wait = outbox.pop()
+
+        for line in lines:
+            logger(
+                item='transmit',
+                value=line)
+
+        transmit = (
+            ''.join(
+                f'{x}\r\n'
+                for x in lines)
+            .encode('utf-8'))
+
+        if transmit:
+            writer.write(transmit)
+
+        await writer.drain()
+
+        if wait > 0:
+            self.__deferred(wait)
+
+        return wait
+
+
+    def __deferred(
+        self,
+        wait: float,
+    ) -> None:
+        """
+        Schedule the flush for when next content is permitted.
+
+        :param wait: Seconds until next content will be permitted.
+        """
+
+        flusher = self.__flusher
+
+        if (flusher is not None
+                and not flusher.done()):
+            return None
+
+
+        async def _flush() -> None:
+
+            await asyncio.sleep(wait)
+
+            await self.socket_flush()
+
+
+        self.__flusher = (
+            asyncio.create_task(
+                _flush()))
+
+
+    async def socket_recv(
+        self,
+    ) -> Optional[str]:
+        """
+        Return the content received from the socket connection.
+
+        .. note::
+           Waiting for the content is limited to the remainder of
+           time allowed between the PING received from the server.
+
+        :returns: Content received from the socket connection.
+        """
+
+        logger = self.__logger
+        exited = self.__exited
+        cancel = self.__cancel
+        reader = self.__reader
+        ponged = self.__ponged
+
+        assert reader is not None
+
+        remain = (
+            max(0, 300 - ponged.since)
+            if ponged is not None
+            else None)
+
+
+        recv = b''
+
+        try:
+
+            async with asyncio.timeout(remain):
+
+                recv = await (
+                    reader.readuntil(b'\n'))
+
+        except TimeoutError:
+            await asyncio.sleep(0)
+
+        except (asyncio.IncompleteReadError,
+                ConnectionError):
+
+            if not cancel.is_set():
+                exited.set()
+
+            await asyncio.sleep(0)
+
+
+        event = (
+            recv.decode('utf-8')
+            .strip('\r\n'))
+
+        if event[:5] == 'ERROR':
+            exited.set()
+
+        if len(event) == 0:
+            return None
+
+        logger(
+            item='receive',
+            value=event)
+
+        return event
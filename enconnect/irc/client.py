@@ -7,18 +7,21 @@ is permitted, for more information consult the project license file.
 
 
 
+from codecs import IncrementalDecoder
 from codecs import getincrementaldecoder as getdecoder
 from queue import Queue
-from re import compile
-from re import match as re_match
+from selectors import DefaultSelector
+from selectors import EVENT_READ
 from socket import AF_INET
 from socket import SOCK_STREAM
 from socket import socket
+from socket import socketpair
 from ssl import CERT_NONE
 from ssl import CERT_REQUIRED
 from ssl import SSLSocket
 from ssl import create_default_context as default
 from threading import Event
+from threading import Lock
 from typing import Callable
 from typing import Iterator
 from typing import Optional
@@ -26,10 +29,13 @@ from typing import TYPE_CHECKING
 
 from encommon.times import Time
 from encommon.types import NCFalse
+from encommon.types import NCTrue
 from encommon.types.strings import NEWLINE
 from encommon.types.strings import SEMPTY
 
 from .models import ClientEvent
+from .outbox import ClientOutbox
+from .parser import parse_line
 from ..utils import dumlog
 
 if TYPE_CHECKING:
@@ -37,20 +43,6 @@ if TYPE_CHECKING:
 
 
 
-PING = compile(
-    r'^PING \:(\S+)$')
-
-HELO = compile(
-    r'^\:\S+\s001\s'
-    r'(?P<crrnt>\S+)')
-
-NICK = compile(
-    r'^\:(?P<nick1>[^\!]+)'
-    r'(\!\S+)?\sNICK\s\:'
-    r'(?P<nick2>\S+)')
-
-
-
 class Client:
     """
     Establish and maintain connection with the chat service.
@@ -68,6 +60,13 @@ class Client:
     __lsnick: Optional[str]
     __ponged: Optional[Time]
 
+    __buffer: bytearray
+    __decoder: IncrementalDecoder
+    __selector: Optional[DefaultSelector]
+    __waker: Optional[tuple[socket, socket]]
+    __outbox: ClientOutbox
+    __sender: Lock
+
     __mqueue: Queue[ClientEvent]
     __cancel: Event
 
@@ -92,6 +91,19 @@ class Client:
         self.__lsnick = None
         self.__ponged = None
 
+        self.__buffer = bytearray()
+        self.__decoder = (
+            getdecoder('utf-8')())
+        self.__selector = None
+        self.__waker = None
+        self.__outbox = ClientOutbox(
+            penalty=params.flood_penalty,
+            burst=params.flood_burst,
+            flood=(
+                params.operate
+                == 'normal'))
+        self.__sender = Lock()
+
         self.__mqueue = Queue(
             params.queue_size)
 
@@ -149,6 +161,19 @@ class Client:
             or self.__lsnick)
 
 
+    @property
+    def outbox(
+        self,
+    ) -> ClientOutbox:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__outbox
+
+
     @property
     def mqueue(
         self,
@@ -203,6 +228,8 @@ class Client:
 
         finally:
 
+            self.__release()
+
             self.__socket = None
             self.__conned.clear()
             self.__exited.clear()
@@ -244,11 +271,30 @@ class Client:
             return since > 300
 
 
+        def _remain() -> float:
+
+            ponged = self.__ponged
+
+            assert ponged is not None
+
+            since = ponged.since
+
+            return max(0, 300 - since)
+
+
         while (not self.canceled
                and not _timeout()):
 
+            wait = self.socket_flush()
+
+            timeout = _remain()
+
+            if wait > 0:
+                timeout = min(
+                    timeout, wait)
+
             receive = (
-                self.socket_recv())
+                self.socket_recv(timeout))
 
             for event in receive:
                 self.__event(event)
@@ -282,17 +328,21 @@ class Client:
 
         operate = params.operate
 
+        line = parse_line(event)
+
+        prefix = line.prefix
+        command = line.command
+        _params = line.params
 
-        if operate == 'normal':
 
+        if (operate == 'normal'
+                and prefix is not None
+                and len(_params) >= 1):
 
-            match = re_match(
-                HELO, event)
 
-            if match is not None:
+            if command == '001':
 
-                crrnt = (
-                    match.group('crrnt'))
+                crrnt = _params[0]
 
                 logger(item='helo')
 
@@ -300,30 +350,25 @@ class Client:
                 self.__lsnick = crrnt
 
 
-            match = re_match(
-                NICK, event)
+            if command == 'NICK':
 
-            if match is not None:
+                nick1 = prefix.split(
+                    '!', maxsplit=1)[0]
 
-                nick1 = (
-                    match.group('nick1'))
-
-                nick2 = (
-                    match.group('nick2'))
+                nick2 = _params[0]
 
                 if nick1 == crrnt:
                     self.__mynick = nick2
                     self.__lsnick = nick2
 
 
-        match = re_match(
-            PING, event)
-
-        if match is not None:
+        if (command == 'PING'
+                and prefix is None
+                and len(_params) >= 1):
 
             self.__ponged = Time()
 
-            ping = match.group(1)
+            ping = _params[0]
             pong = f'PONG {ping}'
 
             logger(item='ping')
@@ -333,8 +378,8 @@ class Client:
             return None
 
 
-        object = model(
-            self, event)
+        object = model.parsed(
+            self, line)
 
         mqueue.put(object)
 
@@ -357,6 +402,70 @@ class Client:
 
         self.__cancel.set()
 
+        self.__wakeup()
+
+
+    def __wakeup(
+        self,
+    ) -> None:
+        """
+        Interrupt the wait for socket using the signaling socket.
+        """
+
+        waker = self.__waker
+
+        if waker is None:
+            return None
+
+        try:
+            waker[1].send(b'\0')
+
+        except OSError:
+            return None
+
+
+    def __release(
+        self,
+    ) -> None:
+        """
+        Close the selector and the sockets used for the signaling.
+        """
+
+        selector = self.__selector
+        waker = self.__waker
+
+        self.__selector = None
+        self.__waker = None
+
+        if selector is not None:
+            selector.close()
+
+        if waker is not None:
+            waker[0].close()
+            waker[1].close()
+
+
+    def __register(
+        self,
+    ) -> None:
+        """
+        Construct the buffer and signaling for new connection.
+
+        .. note::
+           Selector is constructed upon the first wait for socket,
+           as buffered SSL data is received without the selector.
+        """
+
+        self.__buffer = bytearray()
+        self.__decoder = (
+            getdecoder('utf-8')())
+
+        self.__release()
+
+        self.__waker = socketpair()
+
+        self.__outbox.reset()
+
 
     def __wrapper(
         self,
@@ -442,6 +551,8 @@ class Client:
 
         self.__socket = handle
 
+        self.__register()
+
 
         if operate == 'normal':
 
@@ -496,52 +607,91 @@ class Client:
     def socket_send(
         self,
         send: str,
+        priority: Optional[int] = None,
     ) -> None:
         """
         Transmit provided content through the socket connection.
 
+        .. note::
+           Content is queued within the outbox and then sent when
+           the flood allowance permits, otherwise upon next flush.
+           When content is held the wait for socket is interrupted
+           so the flush is scheduled using the updated allowance.
+
         :param send: Content which will be sent through socket.
+        :param priority: Optional override for line priority.
+        """
+
+        self.__outbox.put(
+            send, priority)
+
+        wait = self.socket_flush()
+
+        if wait > 0:
+            self.__wakeup()
+
+
+    def socket_flush(
+        self,
+    ) -> float:
+        """
+        Transmit the content from outbox permitted by allowance.
+
+        :returns: Seconds until next content will be permitted.
         """
 
         logger = self.__logger
         socket = self.__socket
+        outbox = self.__outbox
 
         assert socket is not None
 
-        logger(
-            item='transmit',
-            value=send)
+        with self.__sender:
 
-        transmit = (
-            f'{send}\r\n'
-            .encode('utf-8'))
+            lines, wait = outbox.pop()
+
+            if not lines:
+                return wait
+
+            for line in lines:
+                logger(
+                    item='transmit',
+                    value=line)
+
+            transmit = (
+                ''.join(
+                    f'{x}\r\n'
+                    for x in lines)
+                .encode('utf-8'))
+
+            socket.sendall(transmit)
 
-        socket.send(transmit)
+        return wait
 
 
     def socket_recv(
         self,
+        timeout: Optional[float] = None,
     ) -> Iterator[str]:
         """
         Return the content received from the socket connection.
 
         .. note::
-           Method could be further optimized using an internal
-           buffer within the class after receiving more bytes.
+           Partial line remains within the buffer for the instance
+           until the remainder is received from the connection.
 
+        :param timeout: Seconds to wait for the socket readable.
         :returns: Content received from the socket connection.
         """
 
         logger = self.__logger
         exited = self.__exited
         socket = self.__socket
+        buffer = self.__buffer
+        decoder = self.__decoder
 
         assert socket is not None
 
-        buffer = bytearray()
-
-        decoder = getdecoder('utf-8')()
-
         bempty = (
             SEMPTY
             .encode('utf-8'))
@@ -551,51 +701,102 @@ class Client:
             .encode('utf-8'))
 
 
-        def _receive() -> bytes:
+        if not self.__waiting(timeout):
+            return None
 
-            return socket.recv(4096)
+        try:
 
+            recv = socket.recv(65536)
 
-        while True:
+            if recv == bempty:
+                exited.set()
+                return None
+
+            buffer.extend(recv)
 
-            try:
+        except TimeoutError:
+            return None
 
-                recv = _receive()
 
-                if recv == bempty:
-                    exited.set()
-                    break
+        while True:
 
-                buffer.extend(recv)
+            index = (
+                buffer.find(bewline))
 
-            except TimeoutError:
+            if index == -1:
                 break
 
+            line = buffer[:index + 1]
+
+            del buffer[:index + 1]
+
+            event = (
+                decoder.decode(
+                    line, False)
+                .strip('\r\n'))
+
+            if event[:5] == 'ERROR':
+                exited.set()
+
+            if len(event) >= 1:
+
+                logger(
+                    item='receive',
+                    value=event)
+
+                yield event
+
+
+    def __waiting(
+        self,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Return the boolean indicating the socket can be received.
+
+        .. note::
+           Blocks until data is available on the socket or until
+           the wait is interrupted using the cancel signaling.
+
+        :param timeout: Seconds to wait for the socket readable.
+        :returns: Boolean indicating the socket can be received.
+        """
+
+        socket = self.__socket
+        selector = self.__selector
+        waker = self.__waker
+
+        if (isinstance(socket, SSLSocket)
+                and socket.pending()):
+            return True
+
+        if (socket is None
+                or waker is None):
+            return NCTrue
+
+        if selector is None:
 
-            while True:
+            selector = DefaultSelector()
 
-                index = (
-                    buffer.find(bewline))
+            selector.register(
+                socket, EVENT_READ)
 
-                if index == -1:
-                    break
+            selector.register(
+                waker[0], EVENT_READ)
 
-                line = buffer[:index + 1]
+            self.__selector = selector
 
-                del buffer[:index + 1]
+        events = (
+            selector.select(timeout))
 
-                event = (
-                    decoder.decode(
-                        line, False)
-                    .strip('\r\n'))
+        readable = False
 
-                if event[:5] == 'ERROR':
-                    exited.set()
+        for key, _ in events:
 
-                if len(event) >= 1:
+            if key.fileobj is waker[0]:
+                waker[0].recv(4096)
+                continue
 
-                    logger(
-                        item='receive',
-                        value=event)
+            readable = True
 
-                    yield event
+        return readable
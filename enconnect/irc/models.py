@@ -7,11 +7,11 @@ is permitted, for more information consult the project license file.
 
 
 
+from functools import lru_cache
 from re import IGNORECASE
+from re import Pattern
 from re import compile
 from re import escape as re_escape
-from re import match as re_match
-from re import search as re_search
 from typing import Annotated
 from typing import Literal
 from typing import Optional
@@ -19,20 +19,18 @@ from typing import TYPE_CHECKING
 
 from encommon.types import BaseModel
 from encommon.types import DictStrAny
-from encommon.types import NCTrue
 
 from pydantic import Field
 
+from .parser import ClientLine
+from .parser import parse_line
+
 if TYPE_CHECKING:
+    from .aclient import AsyncClient
     from .client import Client
 
 
 
-EVENT = compile(
-    r'^(?::(?P<prefix>[^\s]+)\s)?'
-    r'(?P<command>[A-Z0-9]{3,})\s'
-    r'(?P<params>.+)$')
-
 KINDS = Literal[
     'event',
     'chanmsg',
@@ -115,244 +113,173 @@ class ClientEvent(BaseModel, extra='ignore'):
     def __init__(
         self,
         /,
-        client: 'Client',
+        client: 'Client | AsyncClient',
         event: str,
     ) -> None:
         """
         Initialize instance for class using provided parameters.
         """
 
-        data: DictStrAny = {
-            'original': event}
-
-        operate = (
-            client.params
-            .operate)
-
-
-        match = re_match(
-            EVENT, event)
-
-        if (operate == 'normal'
-                and match is not None):
-
-            prefix = (
-                match
-                .group('prefix'))
-
-            if prefix is not None:
-                data['prefix'] = (
-                    prefix.strip())
-
-            command = (
-                match
-                .group('command'))
-
-            if command is not None:
-                data['command'] = (
-                    command.strip())
-
-            params = (
-                match
-                .group('params'))
-
-            if params is not None:
-                data['params'] = (
-                    params.strip())
-
+        data = _fields(
+            client,
+            parse_line(event))
 
         super().__init__(**data)
 
-        self.__set_kind()
-        self.__set_author()
-        self.__set_recipient()
-        self.__set_message()
-        self.__set_isme(client)
-        self.__set_hasme(client)
-        self.__set_whome(client)
-
-
-    def __set_kind(
-        self,
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
-        """
-
-        command = self.command
-        params = self.params
-
-        kind: KINDS = 'event'
-
-
-        if command == 'PRIVMSG':
-
-            assert params is not None
-
-            prefix = params[0][:1]
-
-            kind = (
-                'chanmsg'
-                if prefix in '#&+!'
-                else 'privmsg')
 
-
-        self.kind = kind
-
-
-    def __set_author(
-        self,
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
+    @classmethod
+    def parsed(
+        cls: type['ClientEvent'],
+        client: 'Client | AsyncClient',
+        line: ClientLine,
+    ) -> 'ClientEvent':
         """
+        Construct the instance from line skipping the validation.
 
-        kind = self.kind
-        prefix = self.prefix
-
-        if kind not in MESSAGE:
-            return None
-
-        assert prefix is not None
+        .. note::
+           Fields are assigned from the line already parsed, as
+           the validation is unnecessary for those trusted values.
 
-        author = prefix.split(
-            '!', maxsplit=1)
-
-        self.author = author[0]
-
-
-    def __set_recipient(
-        self,
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
+        :param client: Class instance for connecting to service.
+        :param line: Fields parsed from line received from server.
+        :returns: Newly constructed instance of related class.
         """
 
-        kind = self.kind
-        params = self.params
+        data = _fields(client, line)
 
-        if (kind not in MESSAGE
-                or not params):
-            return None
+        return cls.model_construct(**data)
 
-        split = params.split(' ')
 
-        self.recipient = split[0]
 
+def _fields(
+    client: 'Client | AsyncClient',
+    line: ClientLine,
+) -> DictStrAny:
+    """
+    Return the fields for the model from the line parsed.
 
-    def __set_message(
-        self,
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
-        """
+    .. note::
+       Fields are determined within single pass over the line,
+       with values not applicable to line remaining as default.
 
-        kind = self.kind
-        params = self.params
+    :param client: Class instance for connecting to service.
+    :param line: Fields parsed from line received from server.
+    :returns: Fields for the model from the line parsed.
+    """
 
-        if (kind not in MESSAGE
-                or not params):
-            return None
+    mynick = client.nickname
+    event = line.original
 
-        message = (
-            params
-            .split(':', maxsplit=1))
+    operate = (
+        client.params
+        .operate)
 
-        self.message = message[1]
+    prefix: Optional[str] = None
+    command: Optional[str] = None
+    params: Optional[str] = None
 
+    kind: KINDS = 'event'
+    author: Optional[str] = None
+    recipient: Optional[str] = None
+    message: Optional[str] = None
 
-    def __set_isme(
-        self,
-        client: 'Client',
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
 
-        :param client: Class instance for connecting to service.
-        """
-
-        mynick = client.nickname
-        author = self.author
-        event = self.original
-
-        operate = (
-            client.params
-            .operate)
-
-        isme: bool = False
+    _command = line.command or ''
 
+    _params = (
+        line.rawparams
+        .strip())
 
-        if operate == 'service':
+    valid = (
+        len(_command) >= 3
+        and _command.isascii()
+        and _command.isalnum()
+        and (_command.isupper()
+             or _command.isdigit()))
 
-            prefix = f':{mynick} '
+    if (operate == 'normal'
+            and valid and _params):
 
-            if event.startswith(prefix):
-                isme = True
+        prefix = line.prefix
+        command = _command
+        params = _params
 
 
-        elif mynick and author:
+    if (command == 'PRIVMSG'
+            and params is not None):
 
-            mine = mynick
-            them = author
+        kind = (
+            'chanmsg'
+            if params[:1] in '#&+!'
+            else 'privmsg')
 
-            isme = mine == them
+        if prefix is not None:
+            author = prefix.split(
+                '!', maxsplit=1)[0]
 
+        split = line.params
 
-        elif operate == 'normal':
+        recipient = split[0]
 
-            prefix = f':{mynick}!'
+        if len(split) >= 2:
+            message = split[-1] or None
 
-            if event.startswith(prefix):
-                isme = NCTrue
 
-            prefix = f':{mynick} '
+    isme = False
 
-            if event.startswith(prefix):
-                isme = NCTrue
+    if operate == 'service':
+        isme = event.startswith(
+            f':{mynick} ')
 
+    elif mynick and author:
+        isme = mynick == author
 
-        self.isme = isme
+    elif operate == 'normal':
+        isme = (
+            event.startswith(
+                f':{mynick}!')
+            or event.startswith(
+                f':{mynick} '))
 
 
-    def __set_hasme(
-        self,
-        client: 'Client',
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
+    hasme = False
 
-        :param client: Class instance for connecting to service.
-        """
+    if mynick and message:
 
-        mynick = client.nickname
-        message = self.message
+        pattern = _mention(mynick)
 
-        if mynick is None:
-            return None
+        hasme = bool(
+            pattern.search(message))
 
-        if message is None:
-            return None
 
-        needle = re_escape(mynick)
-        pattern = rf'\b@?{needle}\b'
+    return {
+        'prefix': prefix,
+        'command': command,
+        'params': params,
+        'original': event,
+        'kind': kind,
+        'isme': isme,
+        'hasme': hasme,
+        'whome': mynick,
+        'author': author,
+        'recipient': recipient,
+        'message': message}
 
-        results = bool(
-            re_search(
-                pattern,
-                message,
-                IGNORECASE))
 
-        self.hasme = results
 
+@lru_cache(maxsize=64)
+def _mention(
+    nickname: str,
+) -> Pattern[str]:
+    """
+    Return the compiled pattern matching mention of nickname.
 
-    def __set_whome(
-        self,
-        client: 'Client',
-    ) -> None:
-        """
-        Update the value for the attribute from class instance.
+    :param nickname: Nickname which will be searched for.
+    :returns: Compiled pattern matching mention of nickname.
+    """
 
-        :param client: Class instance for connecting to service.
-        """
+    needle = re_escape(nickname)
 
-        self.whome = client.nickname
+    return compile(
+        rf'\b@?{needle}\b',
+        IGNORECASE)
@@ -0,0 +1,182 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from heapq import heappop
+from heapq import heappush
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+
+
+_QUEUED = tuple[int, int, str]
+
+
+
+PRIORITY = {
+    'PONG': 0,
+    'QUIT': 0}
+
+
+
+class ClientOutbox:
+    """
+    Queue the lines sent to server within the flood allowance.
+
+    .. note::
+       Follows the penalty timer from the RFC 1459 reference
+       server, with each line adding the penalty and a second
+       for every 120 characters, and lines held while the timer
+       is ahead of the current time by more than the burst.
+
+    .. note::
+       Lines with priority, like the PONG and QUIT, are sent
+       ahead of the others and are never held by the timer.
+
+    :param penalty: Seconds added to the timer for each line.
+    :param burst: Seconds the timer can get ahead of current.
+    :param flood: Determine whether the timer is enforced,
+        otherwise all lines queued are returned together.
+    """
+
+    __penalty: float
+    __burst: float
+    __flood: bool
+
+    __queue: list[_QUEUED]
+    __count: int
+    __timer: float
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        penalty: float = 2,
+        burst: float = 10,
+        flood: bool = True,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert penalty >= 0
+        assert burst >= 0
+
+        self.__penalty = float(penalty)
+        self.__burst = float(burst)
+        self.__flood = flood
+
+        self.__queue = []
+        self.__count = 0
+        self.__timer = 0.0
+        self.__lock = Lock()
+
+
+    @property
+    def size(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return len(self.__queue)
+
+
+    def put(
+        self,
+        send: str,
+        priority: Optional[int] = None,
+    ) -> None:
+        """
+        Queue the line which will be sent through the socket.
+
+        :param send: Content which will be sent through socket.
+        :param priority: Optional override for line priority.
+            Lines with lower number are sent before others.
+        """
+
+        if priority is None:
+
+            command = (
+                send.split(' ', 1)[0]
+                .upper())
+
+            priority = (
+                PRIORITY.get(command, 1))
+
+        with self.__lock:
+
+            self.__count += 1
+
+            heappush(
+                self.__queue,
+                (priority,
+                 self.__count,
+                 send))
+
+
+    def pop(
+        self,
+    ) -> tuple[list[str], float]:
+        """
+        Return the lines permitted now and seconds until next.
+
+        :returns: Lines permitted now and seconds until next.
+        """
+
+        queue = self.__queue
+        penalty = self.__penalty
+        burst = self.__burst
+
+        lines: list[str] = []
+
+        with self.__lock:
+
+            current = monotonic()
+
+            timer = max(
+                self.__timer, current)
+
+            while queue:
+
+                if (self.__flood
+                        and queue[0][0] >= 1
+                        and timer - current > burst):
+                    break
+
+                send = heappop(queue)[2]
+
+                timer += (
+                    penalty
+                    + len(send) // 120)
+
+                lines.append(send)
+
+            self.__timer = timer
+
+            wait = (
+                timer - current - burst
+                if queue else 0.0)
+
+            return (lines, wait)
+
+
+    def reset(
+        self,
+    ) -> None:
+        """
+        Forget the lines queued when new connection is created.
+        """
+
+        with self.__lock:
+            self.__queue.clear()
+            self.__timer = 0.0
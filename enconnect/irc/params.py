@@ -92,6 +92,18 @@ class ClientParams(BaseModel, extra='forbid'):
         Field(True,
               description='Verify the ceritifcate valid')]
 
+    flood_penalty: Annotated[
+        float,
+        Field(2,
+              description='Seconds penalty for each line',
+              ge=0, le=60)]
+
+    flood_burst: Annotated[
+        float,
+        Field(10,
+              description='Seconds of penalty before held',
+              ge=0, le=300)]
+
     queue_size: Annotated[
         int,
         Field(10000,
@@ -0,0 +1,240 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from typing import Optional
+
+
+
+ESCAPES = {
+    ':': ';',
+    's': ' ',
+    '\\': '\\',
+    'r': '\r',
+    'n': '\n'}
+
+
+
+class ClientLine:
+    """
+    Contain the fields from line received from the IRC server.
+
+    :param original: Original line received from the server.
+    :param tags: Tags from the line with values unescaped.
+    :param prefix: Prefix or origin information from line.
+    :param command: Code or command from the line received.
+    :param params: Parameters including trailing parameter.
+    :param rawparams: Parameters as received from the server.
+    """
+
+    original: str
+    tags: dict[str, str]
+    prefix: Optional[str]
+    command: Optional[str]
+    params: list[str]
+    rawparams: str
+
+
+    def __init__(  # noqa: CFQ002
+        self,
+        original: str,
+        tags: dict[str, str],
+        prefix: Optional[str],
+        command: Optional[str],
+        params: list[str],
+        rawparams: str,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.original = original
+        self.tags = tags
+        self.prefix = prefix
+        self.command = command
+        self.params = params
+        self.rawparams = rawparams
+
+
+
+def parse_line(
+    line: str,
+) -> ClientLine:
+    """
+    Return the fields parsed from line received from server.
+
+    .. note::
+       Parsing is performed in single pass using string search,
+       avoiding the regular expressions on the receive path.
+
+    :param line: Line from the server without the separator.
+    :returns: Fields parsed from line received from server.
+    """
+
+    length = len(line)
+    index = 0
+
+    tags: dict[str, str] = {}
+    prefix: Optional[str] = None
+
+
+    if line[:1] == '@':
+
+        space = line.find(' ')
+
+        if space == -1:
+            space = length
+
+        tags = _parse_tags(
+            line[1:space])
+
+        index = _skip_spaces(
+            line, space)
+
+
+    if line.startswith(':', index):
+
+        space = line.find(' ', index)
+
+        if space == -1:
+            space = length
+
+        prefix = (
+            line[index + 1:space]
+            or None)
+
+        index = _skip_spaces(
+            line, space)
+
+
+    space = line.find(' ', index)
+
+    if space == -1:
+        space = length
+
+    command = (
+        line[index:space]
+        or None)
+
+    index = _skip_spaces(
+        line, space)
+
+    rawparams = line[index:]
+
+
+    trailing: Optional[str] = None
+
+    if rawparams[:1] == ':':
+        middle = ''
+        trailing = rawparams[1:]
+
+    else:
+
+        colon = rawparams.find(' :')
+
+        middle = rawparams
+
+        if colon != -1:
+            middle = rawparams[:colon]
+            trailing = rawparams[colon + 2:]
+
+    params = middle.split()
+
+    if trailing is not None:
+        params.append(trailing)
+
+
+    return ClientLine(
+        original=line,
+        tags=tags,
+        prefix=prefix,
+        command=command,
+        params=params,
+        rawparams=rawparams)
+
+
+
+def _skip_spaces(
+    line: str,
+    index: int,
+) -> int:
+    """
+    Return the index for first character following the spaces.
+
+    :param line: Line from the server without the separator.
+    :param index: Index for the character where spaces begin.
+    :returns: Index for first character following the spaces.
+    """
+
+    length = len(line)
+
+    while (index < length
+           and line[index] == ' '):
+        index += 1
+
+    return index
+
+
+
+def _parse_tags(
+    source: str,
+) -> dict[str, str]:
+    """
+    Return the tags parsed from the IRCv3 message tag section.
+
+    :param source: Tag section without the leading character.
+    :returns: Tags parsed from the IRCv3 message tag section.
+    """
+
+    tags: dict[str, str] = {}
+
+    for item in source.split(';'):
+
+        if not item:
+            continue
+
+        key, _, value = (
+            item.partition('='))
+
+        if '\\' in value:
+            value = _unescape(value)
+
+        tags[key] = value
+
+    return tags
+
+
+
+def _unescape(
+    value: str,
+) -> str:
+    """
+    Return the tag value with the IRCv3 escapes replaced.
+
+    :param value: Value for the tag as received from server.
+    :returns: Value for the tag with the escapes replaced.
+    """
+
+    chars: list[str] = []
+
+    escaped = False
+
+    for char in value:
+
+        if escaped:
+            chars.append(
+                ESCAPES.get(char, char))
+            escaped = False
+
+        elif char == '\\':
+            escaped = True
+
+        else:
+            chars.append(char)
+
+    return ''.join(chars)
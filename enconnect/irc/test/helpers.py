@@ -282,6 +282,9 @@ def client_ircsock(  # noqa: CFQ004
 
         socket.close = Mock()
 
+        socket.pending = Mock(
+            return_value=1)
+
         return socket
 
 
@@ -0,0 +1,311 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+
+from ..aclient import AsyncClient
+from ..params import ClientParams
+from ..test.helpers import EVENTS
+from ..test.helpers import RVENTS
+from ..test.helpers import SVENTS
+
+
+
+@fixture
+def client() -> AsyncClient:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    params = ClientParams(
+        server='127.0.0.1',
+        port=6667,
+        nickname='client',
+        username='client',
+        realname='client',
+        ssl_enable=False)
+
+    return AsyncClient(params)
+
+
+
+async def _server(
+    events: list[str],
+    received: list[str],
+    *,
+    close: bool = True,
+) -> asyncio.Server:
+    """
+    Construct the server which will playback provided events.
+
+    :param events: Raw events for playback from the server.
+    :param received: List populated with events from client.
+    :param close: Determine whether connection is closed.
+    :returns: Server which will playback provided events.
+    """
+
+    async def _receive(
+        reader: asyncio.StreamReader,
+    ) -> bool:
+
+        line = await reader.readline()
+
+        if line:
+            received.append(
+                line.decode('utf-8')
+                .strip('\r\n'))
+
+        return bool(line)
+
+
+    async def _handle(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+
+        await _receive(reader)
+
+        for event in events:
+            writer.write(
+                f'{event}\r\n'
+                .encode('utf-8'))
+
+        await writer.drain()
+
+        while await _receive(reader):
+
+            if close and len(received) >= 3:
+                break
+
+        writer.close()
+
+
+    return await (
+        asyncio.start_server(
+            _handle, '127.0.0.1', 0))
+
+
+
+def test_AsyncClient(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+
+    attrs = lattrs(client)
+
+    assert attrs == [
+        '_AsyncClient__params',
+        '_AsyncClient__logger',
+        '_AsyncClient__reader',
+        '_AsyncClient__writer',
+        '_AsyncClient__conned',
+        '_AsyncClient__exited',
+        '_AsyncClient__mynick',
+        '_AsyncClient__lsnick',
+        '_AsyncClient__ponged',
+        '_AsyncClient__outbox',
+        '_AsyncClient__flusher',
+        '_AsyncClient__mqueue',
+        '_AsyncClient__cancel']
+
+
+    assert inrepr(
+        'aclient.AsyncClient object',
+        client)
+
+    assert isinstance(
+        hash(client), int)
+
+    assert instr(
+        'aclient.AsyncClient object',
+        client)
+
+
+    assert client.params
+
+    assert not client.connected
+
+    assert not client.nickname
+
+    assert client.mqueue.qsize() == 0
+
+    assert not client.canceled
+
+
+
+@mark.asyncio
+async def test_AsyncClient_connect(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+    received: list[str] = []
+
+    server = await _server(
+        RVENTS + EVENTS,
+        received)
+
+    sockets = server.sockets
+
+    params = client.params
+
+    params.port = (
+        sockets[0]
+        .getsockname()[1])
+
+
+    async with server:
+
+        with raises(ConnectionError):
+            await client.operate()
+
+        while len(received) < 3:
+            await asyncio.sleep(0.01)
+
+
+    assert not client.canceled
+    assert not client.connected
+
+    assert received[:3] == [
+        'NICK client',
+        'USER client . client :client',
+        'PONG 123456789']
+
+
+    mqueue = client.mqueue
+
+    assert mqueue.qsize() == 10
+
+    events = client.events()
+
+    kinds = [
+        (await anext(events)).kind
+        for _ in range(10)]
+
+    assert kinds.count('chanmsg') == 3
+    assert kinds.count('privmsg') == 1
+
+
+
+@mark.asyncio
+async def test_AsyncClient_service(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+    received: list[str] = []
+
+    server = await _server(
+        SVENTS, received,
+        close=False)
+
+    sockets = server.sockets
+
+    params = client.params
+
+    params.operate = 'service'
+    params.password = 'password'
+    params.port = (
+        sockets[0]
+        .getsockname()[1])
+
+
+    async with server:
+
+        task = asyncio.create_task(
+            client.operate())
+
+        mqueue = client.mqueue
+
+        while mqueue.qsize() < len(SVENTS):
+            await asyncio.sleep(0.01)
+
+        assert client.connected
+
+        assert client.nickname == '42X'
+
+        client.stop()
+
+        await asyncio.wait_for(task, 5)
+
+
+    assert not client.canceled
+    assert not client.connected
+
+    assert received[0] == (
+        'PASS password')
+
+    assert received[-1] == (
+        'QUIT :Adios')
+
+
+
+@mark.asyncio
+async def test_AsyncClient_socket_send(
+    client: AsyncClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+    params = client.params
+
+    params.flood_penalty = 0.1
+    params.flood_burst = 0
+
+    client = AsyncClient(params)
+
+    writer = Mock()
+    writer.drain = AsyncMock()
+
+    client._AsyncClient__writer = writer  # type: ignore
+
+
+    await client.socket_send('PRIVMSG # :1')
+    await client.socket_send('PRIVMSG # :2')
+
+    assert client.outbox.size == 1
+
+    while client.outbox.size:
+        await asyncio.sleep(0.05)
+
+    calls = [
+        x.args[0] for x in
+        writer.write.call_args_list]
+
+    assert calls == [
+        b'PRIVMSG # :1\r\n',
+        b'PRIVMSG # :2\r\n']
@@ -7,6 +7,10 @@ is permitted, for more information consult the project license file.
 
 
 
+from socket import socketpair
+from threading import Thread
+from time import monotonic
+from time import sleep as block_sleep
 from unittest.mock import Mock
 
 from encommon.types import inrepr
@@ -63,6 +67,12 @@ def test_Client(
         '_Client__mynick',
         '_Client__lsnick',
         '_Client__ponged',
+        '_Client__buffer',
+        '_Client__decoder',
+        '_Client__selector',
+        '_Client__waker',
+        '_Client__outbox',
+        '_Client__sender',
         '_Client__mqueue',
         '_Client__cancel']
 
@@ -177,3 +187,71 @@ def test_Client_connect(
     mqueue = client.mqueue
 
     assert mqueue.qsize() == 3
+
+
+
+def test_Client_socket_recv(
+    client: Client,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    """
+
+    local, remote = socketpair()
+
+    client._Client__socket = local  # type: ignore
+    client._Client__register()  # type: ignore
+
+    receive = client.socket_recv
+
+
+    remote.send(b':server NOTICE pa')
+
+    assert not list(receive(1))
+
+    remote.send(b'rtial\r\n:server 0')
+
+    events = list(receive(1))
+
+    assert events == [
+        ':server NOTICE partial']
+
+
+    started = monotonic()
+
+    thread = Thread(
+        target=lambda: list(receive()))
+
+    thread.start()
+
+    block_sleep(0.1)
+
+    client.stop()
+
+    thread.join(5)
+
+    assert not thread.is_alive()
+
+    assert monotonic() - started < 5
+
+
+    remote.send(b'01 client\r\n')
+
+    events = list(receive(1))
+
+    assert events == [
+        ':server 001 client']
+
+
+    remote.close()
+
+    assert not list(receive(1))
+
+    assert client.canceled
+
+
+    client._Client__release()  # type: ignore
+
+    local.close()
@@ -0,0 +1,275 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from socket import create_server
+from threading import Thread
+from time import monotonic
+from time import sleep as block_sleep
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from ..client import Client
+from ..outbox import ClientOutbox
+from ..params import ClientParams
+
+
+
+def test_ClientOutbox() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox()
+
+
+    attrs = lattrs(outbox)
+
+    assert attrs == [
+        '_ClientOutbox__penalty',
+        '_ClientOutbox__burst',
+        '_ClientOutbox__flood',
+        '_ClientOutbox__queue',
+        '_ClientOutbox__count',
+        '_ClientOutbox__timer',
+        '_ClientOutbox__lock']
+
+
+    assert inrepr(
+        'outbox.ClientOutbox object',
+        outbox)
+
+    assert isinstance(
+        hash(outbox), int)
+
+    assert instr(
+        'outbox.ClientOutbox object',
+        outbox)
+
+
+    assert outbox.size == 0
+
+    assert outbox.pop() == ([], 0)
+
+
+
+def test_ClientOutbox_pop() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox(
+        penalty=2, burst=2)
+
+    put = outbox.put
+    pop = outbox.pop
+
+
+    put('PRIVMSG # :1')
+    put('PRIVMSG # :2')
+    put('PRIVMSG # :3')
+    put('PRIVMSG # :4')
+    put('pong :server')
+
+    lines, wait = pop()
+
+    assert lines == [
+        'pong :server',
+        'PRIVMSG # :1']
+
+    assert 1.5 < wait <= 2
+
+    assert outbox.size == 3
+
+
+    put('QUIT :Adios')
+    put('PRIVMSG # :5', 0)
+
+    lines, wait = pop()
+
+    assert lines == [
+        'QUIT :Adios',
+        'PRIVMSG # :5']
+
+    assert 5.5 < wait <= 6
+
+
+    put(f'PRIVMSG # :{"a" * 240}', 0)
+
+    lines, wait = pop()
+
+    assert 9.5 < wait <= 10
+
+
+    outbox.reset()
+
+    assert outbox.size == 0
+
+    assert pop() == ([], 0)
+
+
+
+def test_ClientOutbox_service() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    outbox = ClientOutbox(
+        burst=0, flood=False)
+
+    for count in range(100):
+        outbox.put(f'PRIVMSG # :{count}')
+
+    lines, wait = outbox.pop()
+
+    assert len(lines) == 100
+
+    assert wait == 0
+
+
+
+def test_Client_socket_send() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = ClientParams(
+        server='mocked',
+        operate='service')
+
+    client = Client(params)
+
+    socket = Mock()
+
+    client._Client__socket = socket  # type: ignore
+
+
+    client.socket_send('PING :1')
+
+    sendall = socket.sendall
+
+    assert sendall.call_count == 1
+
+
+    outbox = client.outbox
+
+    outbox.put('PRIVMSG # :1')
+    outbox.put('PRIVMSG # :2')
+
+    assert client.socket_flush() == 0
+
+    assert sendall.call_count == 2
+
+    call = sendall.call_args_list[1]
+
+    assert call.args[0] == (
+        b'PRIVMSG # :1\r\n'
+        b'PRIVMSG # :2\r\n')
+
+
+    params = ClientParams(
+        server='mocked',
+        flood_burst=0)
+
+    client = Client(params)
+
+    client._Client__socket = socket  # type: ignore
+
+    client.socket_send('PRIVMSG # :1')
+    client.socket_send('PRIVMSG # :2')
+    client.socket_send('PONG :1')
+
+    assert sendall.call_count == 4
+
+    assert client.outbox.size == 1
+
+
+
+def test_Client_socket_flood() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    server = create_server(
+        ('127.0.0.1', 0))
+
+    port = (
+        server.getsockname()[1])
+
+    params = ClientParams(
+        server='127.0.0.1',
+        port=port,
+        nickname='ircbot',
+        username='ircbot',
+        realname='ircbot',
+        ssl_enable=False,
+        flood_penalty=0.2,
+        flood_burst=0)
+
+    client = Client(params)
+
+    received = bytearray()
+
+
+    def _receive() -> None:
+
+        remote, _ = server.accept()
+
+        remote.settimeout(5)
+
+        while recv := remote.recv(4096):
+            received.extend(recv)
+
+        remote.close()
+
+
+    thread1 = Thread(target=_receive)
+    thread2 = Thread(target=client.operate)
+
+    thread1.start()
+    thread2.start()
+
+    while b'USER' not in received:
+        block_sleep(0.01)
+
+
+    def _sender() -> None:
+        client.socket_send('PRIVMSG # :1')
+        client.socket_send('PRIVMSG # :2')
+
+    thread3 = Thread(target=_sender)
+
+    thread3.start()
+    thread3.join()
+
+
+    expect = (
+        b'PRIVMSG # :1\r\n'
+        b'PRIVMSG # :2\r\n')
+
+    started = monotonic()
+
+    while (not received.endswith(expect)
+           and monotonic() - started < 5):
+        block_sleep(0.01)
+
+    assert received == (
+        b'NICK ircbot\r\n'
+        b'USER ircbot . ircbot :ircbot\r\n'
+        + expect)
+
+
+    client.stop()
+
+    thread2.join(5)
+    thread1.join(5)
+
+    server.close()
@@ -0,0 +1,149 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from .helpers import EVENTS
+from ..client import Client
+from ..models import ClientEvent
+from ..params import ClientParams
+from ..parser import parse_line
+
+
+
+def test_ClientLine() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    line = parse_line(
+        ':nick!user@host'
+        ' PRIVMSG #chan'
+        ' :Hello world')
+
+
+    attrs = lattrs(line)
+
+    assert attrs == [
+        'original',
+        'tags',
+        'prefix',
+        'command',
+        'params',
+        'rawparams']
+
+
+    assert inrepr(
+        'parser.ClientLine object',
+        line)
+
+    assert isinstance(
+        hash(line), int)
+
+    assert instr(
+        'parser.ClientLine object',
+        line)
+
+
+    assert line.tags == {}
+    assert line.prefix == 'nick!user@host'
+    assert line.command == 'PRIVMSG'
+
+    assert line.params == [
+        '#chan', 'Hello world']
+
+    assert line.rawparams == (
+        '#chan :Hello world')
+
+
+
+def test_parse_line() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    line = parse_line(
+        r'@id=1;msg=a\sb\:c\\;flag'
+        ' :server 005 nick'
+        '  A=1 B :are supported')
+
+    assert line.tags == {
+        'id': '1',
+        'msg': 'a b;c\\',
+        'flag': ''}
+
+    assert line.prefix == 'server'
+    assert line.command == '005'
+
+    assert line.params == [
+        'nick', 'A=1', 'B',
+        'are supported']
+
+
+    line = parse_line('PING :1 2')
+
+    assert line.prefix is None
+    assert line.command == 'PING'
+    assert line.params == ['1 2']
+
+
+    line = parse_line('AWAY')
+
+    assert line.command == 'AWAY'
+    assert line.params == []
+    assert line.rawparams == ''
+
+
+    line = parse_line(
+        ':nick MODE #chan +o :')
+
+    assert line.params == [
+        '#chan', '+o', '']
+
+
+    line = parse_line('')
+
+    assert line.prefix is None
+    assert line.command is None
+    assert line.params == []
+
+
+
+def test_ClientEvent_parsed() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = ClientParams(
+        server='mocked',
+        nickname='ircbot',
+        username='ircbot',
+        realname='ircbot')
+
+    client = Client(params)
+
+    client._Client__mynick = 'ircbot'  # type: ignore
+
+
+    for event in EVENTS:
+
+        line = parse_line(event)
+
+        parsed = ClientEvent.parsed(
+            client, line)
+
+        _event = ClientEvent(
+            client, event)
+
+        assert parsed == _event
+
+        assert parsed.model_dump() == (
+            _event.model_dump())
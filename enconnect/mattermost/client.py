@@ -28,9 +28,13 @@ from websockets.sync.client import connect
 
 from .models import ClientEvent
 from ..utils import HTTPClient
+from ..utils import HTTPUpload
 from ..utils import dumlog
+from ..utils import http_client
+from ..utils.http import _FILES
 from ..utils.http import _METHODS
 from ..utils.http import _PAYLOAD
+from ..utils.upload import _SOURCE
 
 if TYPE_CHECKING:
     from .params import ClientParams
@@ -77,10 +81,9 @@ class Client:
         self.__logger = (
             logger or dumlog)
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params,
+            logger=self.__logger)
 
         self.__client = client
         self.__socket = None
@@ -445,13 +448,15 @@ class Client:
         return sort_dict(event)
 
 
-    def request(
+    def request(  # noqa: CFQ002
         self,
         method: _METHODS,
         path: str,
         params: Optional[_PAYLOAD] = None,
         json: Optional[_PAYLOAD] = None,
         *,
+        data: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
         timeout: Optional[int] = None,
     ) -> Response:
         """
@@ -461,6 +466,8 @@ class Client:
         :param path: Path for the location to upstream endpoint.
         :param params: Optional parameters included in request.
         :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param files: Optional file payload included in request.
         :param timeout: Timeout waiting for the server response.
             This will override the default client instantiated.
         :returns: Response from upstream request to the server.
@@ -479,11 +486,14 @@ class Client:
 
         address = f'{server}:{port}'
         tokey = 'Authorization'
+        ctkey = 'Content-Type'
         content = 'application/json'
 
         headers = {
-            tokey: f'Bearer {token}',
-            'Content-Type': content}
+            tokey: f'Bearer {token}'}
+
+        if files is NCNone:
+            headers[ctkey] = content
 
         location = (
             f'https://{address}'
@@ -507,4 +517,49 @@ class Client:
             params=params,
             headers=headers,
             json=json,
+            data=data,
+            files=files,
             timeout=timeout)
+
+
+    def file_upload(
+        self,
+        channel: str,
+        sources: list[_SOURCE],
+    ) -> list[str]:
+        """
+        Upload the files streamed from the sources into channel.
+
+        .. note::
+           Files are streamed from disk while request is sent,
+           avoiding reading the complete files into the memory.
+
+        :param channel: Unique identifier for the chat channel.
+        :param sources: Paths to files or the binary file objects.
+        :returns: Unique identifiers for the files on the server.
+        """
+
+        request = self.request
+
+        upload = HTTPUpload()
+
+        for source in sources:
+            upload.add(source)
+
+        data = {'channel_id': channel}
+
+        with upload:
+
+            response = request(
+                'post', 'files',
+                data=data,
+                files=upload)
+
+        (response
+         .raise_for_status())
+
+        fetch = response.json()
+
+        infos = fetch['file_infos']
+
+        return [x['id'] for x in infos]
@@ -9,15 +9,14 @@ is permitted, for more information consult the project license file.
 
 from typing import Annotated
 from typing import Any
-from typing import Optional
-
-from encommon.types import BaseModel
 
 from pydantic import Field
 
+from ..utils import HTTPParams
+
 
 
-class ClientParams(BaseModel, extra='forbid'):
+class ClientParams(HTTPParams, extra='forbid'):
     """
     Process and validate the class configuration parameters.
     """
@@ -46,23 +45,6 @@ class ClientParams(BaseModel, extra='forbid'):
               description='Parameter for the integration',
               min_length=1)]
 
-    timeout: Annotated[
-        int,
-        Field(30,
-              description='Timeout connecting to server',
-              ge=1, le=300)]
-
-    ssl_verify: Annotated[
-        bool,
-        Field(True,
-              description='Verify the ceritifcate valid')]
-
-    ssl_capem: Annotated[
-        Optional[str],
-        Field(None,
-              description='Verify the ceritifcate valid',
-              min_length=1)]
-
     queue_size: Annotated[
         int,
         Field(10000,
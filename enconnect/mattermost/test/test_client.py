@@ -7,15 +7,21 @@ is permitted, for more information consult the project license file.
 
 
 
+from json import dumps
+from pathlib import Path
 from unittest.mock import Mock
 
 from encommon.types import inrepr
 from encommon.types import instr
 from encommon.types import lattrs
 
+from httpx import Response
+
 from pytest import fixture
 from pytest import raises
 
+from respx import MockRouter
+
 from ..client import Client
 from ..params import ClientParams
 from ...fixtures import MTMClientSocket
@@ -129,3 +135,53 @@ def test_Client_connect(
     mqueue = client.mqueue
 
     assert mqueue.qsize() == 6
+
+
+
+def test_Client_file_upload(
+    client: Client,
+    tmp_path: Path,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting to service.
+    :param tmp_path: pytest object for temporal filesystem.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    path = tmp_path / 'bundle.txt'
+
+    path.write_bytes(b'content')
+
+    content = dumps({
+        'file_infos': [
+            {'id': 'fileid'}]})
+
+    route = (
+        respx_mock
+        .post(
+            'https://mocked'
+            '/api/v4/files')
+        .mock(Response(
+            status_code=201,
+            content=content)))
+
+
+    uniques = client.file_upload(
+        'chanid', [path])
+
+    assert uniques == ['fileid']
+
+
+    request = route.calls[0].request
+
+    content = request.read()
+
+    assert 'multipart' in (
+        request.headers[
+            'content-type'])
+
+    assert b'name="channel_id"' in content
+    assert b'filename="bundle.txt"' in content
@@ -19,6 +19,7 @@ from encommon.types import DictStrAny
 from httpx import Response
 
 from ..utils import HTTPClient
+from ..utils import http_client
 from ..utils.http import _METHODS
 from ..utils.http import _PAYLOAD
 
@@ -48,10 +49,9 @@ class Bridge:
 
         self.__params = params
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params,
+            f'philips/{params.server}/{params.token}')
 
         self.__client = client
 
@@ -158,7 +158,7 @@ class Bridge:
             f'https://{server}'
             f'/eventstream/clip/v2')
 
-        request = client.stream_block
+        request = client.events_block
 
 
         stream = request(
@@ -170,15 +170,7 @@ class Bridge:
 
         for event in stream:
 
-            if event is None:
-                continue  # NOCVR
-
-            event = event.strip()
-
-            if event[0:5] != 'data:':
-                continue
-
-            loaded = loads(event[6:])
+            loaded = loads(event.data)
 
             for _event in loaded:
 
@@ -215,7 +207,7 @@ class Bridge:
             f'https://{server}'
             f'/eventstream/clip/v2')
 
-        request = client.stream_async
+        request = client.events_async
 
 
         stream = request(
@@ -227,25 +219,17 @@ class Bridge:
 
         async for event in stream:
 
-            if event is None:
-                continue  # NOCVR
-
-            event = event.strip()
-
-            if event[0:5] != 'data:':
-                continue
-
-            loaded = loads(event[6:])
+            loaded = loads(event.data)
 
             for _event in loaded:
 
                 events = _event['data']
 
-                for event in events:
+                for item in events:
 
-                    assert isinstance(event, dict)
+                    assert isinstance(item, dict)
 
-                    yield event
+                    yield item
 
                     await asyncio.sleep(0)
 
@@ -48,12 +48,7 @@ class ByteStreamBlock(SyncByteStream):
 
         source = self.source
 
-        chunks = [
-            (f'data: {dumps(x)}\n'
-             .encode('utf-8'))
-            for x in source]
-
-        chunks.insert(0, b': hi\n')
+        chunks = _chunks(source)
 
         yield from chunks
 
@@ -88,12 +83,7 @@ class ByteStreamAsync(AsyncByteStream):
 
         source = self.source
 
-        chunks = [
-            (f'data: {dumps(x)}\n'
-             .encode('utf-8'))
-            for x in source]
-
-        chunks.insert(0, b': hi\n')
+        chunks = _chunks(source)
 
         await asyncio.sleep(0)
 
@@ -104,3 +94,37 @@ class ByteStreamAsync(AsyncByteStream):
             await asyncio.sleep(0)
 
         await asyncio.sleep(0)
+
+
+
+def _chunks(
+    source: LDictStrAny,
+) -> list[bytes]:
+    """
+    Return the chunks of event stream as would be from server.
+
+    .. note::
+       Events are split across chunks to exercise the parser,
+       similar to how they may be received over the network.
+
+    :param source: Events which will be included in stream.
+    :returns: Chunks of event stream as would be from server.
+    """
+
+    events = [
+        f'id: {index}:0\n'
+        f'data: {dumps(x)}\n\n'
+        for index, x
+        in enumerate(source)]
+
+    joined = (
+        ': hi\n\n'
+        + ''.join(events))
+
+    encoded = (
+        joined.encode('utf-8'))
+
+    return [
+        encoded[x:x + 64]
+        for x in range(
+            0, len(encoded), 64)]
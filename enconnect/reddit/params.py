@@ -9,25 +9,25 @@ is permitted, for more information consult the project license file.
 
 from typing import Annotated
 from typing import Any
-from typing import Optional
-
-from encommon.types import BaseModel
 
 from pydantic import Field
 
+from ..utils import HTTPCacheParams
+from ..utils import HTTPLimitParams
+from ..utils import HTTPParams
+
 
 
-class RedditParams(BaseModel, extra='forbid'):
+class RedditParams(
+    HTTPParams,
+    HTTPCacheParams,
+    HTTPLimitParams,
+    extra='forbid',
+):
     """
     Process and validate the class configuration parameters.
     """
 
-    timeout: Annotated[
-        int,
-        Field(30,
-              description='Timeout connecting to server',
-              ge=1, le=300)]
-
     username: Annotated[
         str,
         Field(...,
@@ -58,17 +58,6 @@ class RedditParams(BaseModel, extra='forbid'):
               description='Parameter for the integration',
               min_length=1)]
 
-    ssl_verify: Annotated[
-        bool,
-        Field(True,
-              description='Verify the ceritifcate valid')]
-
-    ssl_capem: Annotated[
-        Optional[str],
-        Field(None,
-              description='Verify the ceritifcate valid',
-              min_length=1)]
-
 
     def __init__(
         self,
@@ -16,6 +16,7 @@ from httpx import Response
 
 from .models import RedditListing
 from ..utils import HTTPClient
+from ..utils import http_client
 from ..utils.http import _HTTPAUTH
 from ..utils.http import _PAYLOAD
 
@@ -47,10 +48,9 @@ class Reddit:
 
         self.__params = params
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params,
+            f'reddit/{params.client}')
 
         self.__client = client
 
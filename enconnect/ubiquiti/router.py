@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 from httpx import Response
 
 from ..utils import HTTPClient
+from ..utils import http_client
 from ..utils.http import _METHODS
 from ..utils.http import _PAYLOAD
 
@@ -42,10 +43,8 @@ class Router:
 
         self.__params = params
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params)
 
         self.__client = client
 
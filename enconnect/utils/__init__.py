@@ -7,11 +7,35 @@ is permitted, for more information consult the project license file.
 
 
 
+from .cache import HTTPCache
+from .coalesce import HTTPCoalesce
 from .dummy import dumlog
 from .http import HTTPClient
+from .limiter import HTTPLimiter
+from .params import HTTPCacheParams
+from .params import HTTPLimitParams
+from .params import HTTPParams
+from .params import http_client
+from .retry import HTTPRetry
+from .stream import HTTPEvent
+from .stream import HTTPEventParser
+from .timing import HTTPTiming
+from .upload import HTTPUpload
 
 
 
 __all__ = [
+    'HTTPCache',
+    'HTTPCacheParams',
     'HTTPClient',
-    'dumlog']
+    'HTTPCoalesce',
+    'HTTPEvent',
+    'HTTPEventParser',
+    'HTTPLimitParams',
+    'HTTPLimiter',
+    'HTTPParams',
+    'HTTPRetry',
+    'HTTPTiming',
+    'HTTPUpload',
+    'dumlog',
+    'http_client']
@@ -0,0 +1,485 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+from httpx import Headers
+from httpx import Response
+from httpx import URL
+
+
+
+_HEADERS = dict[str, str]
+
+
+
+STRIPPED = [
+    'content-encoding',
+    'content-length',
+    'transfer-encoding']
+
+
+
+class HTTPCacheItem:
+    """
+    Contain the response and validators stored within cache.
+
+    :param response: Response from upstream request to the server.
+    """
+
+    status: int
+    headers: Headers
+    content: bytes
+    etag: Optional[str]
+    modified: Optional[str]
+    stored: float
+
+
+    def __init__(
+        self,
+        response: Response,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        headers = Headers(
+            response.headers)
+
+        for name in STRIPPED:
+            headers.pop(name, None)
+
+        self.status = response.status_code
+        self.headers = headers
+        self.content = response.content
+        self.etag = (
+            response.headers
+            .get('etag'))
+        self.modified = (
+            response.headers
+            .get('last-modified'))
+        self.stored = monotonic()
+
+
+    @property
+    def size(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return len(self.content)
+
+
+    def validators(
+        self,
+    ) -> _HEADERS:
+        """
+        Return the headers used for the conditional requests.
+
+        :returns: Headers used for the conditional requests.
+        """
+
+        headers: _HEADERS = {}
+
+        if self.etag is not None:
+            headers['If-None-Match'] = (
+                self.etag)
+
+        if self.modified is not None:
+            headers['If-Modified-Since'] = (
+                self.modified)
+
+        return headers
+
+
+    def refresh(
+        self,
+        response: Response,
+    ) -> None:
+        """
+        Update the validators and headers after revalidation.
+
+        :param response: Response from upstream request to the server.
+        """
+
+        headers = self.headers
+
+        for name, value in (
+                response.headers
+                .multi_items()):
+
+            if name in STRIPPED:
+                continue
+
+            headers[name] = value
+
+        self.etag = (
+            headers.get('etag'))
+        self.modified = (
+            headers.get('last-modified'))
+        self.stored = monotonic()
+
+
+    def response(
+        self,
+        original: Response,
+    ) -> Response:
+        """
+        Return the new response constructed from cached content.
+
+        :param original: Response returned from upstream server.
+        :returns: New response constructed from cached content.
+        """
+
+        request = original.request
+
+        return Response(
+            status_code=self.status,
+            headers=self.headers,
+            content=self.content,
+            request=request)
+
+
+
+class HTTPCache:
+    """
+    Store responses and validators used for conditional requests.
+
+    .. note::
+       Entries are evicted using least recently used ordering
+       after they expire or the size limitations are reached.
+
+    :param entries: Maximum number of responses within cache.
+    :param memory: Maximum bytes stored for response content.
+    :param expire: Seconds before entry within cache expires.
+    """
+
+    __entries: int
+    __memory: int
+    __expire: float
+
+    __items: OrderedDict[str, HTTPCacheItem]
+    __usage: int
+    __hits: int
+    __misses: int
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        entries: int = 1000,
+        memory: int = 67108864,
+        expire: float = 3600,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__entries = int(entries)
+        self.__memory = int(memory)
+        self.__expire = float(expire)
+
+        self.__items = OrderedDict()
+        self.__usage = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+
+
+    @property
+    def entries(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__entries
+
+
+    @property
+    def memory(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__memory
+
+
+    @property
+    def expire(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__expire
+
+
+    @property
+    def usage(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__usage
+
+
+    @property
+    def hits(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__hits
+
+
+    @property
+    def misses(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__misses
+
+
+    def __len__(
+        self,
+    ) -> int:
+        """
+        Return the number of responses stored within the cache.
+
+        :returns: Number of responses stored within the cache.
+        """
+
+        return len(self.__items)
+
+
+    def stats(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the statistics for the responses within the cache.
+
+        :returns: Statistics for the responses within the cache.
+        """
+
+        return {
+            'entries': len(self),
+            'usage': self.__usage,
+            'hits': self.__hits,
+            'misses': self.__misses}
+
+
+    @staticmethod
+    def keyed(
+        method: str,
+        location: str,
+        params: Optional[DictStrAny] = None,
+    ) -> str:
+        """
+        Return the unique key for the request within the cache.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :returns: Unique key for the request within the cache.
+        """
+
+        url = URL(
+            location,
+            params=params or None)
+
+        return f'{method.upper()} {url}'
+
+
+    def select(
+        self,
+        key: str,
+    ) -> Optional[HTTPCacheItem]:
+        """
+        Return the item from within cache when it is not expired.
+
+        :param key: Unique key for the request within the cache.
+        :returns: Item from within cache when it is not expired.
+        """
+
+        items = self.__items
+        expire = self.__expire
+
+        with self.__lock:
+
+            item = items.get(key)
+
+            if item is None:
+                return None
+
+            since = (
+                monotonic()
+                - item.stored)
+
+            if since > expire:
+                self.__delete(key)
+                return None
+
+            items.move_to_end(key)
+
+            return item
+
+
+    def update(
+        self,
+        key: str,
+        response: Response,
+        item: Optional[HTTPCacheItem] = None,
+    ) -> Response:
+        """
+        Update the cache and return the response for the caller.
+
+        .. note::
+           Responses that were not modified are replaced using
+           the content from item whose validators were sent.
+
+        :param key: Unique key for the request within the cache.
+        :param response: Response from upstream request to the server.
+        :param item: Item whose validators were sent to server.
+        :returns: Response from cache or upstream to the server.
+        """
+
+        status = response.status_code
+        headers = response.headers
+
+
+        if (status == 304
+                and item is not None):
+
+            with self.__lock:
+                self.__hits += 1
+
+            item.refresh(response)
+
+            self.insert(key, item)
+
+            return item.response(response)
+
+
+        with self.__lock:
+            self.__misses += 1
+
+
+        validated = (
+            'etag' in headers
+            or 'last-modified' in headers)
+
+        if status != 200 or not validated:
+            return response
+
+
+        item = HTTPCacheItem(response)
+
+        self.insert(key, item)
+
+        return response
+
+
+    def insert(
+        self,
+        key: str,
+        item: HTTPCacheItem,
+    ) -> None:
+        """
+        Insert the item into cache evicting others if necessary.
+
+        :param key: Unique key for the request within the cache.
+        :param item: Item that will be inserted into the cache.
+        """
+
+        items = self.__items
+        entries = self.__entries
+        memory = self.__memory
+
+        if item.size > memory:
+            return None
+
+
+        with self.__lock:
+
+            if key in items:
+                self.__delete(key)
+
+            items[key] = item
+
+            self.__usage += item.size
+
+
+            while (len(items) > entries
+                   or self.__usage > memory):
+
+                oldest = next(iter(items))
+
+                self.__delete(oldest)
+
+
+    def __delete(
+        self,
+        key: str,
+    ) -> None:
+        """
+        Remove the item from the cache and update memory usage.
+
+        :param key: Unique key for the request within the cache.
+        """
+
+        item = self.__items.pop(key)
+
+        self.__usage -= item.size
+
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Remove all of the items from the cache and reset usage.
+        """
+
+        with self.__lock:
+
+            self.__items.clear()
+
+            self.__usage = 0
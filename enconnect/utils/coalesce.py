@@ -0,0 +1,266 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from json import dumps
+from threading import Event
+from threading import Lock
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from httpx import Response
+
+
+
+IDEMPOTENT = ['get']
+
+
+
+class HTTPFlight:
+    """
+    Contain the state for request shared with other callers.
+    """
+
+    event: Event
+    response: Optional[Response]
+    reason: Optional[Exception]
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.event = Event()
+        self.response = None
+        self.reason = None
+
+
+    def result(
+        self,
+    ) -> Response:
+        """
+        Return the response after waiting for request to finish.
+
+        :returns: Response from upstream request to the server.
+        """
+
+        self.event.wait()
+
+        if self.reason is not None:
+            raise self.reason
+
+        assert self.response is not None
+
+        return self.response
+
+
+
+class HTTPCoalesce:
+    """
+    Share the response among callers for identical requests.
+
+    .. note::
+       Only idempotent requests without body are coalesced,
+       with the same response object returned to each caller.
+    """
+
+    __block: dict[str, HTTPFlight]
+    __async: dict[str, asyncio.Task[Response]]
+    __joined: int
+    __lock: Lock
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__block = {}
+        self.__async = {}
+        self.__joined = 0
+        self.__lock = Lock()
+
+
+    @property
+    def joined(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__joined
+
+
+    @property
+    def pending(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return (
+            len(self.__block)
+            + len(self.__async))
+
+
+    @staticmethod
+    def keyed(
+        method: str,
+        location: str,
+        **kwargs: Any,
+    ) -> Optional[str]:
+        """
+        Return the unique key for the request when coalescable.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param kwargs: Keyword arguments passed for downstream.
+        :returns: Unique key for the request when coalescable.
+        """
+
+        if method not in IDEMPOTENT:
+            return None
+
+        bodies = [
+            kwargs.get('json'),
+            kwargs.get('data'),
+            kwargs.get('files')]
+
+        if any(bodies):
+            return None
+
+        return dumps(
+            [method, location, kwargs],
+            sort_keys=True,
+            default=str)
+
+
+    def perform_block(
+        self,
+        key: str,
+        runner: Callable[[], Response],
+    ) -> Response:
+        """
+        Return the response performing or joining the request.
+
+        :param key: Unique key for the request when coalescable.
+        :param runner: Callable which will perform the request.
+        :returns: Response from upstream request to the server.
+        """
+
+        flights = self.__block
+
+
+        with self.__lock:
+
+            flight = flights.get(key)
+
+            if flight is not None:
+
+                self.__joined += 1
+
+                leader = False
+
+            else:
+
+                flight = HTTPFlight()
+
+                flights[key] = flight
+
+                leader = True
+
+
+        if leader is False:
+            return flight.result()
+
+
+        try:
+            flight.response = runner()
+
+        except Exception as reason:
+            flight.reason = reason
+
+        finally:
+
+            with self.__lock:
+                del flights[key]
+
+            if (flight.response is None
+                    and flight.reason is None):
+                flight.reason = ConnectionError()
+
+            flight.event.set()
+
+
+        return flight.result()
+
+
+    async def perform_async(
+        self,
+        key: str,
+        runner: Callable[[], Awaitable[Response]],
+    ) -> Response:
+        """
+        Return the response performing or joining the request.
+
+        :param key: Unique key for the request when coalescable.
+        :param runner: Callable which will perform the request.
+        :returns: Response from upstream request to the server.
+        """
+
+        tasks = self.__async
+
+        loop = asyncio.get_running_loop()
+
+        task = tasks.get(key)
+
+
+        if (task is not None
+                and task.get_loop() is loop):
+
+            self.__joined += 1
+
+            return await (
+                asyncio.shield(task))
+
+
+        async def _runner() -> Response:
+            return await runner()
+
+        task = loop.create_task(
+            _runner())
+
+        tasks[key] = task
+
+
+        def _finish(
+            task: asyncio.Task[Response],
+        ) -> None:
+
+            if tasks.get(key) is task:
+                del tasks[key]
+
+        task.add_done_callback(_finish)
+
+
+        return await (
+            asyncio.shield(task))
@@ -8,21 +8,45 @@ is permitted, for more information consult the project license file.
 
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from functools import lru_cache
+from functools import partial
 from ssl import SSLContext
+from ssl import create_default_context
+from threading import Lock
+from time import monotonic
 from time import sleep
+from typing import Any
 from typing import AsyncIterator
+from typing import Callable
 from typing import Iterator
 from typing import Literal
 from typing import Optional
+from typing import Self
 
 from encommon.types import DictStrAny
 
 from httpx import AsyncClient
 from httpx import Client as BlockClient
+from httpx import Limits
 from httpx import Response
+from httpx import TransportError
+from httpx import create_ssl_context
 from httpx._client import UseClientDefault
 
+from .cache import HTTPCache
+from .cache import HTTPCacheItem
+from .coalesce import HTTPCoalesce
+from .dummy import dumlog
+from .limiter import HTTPLimiter
+from .retry import HTTPRetry
+from .stream import HTTPEvent
+from .stream import HTTPEventParser
+from .timing import HTTPTiming
+from .timing import HTTPTracer
+from .upload import HTTPUpload
+
 
 
 _METHODS = Literal[
@@ -38,8 +62,21 @@ _HEADERS = dict[str, str]
 
 _PAYLOAD = DictStrAny
 
+_JSON = DictStrAny | list[Any]
+
+_FILES = DictStrAny | HTTPUpload
+
 _VERIFY = SSLContext | str | bool
 
+_REQUESTS = list[DictStrAny]
+
+_RESULTS = list[Response | Exception]
+
+_CACHED = tuple[
+    Optional[str],
+    Optional[HTTPCacheItem],
+    Optional[_HEADERS]]
+
 
 
 class HTTPClient:
@@ -54,6 +91,17 @@ class HTTPClient:
     :param retry: How many attempts are made with the server.
     :param backoff: Backoff backoff if encountered retries.
     :param states: Which states will be retried with backoff.
+    :param backmax: Maximum backoff between retry attempts.
+    :param deadline: Optional seconds spanning all attempts.
+    :param logger: Callback for logging the retry decisions.
+    :param connections: Maximum connections within the pool.
+    :param keepalive: Maximum idle connections kept in pool.
+    :param expiry: Seconds that idle connections are kept.
+    :param http2: Enable the multiplexing when using HTTP/2.
+    :param cache: Optional cache used for conditional requests.
+    :param coalesce: Share response among identical requests.
+    :param timing: Optional collector for timing of attempts.
+    :param limiter: Optional limiter for delaying the requests.
     """
 
     __timeout: int
@@ -61,12 +109,18 @@ class HTTPClient:
     __verify: _VERIFY
     __capem: Optional[str]
     __httpauth: Optional[_HTTPAUTH]
-    __retry: int
-    __backoff: float
-    __states: set[int]
+    __policy: HTTPRetry
+    __logger: Callable[..., None]
+    __limits: Limits
+    __http2: bool
+    __cache: Optional[HTTPCache]
+    __coalesce: Optional[HTTPCoalesce]
+    __timing: Optional[HTTPTiming]
+    __limiter: Optional[HTTPLimiter]
 
-    __client_block: BlockClient
-    __client_async: AsyncClient
+    __client_block: Optional[BlockClient]
+    __client_async: Optional[AsyncClient]
+    __lock: Lock
 
 
     def __init__(  # noqa: CFQ002
@@ -79,6 +133,17 @@ class HTTPClient:
         retry: int = 3,
         backoff: float = 3.0,
         states: set[int] = {429},
+        backmax: float = 60.0,
+        deadline: Optional[float] = None,
+        logger: Optional[Callable[..., None]] = None,
+        connections: int = 100,
+        keepalive: int = 20,
+        expiry: float = 5.0,
+        http2: bool = False,
+        cache: Optional[HTTPCache] = None,
+        coalesce: bool = False,
+        timing: Optional[HTTPTiming] = None,
+        limiter: Optional[HTTPLimiter] = None,
     ) -> None:
         """
         Initialize instance for class using provided parameters.
@@ -87,35 +152,42 @@ class HTTPClient:
         timeout = int(timeout)
         headers = deepcopy(headers)
         httpauth = deepcopy(httpauth)
-        retry = int(retry)
-        backoff = float(backoff)
-        states = set(states)
 
-        client_block = BlockClient(
-            timeout=timeout,
-            headers=headers or None,
-            auth=httpauth or None,
-            verify=capem or verify,
-            follow_redirects=True)
+        policy = HTTPRetry(
+            retry=retry,
+            backoff=backoff,
+            backmax=backmax,
+            states=states,
+            deadline=deadline)
 
-        client_async = AsyncClient(
-            timeout=timeout,
-            headers=headers or None,
-            auth=httpauth or None,
-            verify=capem or verify,
-            follow_redirects=True)
+        limits = Limits(
+            max_connections=connections,
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=expiry)
+
+        http2 = bool(http2)
 
         self.__timeout = timeout
         self.__headers = headers
         self.__verify = verify
         self.__capem = capem
         self.__httpauth = httpauth
-        self.__retry = retry
-        self.__backoff = backoff
-        self.__states = states
-
-        self.__client_block = client_block
-        self.__client_async = client_async
+        self.__policy = policy
+        self.__logger = (
+            logger or dumlog)
+        self.__limits = limits
+        self.__http2 = http2
+        self.__cache = cache
+        self.__coalesce = (
+            HTTPCoalesce()
+            if coalesce is True
+            else None)
+        self.__timing = timing
+        self.__limiter = limiter
+
+        self.__client_block = None
+        self.__client_async = None
+        self.__lock = Lock()
 
 
     @property
@@ -193,7 +265,7 @@ class HTTPClient:
         :returns: Value for the attribute from class instance.
         """
 
-        return self.__retry
+        return self.__policy.retry
 
 
     @property
@@ -206,7 +278,7 @@ class HTTPClient:
         :returns: Value for the attribute from class instance.
         """
 
-        return self.__backoff
+        return self.__policy.backoff
 
 
     @property
@@ -219,106 +291,376 @@ class HTTPClient:
         :returns: Value for the attribute from class instance.
         """
 
-        return self.__states
+        return self.__policy.states
 
 
     @property
-    def client_block(
+    def backmax(
         self,
-    ) -> BlockClient:
+    ) -> float:
         """
         Return the value for the attribute from class instance.
 
         :returns: Value for the attribute from class instance.
         """
 
-        return self.__client_block
+        return self.__policy.backmax
 
 
     @property
-    def client_async(
+    def deadline(
         self,
-    ) -> AsyncClient:
+    ) -> Optional[float]:
         """
         Return the value for the attribute from class instance.
 
         :returns: Value for the attribute from class instance.
         """
 
-        return self.__client_async
+        return self.__policy.deadline
 
 
-    def request_block(  # noqa: CFQ002
+    @property
+    def policy(
+        self,
+    ) -> HTTPRetry:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__policy
+
+
+    @property
+    def limits(
+        self,
+    ) -> Limits:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__limits
+
+
+    @property
+    def http2(
+        self,
+    ) -> bool:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__http2
+
+
+    @property
+    def cache(
+        self,
+    ) -> Optional[HTTPCache]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__cache
+
+
+    @property
+    def coalesce(
+        self,
+    ) -> Optional[HTTPCoalesce]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__coalesce
+
+
+    @property
+    def timing(
+        self,
+    ) -> Optional[HTTPTiming]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__timing
+
+
+    @property
+    def limiter(
+        self,
+    ) -> Optional[HTTPLimiter]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__limiter
+
+
+    @property
+    def client_block(
+        self,
+    ) -> BlockClient:
+        """
+        Return the client constructing it when not already done.
+
+        :returns: Client constructed from the underlying library.
+        """
+
+        with self.__lock:
+
+            client = self.__client_block
+
+            if client is None:
+
+                client = BlockClient(
+                    **self.__clientkw())
+
+                self.__client_block = client
+
+        return client
+
+
+    @property
+    def client_async(
+        self,
+    ) -> AsyncClient:
+        """
+        Return the client constructing it when not already done.
+
+        :returns: Client constructed from the underlying library.
+        """
+
+        with self.__lock:
+
+            client = self.__client_async
+
+            if client is None:
+
+                client = AsyncClient(
+                    **self.__clientkw())
+
+                self.__client_async = client
+
+        return client
+
+
+    def __clientkw(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the keyword arguments used constructing clients.
+
+        :returns: Keyword arguments used constructing clients.
+        """
+
+        verify = _sslcontext(
+            self.__verify,
+            self.__capem)
+
+        return {
+            'timeout': self.__timeout,
+            'headers': self.__headers or None,
+            'auth': self.__httpauth or None,
+            'verify': verify,
+            'limits': self.__limits,
+            'http2': self.__http2,
+            'follow_redirects': True}
+
+
+    def close(
+        self,
+    ) -> None:
+        """
+        Close the clients releasing the connections within pool.
+        """
+
+        with self.__lock:
+
+            client = self.__client_block
+
+            self.__client_block = None
+
+        if client is not None:
+            client.close()
+
+
+    async def aclose(
+        self,
+    ) -> None:
+        """
+        Close the clients releasing the connections within pool.
+        """
+
+        with self.__lock:
+
+            client = self.__client_async
+
+            self.__client_async = None
+
+        if client is not None:
+            await client.aclose()
+
+        self.close()
+
+        await asyncio.sleep(0)
+
+
+    def __enter__(
+        self,
+    ) -> Self:
+        """
+        Return the instance for use within the context manager.
+
+        :returns: Instance for use within the context manager.
+        """
+
+        return self
+
+
+    def __exit__(
+        self,
+        *args: object,
+    ) -> None:
+        """
+        Close the clients releasing the connections within pool.
+
+        :param args: Positional arguments passed for downstream.
+        """
+
+        self.close()
+
+
+    async def __aenter__(
+        self,
+    ) -> Self:
+        """
+        Return the instance for use within the context manager.
+
+        :returns: Instance for use within the context manager.
+        """
+
+        return self
+
+
+    async def __aexit__(
+        self,
+        *args: object,
+    ) -> None:
+        """
+        Close the clients releasing the connections within pool.
+
+        :param args: Positional arguments passed for downstream.
+        """
+
+        await self.aclose()
+
+
+    def poolstats(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the statistics for connection pool within clients.
+
+        .. note::
+           Clients not yet constructed are reported as empty.
+
+        :returns: Statistics for connection pool within clients.
+        """
+
+        return {
+            'block': _poolstats(
+                self.__client_block),
+            'async': _poolstats(
+                self.__client_async)}
+
+
+    def __deadline(
+        self,
+        started: float,
+        timeout: Optional[int] = None,
+    ) -> Optional[float]:
+        """
+        Return the timeout limited by remaining overall deadline.
+
+        :param started: Monotonic time when the first attempt began.
+        :param timeout: Timeout waiting for the server response.
+        :returns: Timeout limited by remaining overall deadline.
+        """
+
+        policy = self.__policy
+
+        remains = policy.remains(
+            monotonic() - started)
+
+        if remains is None:
+            return timeout
+
+        return min(
+            timeout or self.__timeout,
+            remains)
+
+
+    def __cached(
         self,
         method: _METHODS,
         location: str,
         params: Optional[_PAYLOAD] = None,
-        json: Optional[_PAYLOAD] = None,
-        *,
-        data: Optional[_PAYLOAD] = None,
-        files: Optional[_PAYLOAD] = None,
-        timeout: Optional[int] = None,
         headers: Optional[_HEADERS] = None,
-        httpauth: Optional[_HTTPAUTH] = None,
-    ) -> Response:
+    ) -> _CACHED:
         """
-        Return the response for upstream request to the server.
+        Return the key, item, and headers for conditional request.
 
         :param method: Method for operation with the API server.
         :param location: Location with path for server request.
         :param params: Optional parameters included in request.
-        :param json: Optional JSON payload included in request.
-        :param data: Optional dict payload included in request.
-        :param files: Optional file payload included in request.
-        :param timeout: Timeout waiting for the server response.
         :param headers: Optional headers to include in requests.
-        :param httpauth: Optional information for authentication.
-        :returns: Response from upstream request to the server.
+        :returns: Key, item, and headers for conditional request.
         """
 
-        retry = self.__retry
-        backoff = self.__backoff
-        states = self.__states
-
-        default = UseClientDefault()
-
-        client = self.__client_block
-        request = client.request
+        cache = self.__cache
 
+        if (cache is None
+                or method != 'get'):
+            return (None, None, headers)
 
-        for count in range(retry):
+        cachekey = cache.keyed(
+            method, location, params)
 
-            response = request(
-                method=method,
-                url=location,
-                headers=headers or None,
-                auth=httpauth or default,
-                timeout=timeout or default,
-                params=params or None,
-                data=data or None,
-                files=files or None,
-                json=json or None)
-
-            status = response.status_code
-
-            if status not in states:
-                break
+        cached = cache.select(cachekey)
 
-            sleep(backoff)
+        if cached is not None:
 
+            headers = {
+                **cached.validators(),
+                **(headers or {})}
 
-        return response
+        return (cachekey, cached, headers)
 
 
-    async def request_async(  # noqa: CFQ002
+    def request_block(  # noqa: CFQ002
         self,
         method: _METHODS,
         location: str,
         params: Optional[_PAYLOAD] = None,
-        json: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
         *,
         data: Optional[_PAYLOAD] = None,
-        files: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
         timeout: Optional[int] = None,
         headers: Optional[_HEADERS] = None,
         httpauth: Optional[_HTTPAUTH] = None,
@@ -338,54 +680,53 @@ class HTTPClient:
         :returns: Response from upstream request to the server.
         """
 
-        retry = self.__retry
-        backoff = self.__backoff
-        states = self.__states
-
-        default = UseClientDefault()
-
-        client = self.__client_async
-        request = client.request
-
-
-        for count in range(retry):
-
-            response = await request(
-                method=method,
-                url=location,
-                headers=headers or None,
-                auth=httpauth or default,
-                timeout=timeout or default,
-                params=params or None,
-                data=data or None,
-                files=files or None,
-                json=json or None)
-
-            status = response.status_code
-
-            if status not in states:
-                break
+        coalesce = self.__coalesce
 
-            await asyncio.sleep(backoff)
+        runner = partial(
+            self.__request_block,
+            method, location,
+            params, json,
+            data=data,
+            files=files,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth)
+
+        if coalesce is None:
+            return runner()
+
+        key = coalesce.keyed(
+            method, location,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth)
 
+        if key is None:
+            return runner()
 
-        await asyncio.sleep(0)
+        perform = (
+            coalesce.perform_block)
 
-        return response
+        return perform(key, runner)
 
 
-    def stream_block(  # noqa: CFQ002
+    def __request_block(  # noqa: CFQ002
         self,
         method: _METHODS,
         location: str,
         params: Optional[_PAYLOAD] = None,
-        json: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
         *,
         data: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
         timeout: Optional[int] = None,
         headers: Optional[_HEADERS] = None,
         httpauth: Optional[_HTTPAUTH] = None,
-    ) -> Iterator[str]:
+    ) -> Response:
         """
         Return the response for upstream request to the server.
 
@@ -394,43 +735,462 @@ class HTTPClient:
         :param params: Optional parameters included in request.
         :param json: Optional JSON payload included in request.
         :param data: Optional dict payload included in request.
+        :param files: Optional file payload included in request.
         :param timeout: Timeout waiting for the server response.
         :param headers: Optional headers to include in requests.
         :param httpauth: Optional information for authentication.
         :returns: Response from upstream request to the server.
         """
 
+        policy = self.__policy
+        logger = self.__logger
+        cache = self.__cache
+        timing = self.__timing
+        limiter = self.__limiter
+
         default = UseClientDefault()
 
-        client = self.__client_block
-        request = client.stream
+        client = self.client_block
+        request = client.request
 
 
-        stream = request(
-            method=method,
-            url=location,
-            headers=headers or None,
-            auth=httpauth or default,
-            timeout=timeout or default,
-            params=params or None,
-            data=data or None,
-            json=json or None)
+        cachekey, cached, headers = (
+            self.__cached(
+                method, location,
+                params, headers))
 
 
-        with stream as _stream:
+        started = monotonic()
 
-            lines = (
-                _stream.iter_lines())
+        for count in range(policy.retry):
 
-            yield from lines
+            limit = self.__deadline(
+                started, timeout)
 
+            reason: Optional[Exception] = None
 
-    async def stream_async(  # noqa: CFQ002
-        self,
-        method: _METHODS,
-        location: str,
+            if limiter is not None:
+                limiter.acquire_block(location)
+
+            tracer = HTTPTracer()
+
+            trace = {
+                'trace': tracer.trace_block}
+
+            try:
+
+                response = request(
+                    method=method,
+                    url=location,
+                    headers=headers or None,
+                    auth=httpauth or default,
+                    timeout=limit or default,
+                    params=params or None,
+                    data=data or None,
+                    files=_fields(files),
+                    json=json,
+                    extensions=(
+                        trace if timing
+                        else None))
+
+            except TransportError as exc:
+                reason = exc
+
+            outcome = reason or response
+
+            if timing is not None:
+                timing.observe(
+                    method, location,
+                    count, tracer, outcome)
+
+            waiting = policy.waiting(
+                count, outcome, method,
+                monotonic() - started)
+
+            if waiting is None:
+                break
+
+            source, wait = waiting
+
+            logger(
+                item='backoff',
+                method=method,
+                location=location,
+                status=getattr(
+                    outcome, 'status_code', None),
+                attempt=count,
+                source=source,
+                wait=wait)
+
+            if source in ['abandon', 'deadline']:
+                break
+
+            sleep(wait)
+
+
+        if reason is not None:
+            raise reason
+
+
+        if (cache is not None
+                and cachekey is not None):
+
+            response = cache.update(
+                cachekey, response, cached)
+
+
+        return response
+
+
+    async def request_async(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+    ) -> Response:
+        """
+        Return the response for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param files: Optional file payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :returns: Response from upstream request to the server.
+        """
+
+        coalesce = self.__coalesce
+
+        runner = partial(
+            self.__request_async,
+            method, location,
+            params, json,
+            data=data,
+            files=files,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth)
+
+        if coalesce is None:
+            return await runner()
+
+        key = coalesce.keyed(
+            method, location,
+            params=params,
+            json=json,
+            data=data,
+            files=files,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth)
+
+        if key is None:
+            return await runner()
+
+        perform = (
+            coalesce.perform_async)
+
+        return await perform(key, runner)
+
+
+    async def __request_async(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        files: Optional[_FILES] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+    ) -> Response:
+        """
+        Return the response for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param files: Optional file payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :returns: Response from upstream request to the server.
+        """
+
+        policy = self.__policy
+        logger = self.__logger
+        cache = self.__cache
+        timing = self.__timing
+        limiter = self.__limiter
+
+        default = UseClientDefault()
+
+        client = self.client_async
+        request = client.request
+
+
+        cachekey, cached, headers = (
+            self.__cached(
+                method, location,
+                params, headers))
+
+
+        started = monotonic()
+
+        for count in range(policy.retry):
+
+            limit = self.__deadline(
+                started, timeout)
+
+            reason: Optional[Exception] = None
+
+            if limiter is not None:
+                await limiter.acquire_async(location)
+
+            tracer = HTTPTracer()
+
+            trace = {
+                'trace': tracer.trace_async}
+
+            try:
+
+                response = await request(
+                    method=method,
+                    url=location,
+                    headers=headers or None,
+                    auth=httpauth or default,
+                    timeout=limit or default,
+                    params=params or None,
+                    data=data or None,
+                    files=_fields(files),
+                    json=json,
+                    extensions=(
+                        trace if timing
+                        else None))
+
+            except TransportError as exc:
+                reason = exc
+
+            outcome = reason or response
+
+            if timing is not None:
+                timing.observe(
+                    method, location,
+                    count, tracer, outcome)
+
+            waiting = policy.waiting(
+                count, outcome, method,
+                monotonic() - started)
+
+            if waiting is None:
+                break
+
+            source, wait = waiting
+
+            logger(
+                item='backoff',
+                method=method,
+                location=location,
+                status=getattr(
+                    outcome, 'status_code', None),
+                attempt=count,
+                source=source,
+                wait=wait)
+
+            if source in ['abandon', 'deadline']:
+                break
+
+            await asyncio.sleep(wait)
+
+
+        if reason is not None:
+            raise reason
+
+
+        if (cache is not None
+                and cachekey is not None):
+
+            response = cache.update(
+                cachekey, response, cached)
+
+
+        await asyncio.sleep(0)
+
+        return response
+
+
+    def request_many_block(
+        self,
+        requests: _REQUESTS,
+        concurrency: int = 10,
+    ) -> _RESULTS:
+        """
+        Return the responses for upstream requests to the server.
+
+        .. note::
+           Requests are performed using a pool of threads, with
+           exceptions returned in place of the failed response.
+
+        :param requests: Keyword arguments for each of requests.
+        :param concurrency: Maximum number of parallel requests.
+            This must be at least one or exception is raised.
+        :returns: Responses in same order as provided requests.
+        """
+
+        if concurrency < 1:
+            raise ValueError('concurrency')
+
+        request = self.request_block
+
+
+        def _request(
+            kwargs: DictStrAny,
+        ) -> Response | Exception:
+
+            try:
+                return request(**kwargs)
+
+            except Exception as reason:
+                return reason
+
+
+        workers = max(1, min(
+            concurrency,
+            len(requests)))
+
+        pool = ThreadPoolExecutor(
+            max_workers=workers)
+
+        with pool as _pool:
+
+            results = _pool.map(
+                _request, requests)
+
+            return list(results)
+
+
+    async def request_many_async(
+        self,
+        requests: _REQUESTS,
+        concurrency: int = 10,
+    ) -> _RESULTS:
+        """
+        Return the responses for upstream requests to the server.
+
+        .. note::
+           Requests are performed using the shared async client,
+           with exceptions returned in place of failed response.
+
+        :param requests: Keyword arguments for each of requests.
+        :param concurrency: Maximum number of parallel requests.
+            This must be at least one or exception is raised.
+        :returns: Responses in same order as provided requests.
+        """
+
+        if concurrency < 1:
+            raise ValueError('concurrency')
+
+        request = self.request_async
+
+        semaphore = (
+            asyncio.Semaphore(concurrency))
+
+
+        async def _request(
+            kwargs: DictStrAny,
+        ) -> Response | Exception:
+
+            async with semaphore:
+
+                try:
+                    return await request(**kwargs)
+
+                except Exception as reason:
+                    return reason
+
+
+        tasks = [
+            _request(x)
+            for x in requests]
+
+        results = await (
+            asyncio.gather(*tasks))
+
+        return list(results)
+
+
+    def stream_block(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
         params: Optional[_PAYLOAD] = None,
-        json: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+    ) -> Iterator[str]:
+        """
+        Return the response for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :returns: Response from upstream request to the server.
+        """
+
+        default = UseClientDefault()
+
+        client = self.client_block
+        request = client.stream
+
+
+        stream = request(
+            method=method,
+            url=location,
+            headers=headers or None,
+            auth=httpauth or default,
+            timeout=timeout or default,
+            params=params or None,
+            data=data or None,
+            json=json)
+
+
+        with stream as _stream:
+
+            lines = (
+                _stream.iter_lines())
+
+            yield from lines
+
+
+    async def stream_async(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
         *,
         data: Optional[_PAYLOAD] = None,
         timeout: Optional[int] = None,
@@ -453,7 +1213,7 @@ class HTTPClient:
 
         default = UseClientDefault()
 
-        client = self.__client_async
+        client = self.client_async
         request = client.stream
 
 
@@ -465,7 +1225,7 @@ class HTTPClient:
             timeout=timeout or default,
             params=params or None,
             data=data or None,
-            json=json or None)
+            json=json)
 
 
         async with stream as _stream:
@@ -475,3 +1235,309 @@ class HTTPClient:
 
             async for line in lines:
                 yield line
+
+
+    def chunks_block(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+        chunk: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Return the bytes for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :param chunk: Optional size for chunks yielded to caller,
+            otherwise they are yielded as they are received.
+        :returns: Bytes from upstream request to the server.
+        """
+
+        default = UseClientDefault()
+
+        client = self.client_block
+        request = client.stream
+
+
+        stream = request(
+            method=method,
+            url=location,
+            headers=headers or None,
+            auth=httpauth or default,
+            timeout=timeout or default,
+            params=params or None,
+            data=data or None,
+            json=json)
+
+
+        with stream as _stream:
+
+            chunks = (
+                _stream.iter_bytes(chunk))
+
+            yield from chunks
+
+
+    async def chunks_async(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+        chunk: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Return the bytes for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :param chunk: Optional size for chunks yielded to caller,
+            otherwise they are yielded as they are received.
+        :returns: Bytes from upstream request to the server.
+        """
+
+        default = UseClientDefault()
+
+        client = self.client_async
+        request = client.stream
+
+
+        stream = request(
+            method=method,
+            url=location,
+            headers=headers or None,
+            auth=httpauth or default,
+            timeout=timeout or default,
+            params=params or None,
+            data=data or None,
+            json=json)
+
+
+        async with stream as _stream:
+
+            chunks = (
+                _stream.aiter_bytes(chunk))
+
+            async for _chunk in chunks:
+                yield _chunk
+
+
+    def events_block(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+        chunk: Optional[int] = None,
+    ) -> Iterator[HTTPEvent]:
+        """
+        Return the events for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :param chunk: Optional size for chunks read from server.
+        :returns: Events from upstream request to the server.
+        """
+
+        parser = HTTPEventParser()
+
+        chunks = self.chunks_block(
+            method, location,
+            params, json,
+            data=data,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth,
+            chunk=chunk)
+
+        for _chunk in chunks:
+
+            events = (
+                parser.feed(_chunk))
+
+            yield from events
+
+
+    async def events_async(  # noqa: CFQ002
+        self,
+        method: _METHODS,
+        location: str,
+        params: Optional[_PAYLOAD] = None,
+        json: Optional[_JSON] = None,
+        *,
+        data: Optional[_PAYLOAD] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[_HEADERS] = None,
+        httpauth: Optional[_HTTPAUTH] = None,
+        chunk: Optional[int] = None,
+    ) -> AsyncIterator[HTTPEvent]:
+        """
+        Return the events for upstream request to the server.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param params: Optional parameters included in request.
+        :param json: Optional JSON payload included in request.
+        :param data: Optional dict payload included in request.
+        :param timeout: Timeout waiting for the server response.
+        :param headers: Optional headers to include in requests.
+        :param httpauth: Optional information for authentication.
+        :param chunk: Optional size for chunks read from server.
+        :returns: Events from upstream request to the server.
+        """
+
+        parser = HTTPEventParser()
+
+        chunks = self.chunks_async(
+            method, location,
+            params, json,
+            data=data,
+            timeout=timeout,
+            headers=headers,
+            httpauth=httpauth,
+            chunk=chunk)
+
+        async for _chunk in chunks:
+
+            events = (
+                parser.feed(_chunk))
+
+            for event in events:
+
+                yield event
+
+                await asyncio.sleep(0)
+
+
+
+@lru_cache
+def _sslcontext(
+    verify: _VERIFY,
+    capem: Optional[str] = None,
+) -> SSLContext:
+    """
+    Return the context shared between clients with same values.
+
+    .. note::
+       Constructing the context loads the certificate authority
+       bundle, which is expensive and repeated for each client.
+
+    :param verify: Require valid certificate from the server.
+    :param capem: Optional path to the certificate authority.
+    :returns: Context shared between clients with same values.
+    """
+
+    if isinstance(verify, SSLContext):
+        return verify
+
+    if isinstance(verify, str):
+        capem = capem or verify
+
+    if capem is not None:
+        return create_default_context(
+            cafile=capem)
+
+    return create_ssl_context(
+        verify=bool(verify))
+
+
+
+def _poolstats(
+    client: Optional[BlockClient | AsyncClient],
+) -> DictStrAny:
+    """
+    Return the statistics for connection pool within client.
+
+    .. note::
+       Internals of the transport are used when available,
+       which will not include those for mounted transports.
+
+    :param client: Client instance from the underlying library.
+    :returns: Statistics for connection pool within client.
+    """
+
+    transport = getattr(
+        client, '_transport', None)
+
+    pool = getattr(
+        transport, '_pool', None)
+
+    conns = list(getattr(
+        pool, 'connections', []))
+
+    reqs = list(getattr(
+        pool, '_requests', []))
+
+
+    idle = sum(
+        1 for x in conns
+        if x.is_idle())
+
+    closed = sum(
+        1 for x in conns
+        if x.is_closed())
+
+    queued = sum(
+        1 for x in reqs
+        if x.is_queued())
+
+
+    return {
+        'total': len(conns),
+        'active': (
+            len(conns)
+            - idle - closed),
+        'idle': idle,
+        'queued': queued}
+
+
+
+def _fields(
+    files: Optional[_FILES],
+) -> Optional[DictStrAny | list[Any]]:
+    """
+    Return the file payload in format expected by HTTP client.
+
+    :param files: Optional file payload included in request.
+    :returns: File payload in format expected by HTTP client.
+    """
+
+    if isinstance(files, HTTPUpload):
+        return files.fields()
+
+    return files or None
@@ -0,0 +1,406 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+from time import sleep
+from typing import Literal
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+from httpx import URL
+
+from .timing import templated
+
+
+
+_SCOPES = Literal['host', 'route']
+
+_RULES = dict[str, tuple[float, float]]
+
+
+
+_SHARED: dict[str, 'HTTPLimiter'] = {}
+
+_SHARED_LOCK = Lock()
+
+
+
+class HTTPBucket:
+    """
+    Contain the tokens available for requests with the server.
+
+    :param rate: Tokens added into the bucket for each second.
+    :param burst: Maximum tokens that are held within bucket.
+    """
+
+    rate: float
+    burst: float
+    tokens: float
+    updated: float
+
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert rate > 0
+        assert burst > 0
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = monotonic()
+
+
+    def reserve(
+        self,
+        cost: float = 1.0,
+    ) -> float:
+        """
+        Return the seconds to wait after reserving the tokens.
+
+        .. note::
+           Tokens are reserved immediately and may go negative,
+           which queues the callers in the order they arrived.
+
+        :param cost: Tokens that are consumed from the bucket.
+        :returns: Seconds to wait after reserving the tokens.
+        """
+
+        rate = self.rate
+        burst = self.burst
+
+        current = monotonic()
+
+        since = (
+            current
+            - self.updated)
+
+        self.tokens = min(
+            burst,
+            self.tokens
+            + since * rate)
+
+        self.updated = current
+
+        self.tokens -= cost
+
+        if self.tokens >= 0:
+            return 0.0
+
+        return -self.tokens / rate
+
+
+
+class HTTPLimiter:
+    """
+    Delay requests so that the published limits are honored.
+
+    .. note::
+       Same instance can be provided to multiple clients so that
+       their requests draw from the same buckets of the tokens.
+
+    :param rate: Tokens added into the bucket for each second.
+    :param burst: Maximum tokens that are held within bucket.
+    :param scope: Whether the key is the host or also route.
+    :param rules: Optional rate and burst overrides for keys.
+    """
+
+    __rate: float
+    __burst: float
+    __scope: _SCOPES
+    __rules: _RULES
+
+    __buckets: dict[str, HTTPBucket]
+    __waited: float
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        scope: _SCOPES = 'host',
+        rules: Optional[_RULES] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        assert rate > 0
+        assert burst > 0
+
+        self.__rate = float(rate)
+        self.__burst = float(burst)
+        self.__scope = scope
+        self.__rules = dict(rules or {})
+
+        self.__buckets = {}
+        self.__waited = 0.0
+        self.__lock = Lock()
+
+
+    @staticmethod
+    def shared(
+        unique: str,
+        rate: float,
+        burst: float = 1,
+        scope: _SCOPES = 'host',
+    ) -> 'HTTPLimiter':
+        """
+        Return the instance shared among those with same unique.
+
+        .. note::
+           Unique is hashed before stored, allowing credentials
+           to be used for sharing without keeping them in memory.
+           Sharing with different settings raises an exception,
+           rather than one silently using the others settings.
+
+        :param unique: Unique value like credentials for sharing.
+        :param rate: Tokens added into the bucket for each second.
+        :param burst: Maximum tokens that are held within bucket.
+        :param scope: Whether the key is the host or also route.
+        :returns: Instance shared among those with same unique.
+        """
+
+        digest = sha256(
+            unique.encode('utf-8'))
+
+        key = digest.hexdigest()
+
+        with _SHARED_LOCK:
+
+            limiter = _SHARED.get(key)
+
+            if limiter is None:
+
+                limiter = HTTPLimiter(
+                    rate, burst, scope)
+
+                _SHARED[key] = limiter
+
+        settings = (
+            limiter.rate,
+            limiter.burst,
+            limiter.scope)
+
+        if settings != (
+                float(rate),
+                float(burst),
+                scope):
+            raise ValueError('settings')
+
+        return limiter
+
+
+    @property
+    def rate(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__rate
+
+
+    @property
+    def burst(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__burst
+
+
+    @property
+    def scope(
+        self,
+    ) -> _SCOPES:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__scope
+
+
+    @property
+    def rules(
+        self,
+    ) -> _RULES:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return dict(self.__rules)
+
+
+    @property
+    def waited(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__waited
+
+
+    def keyed(
+        self,
+        location: str,
+    ) -> str:
+        """
+        Return the unique key for the bucket used with request.
+
+        .. note::
+           Rules are matched first using the route and then the
+           host, so a single route may be limited more strictly.
+
+        :param location: Location with path for server request.
+        :returns: Unique key for the bucket used with request.
+        """
+
+        rules = self.__rules
+
+        host = URL(location).host
+
+        route = (
+            host
+            + templated(location))
+
+        if route in rules:
+            return route
+
+        if (self.__scope == 'route'
+                and host not in rules):
+            return route
+
+        return host
+
+
+    def reserve(
+        self,
+        location: str,
+        cost: float = 1.0,
+    ) -> float:
+        """
+        Return the seconds to wait after reserving the tokens.
+
+        :param location: Location with path for server request.
+        :param cost: Tokens that are consumed from the bucket.
+        :returns: Seconds to wait after reserving the tokens.
+        """
+
+        buckets = self.__buckets
+        rules = self.__rules
+
+        key = self.keyed(location)
+
+        with self.__lock:
+
+            bucket = buckets.get(key)
+
+            if bucket is None:
+
+                rate, burst = rules.get(
+                    key, (self.__rate,
+                          self.__burst))
+
+                bucket = HTTPBucket(
+                    rate, burst)
+
+                buckets[key] = bucket
+
+            wait = bucket.reserve(cost)
+
+            self.__waited += wait
+
+        return wait
+
+
+    def acquire_block(
+        self,
+        location: str,
+        cost: float = 1.0,
+    ) -> float:
+        """
+        Wait until the tokens are available for the request.
+
+        :param location: Location with path for server request.
+        :param cost: Tokens that are consumed from the bucket.
+        :returns: Seconds waited before tokens were available.
+        """
+
+        wait = self.reserve(
+            location, cost)
+
+        if wait > 0:
+            sleep(wait)
+
+        return wait
+
+
+    async def acquire_async(
+        self,
+        location: str,
+        cost: float = 1.0,
+    ) -> float:
+        """
+        Wait until the tokens are available for the request.
+
+        :param location: Location with path for server request.
+        :param cost: Tokens that are consumed from the bucket.
+        :returns: Seconds waited before tokens were available.
+        """
+
+        wait = self.reserve(
+            location, cost)
+
+        await asyncio.sleep(wait)
+
+        return wait
+
+
+    def stats(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the tokens currently available within the buckets.
+
+        :returns: Tokens currently available within the buckets.
+        """
+
+        with self.__lock:
+
+            return {
+                key: value.tokens
+                for key, value in
+                self.__buckets.items()}
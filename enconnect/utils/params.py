@@ -0,0 +1,236 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from typing import Annotated
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from encommon.types import BaseModel
+
+from pydantic import Field
+
+from .cache import HTTPCache
+from .http import HTTPClient
+from .limiter import HTTPLimiter
+from .timing import HTTPTiming
+
+
+
+class HTTPParams(BaseModel, extra='forbid'):
+    """
+    Process and validate the common HTTP client parameters.
+
+    .. note::
+       Inherited by parameters for integrations using the HTTP
+       client, constructed from these using the http_client.
+    """
+
+    timeout: Annotated[
+        int,
+        Field(30,
+              description='Timeout connecting to server',
+              ge=1, le=300)]
+
+    ssl_verify: Annotated[
+        bool,
+        Field(True,
+              description='Verify the ceritifcate valid')]
+
+    ssl_capem: Annotated[
+        Optional[str],
+        Field(None,
+              description='Verify the ceritifcate valid',
+              min_length=1)]
+
+    pool_connections: Annotated[
+        int,
+        Field(100,
+              description='Maximum connections in the pool',
+              ge=1, le=1000)]
+
+    pool_keepalive: Annotated[
+        int,
+        Field(20,
+              description='Maximum idle connections in pool',
+              ge=0, le=1000)]
+
+    pool_expiry: Annotated[
+        float,
+        Field(5.0,
+              description='Seconds idle connection is kept',
+              ge=0, le=3600)]
+
+    http2: Annotated[
+        bool,
+        Field(False,
+              description='Enable multiplexing with HTTP/2')]
+
+    coalesce: Annotated[
+        bool,
+        Field(False,
+              description='Share responses of same requests')]
+
+    deadline: Annotated[
+        Optional[float],
+        Field(None,
+              description='Seconds across all the attempts',
+              ge=1, le=3600)]
+
+    timing: Annotated[
+        bool,
+        Field(False,
+              description='Collect timing for the requests')]
+
+
+    def __init__(
+        self,
+        /,
+        **data: Any,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        super().__init__(**data)
+
+
+
+class HTTPCacheParams(BaseModel, extra='forbid'):
+    """
+    Process and validate the conditional cache parameters.
+    """
+
+    cache_enable: Annotated[
+        bool,
+        Field(False,
+              description='Enable conditional request cache')]
+
+    cache_expire: Annotated[
+        int,
+        Field(3600,
+              description='Seconds responses kept in cache',
+              ge=1, le=86400)]
+
+    cache_entries: Annotated[
+        int,
+        Field(1000,
+              description='Maximum responses kept in cache',
+              ge=1, le=1000000)]
+
+    cache_memory: Annotated[
+        int,
+        Field(67108864,
+              description='Maximum bytes of cached content',
+              ge=1024, le=17179869184)]
+
+
+    def __init__(
+        self,
+        /,
+        **data: Any,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        super().__init__(**data)
+
+
+
+class HTTPLimitParams(BaseModel, extra='forbid'):
+    """
+    Process and validate the shared rate limiter parameters.
+    """
+
+    limit_rate: Annotated[
+        Optional[float],
+        Field(None,
+              description='Requests permitted each second',
+              gt=0, le=10000)]
+
+    limit_burst: Annotated[
+        float,
+        Field(1,
+              description='Requests permitted within burst',
+              ge=1, le=100000)]
+
+
+    def __init__(
+        self,
+        /,
+        **data: Any,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        super().__init__(**data)
+
+
+
+def http_client(
+    params: HTTPParams,
+    unique: Optional[str] = None,
+    logger: Optional[Callable[..., None]] = None,
+) -> HTTPClient:
+    """
+    Return the client constructed using the common parameters.
+
+    .. note::
+       Cache and limiter are constructed when parameters also
+       inherit from those models and the feature is enabled.
+
+    :param params: Parameters used to construct the client.
+    :param unique: Unique value for sharing the rate limiter.
+    :param logger: Callback for logging the related events.
+    :returns: Client constructed using the common parameters.
+    """
+
+    cache: Optional[HTTPCache] = None
+    limiter: Optional[HTTPLimiter] = None
+
+
+    if (isinstance(params, HTTPCacheParams)
+            and params.cache_enable):
+
+        cache = HTTPCache(
+            entries=params.cache_entries,
+            memory=params.cache_memory,
+            expire=params.cache_expire)
+
+
+    if (isinstance(params, HTTPLimitParams)
+            and params.limit_rate):
+
+        assert unique is not None
+
+        limiter = HTTPLimiter.shared(
+            unique,
+            rate=params.limit_rate,
+            burst=params.limit_burst)
+
+
+    return HTTPClient(
+        timeout=params.timeout,
+        verify=params.ssl_verify,
+        capem=params.ssl_capem,
+        connections=params.pool_connections,
+        keepalive=params.pool_keepalive,
+        expiry=params.pool_expiry,
+        http2=params.http2,
+        cache=cache,
+        deadline=params.deadline,
+        logger=logger,
+        limiter=limiter,
+        timing=(
+            HTTPTiming()
+            if params.timing
+            else None),
+        coalesce=params.coalesce)
@@ -0,0 +1,418 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from email.utils import parsedate_to_datetime
+from random import random
+from time import time
+from typing import Optional
+
+from httpx import Response
+from httpx import TransportError
+
+
+
+_WAITING = tuple[str, float]
+
+_OUTCOME = Response | Exception
+
+
+
+HINTED = [
+    'retry-after',
+    'x-ratelimit-reset-after',
+    'ratelimit-reset',
+    'x-ratelimit-reset']
+
+EPOCHED = 1_000_000_000
+
+FAILURES = {500, 502, 503, 504}
+
+IDEMPOTENT = {'delete', 'get', 'put'}
+
+
+
+class HTTPRetry:
+    """
+    Determine whether and how long to wait between attempts.
+
+    .. note::
+       Headers returned by the server are honored first, with
+       exponential backoff and jitter used when there are none.
+       Server failures and transport errors are only retried for
+       the idempotent methods, as the request may have applied.
+
+    :param retry: How many attempts are made with the server.
+    :param backoff: Backoff backoff if encountered retries.
+    :param backmax: Maximum backoff between retry attempts.
+    :param jitter: Portion of the backoff that is randomized.
+    :param states: Which states will be retried with backoff.
+    :param failures: Which server failures will be retried.
+    :param methods: Which methods are considered idempotent.
+    :param deadline: Optional seconds spanning all attempts.
+    """
+
+    __retry: int
+    __backoff: float
+    __backmax: float
+    __jitter: float
+    __states: set[int]
+    __failures: set[int]
+    __methods: set[str]
+    __deadline: Optional[float]
+
+
+    def __init__(  # noqa: CFQ002
+        self,
+        retry: int = 3,
+        backoff: float = 3.0,
+        backmax: float = 60.0,
+        jitter: float = 0.5,
+        states: set[int] = {429},
+        failures: set[int] = FAILURES,
+        methods: set[str] = IDEMPOTENT,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        retry = int(retry)
+        backoff = float(backoff)
+        backmax = float(backmax)
+        jitter = float(jitter)
+        states = set(states)
+        failures = set(failures)
+        methods = {
+            x.lower() for x
+            in methods}
+
+        if deadline is not None:
+            deadline = float(deadline)
+
+        assert 0 <= jitter <= 1
+
+        self.__retry = retry
+        self.__backoff = backoff
+        self.__backmax = backmax
+        self.__jitter = jitter
+        self.__states = states
+        self.__failures = failures
+        self.__methods = methods
+        self.__deadline = deadline
+
+
+    @property
+    def retry(
+        self,
+    ) -> int:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__retry
+
+
+    @property
+    def backoff(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__backoff
+
+
+    @property
+    def backmax(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__backmax
+
+
+    @property
+    def jitter(
+        self,
+    ) -> float:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__jitter
+
+
+    @property
+    def states(
+        self,
+    ) -> set[int]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__states
+
+
+    @property
+    def failures(
+        self,
+    ) -> set[int]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__failures
+
+
+    @property
+    def methods(
+        self,
+    ) -> set[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__methods
+
+
+    @property
+    def deadline(
+        self,
+    ) -> Optional[float]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__deadline
+
+
+    def remains(
+        self,
+        elapsed: float,
+    ) -> Optional[float]:
+        """
+        Return the seconds remaining within the overall deadline.
+
+        :param elapsed: Seconds elapsed since the first attempt.
+        :returns: Seconds remaining within the overall deadline.
+        """
+
+        deadline = self.__deadline
+
+        if deadline is None:
+            return None
+
+        return max(
+            deadline - elapsed, 0.0)
+
+
+    def retryable(
+        self,
+        method: str,
+        outcome: _OUTCOME,
+    ) -> bool:
+        """
+        Return the boolean indicating whether retry is permitted.
+
+        :param method: Method for operation with the API server.
+        :param outcome: Response or exception from the attempt.
+        :returns: Boolean indicating whether retry is permitted.
+        """
+
+        states = self.__states
+        failures = self.__failures
+        methods = self.__methods
+
+        idempotent = (
+            method.lower()
+            in methods)
+
+        if isinstance(outcome, TransportError):
+            return idempotent
+
+        status = getattr(
+            outcome, 'status_code', None)
+
+        return (
+            status in states
+            or (idempotent
+                and status in failures))
+
+
+    def hinted(
+        self,
+        response: Response,
+    ) -> Optional[_WAITING]:
+        """
+        Return the wait duration when provided by the server.
+
+        :param response: Response from upstream request to the server.
+        :returns: Header name and the seconds to wait for retry.
+        """
+
+        headers = response.headers
+
+
+        for name in HINTED:
+
+            value = headers.get(name)
+
+            if value is None:
+                continue
+
+            wait = _seconds(value)
+
+            if wait is None:
+                continue
+
+            return (name, wait)
+
+
+        return None
+
+
+    def expected(
+        self,
+        attempt: int,
+    ) -> float:
+        """
+        Return the exponential backoff with the jitter applied.
+
+        :param attempt: Which attempt was made with the server.
+        :returns: Seconds to wait before making next attempt.
+        """
+
+        backoff = self.__backoff
+        backmax = self.__backmax
+        jitter = self.__jitter
+
+        delay = min(
+            backmax,
+            backoff * 2.0 ** attempt)
+
+        spread = (
+            delay * jitter
+            * random())  # noqa: S311
+
+        return delay - spread
+
+
+    def waiting(  # noqa: CFQ004
+        self,
+        attempt: int,
+        outcome: _OUTCOME,
+        method: str = 'get',
+        elapsed: float = 0.0,
+    ) -> Optional[_WAITING]:
+        """
+        Return the wait duration when another attempt is needed.
+
+        .. note::
+           When the server hints a wait longer than the maximum
+           the source is ``abandon`` and no retry should occur,
+           and the source is ``deadline`` when waiting would go
+           beyond the overall deadline spanning all attempts.
+
+        :param attempt: Which attempt was made with the server.
+        :param outcome: Response or exception from the attempt.
+        :param method: Method for operation with the API server.
+        :param elapsed: Seconds elapsed since the first attempt.
+        :returns: Source of decision and seconds before retry.
+        """
+
+        retry = self.__retry
+        backmax = self.__backmax
+
+        if not self.retryable(method, outcome):
+            return None
+
+        if attempt + 1 >= retry:
+            return None
+
+
+        hinted = (
+            self.hinted(outcome)
+            if isinstance(outcome, Response)
+            else None)
+
+        if hinted is None:
+            hinted = (
+                'backoff',
+                self.expected(attempt))
+
+        elif hinted[1] > backmax:
+            return ('abandon', hinted[1])
+
+
+        remains = self.remains(elapsed)
+
+        if (remains is not None
+                and hinted[1] >= remains):
+            return ('deadline', hinted[1])
+
+        return hinted
+
+
+
+def _seconds(
+    value: str,
+) -> Optional[float]:
+    """
+    Return the seconds parsed from the rate limiting header.
+
+    .. note::
+       Values are either delta seconds, epoch timestamp, or
+       the HTTP date format as permitted with Retry-After.
+
+    :param value: Value for the header returned by server.
+    :returns: Seconds parsed from the rate limiting header.
+    """
+
+    value = value.strip()
+
+    try:
+        seconds = float(value)
+
+    except ValueError:
+
+        try:
+            parsed = (
+                parsedate_to_datetime(value)
+                .timestamp())
+
+        except (TypeError, ValueError):
+            return None
+
+        seconds = parsed - time()
+
+    else:
+
+        if seconds >= EPOCHED:
+            seconds -= time()
+
+    return max(seconds, 0.0)
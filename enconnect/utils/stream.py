@@ -0,0 +1,223 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from typing import Optional
+
+
+
+class HTTPEvent:
+    """
+    Contain the fields from event received in the event stream.
+
+    :param data: Data from the event with lines joined together.
+    :param event: Type of the event as provided by the server.
+    :param ident: Last identifier for event provided by server.
+    :param retry: Reconnection time in milliseconds from server.
+    """
+
+    data: str
+    event: str
+    ident: Optional[str]
+    retry: Optional[int]
+
+
+    def __init__(
+        self,
+        data: str,
+        event: str = 'message',
+        ident: Optional[str] = None,
+        retry: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.data = data
+        self.event = event
+        self.ident = ident
+        self.retry = retry
+
+
+
+class HTTPEventParser:
+    """
+    Parse the chunks of bytes into events as they are received.
+
+    .. note::
+       Parsing follows the specification for server-sent events,
+       with partial lines retained until remainder is received.
+       Lines are split on line feed with optional carriage return.
+    """
+
+    __buffer: bytearray
+    __data: list[bytes]
+    __event: Optional[str]
+    __ident: Optional[str]
+    __retry: Optional[int]
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__buffer = bytearray()
+        self.__data = []
+        self.__event = None
+        self.__ident = None
+        self.__retry = None
+
+
+    @property
+    def ident(
+        self,
+    ) -> Optional[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__ident
+
+
+    @property
+    def retry(
+        self,
+    ) -> Optional[int]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__retry
+
+
+    def feed(
+        self,
+        chunk: bytes,
+    ) -> list[HTTPEvent]:
+        """
+        Return the events completed using the provided bytes.
+
+        :param chunk: Bytes received from the upstream server.
+        :returns: Events completed using the provided bytes.
+        """
+
+        buffer = self.__buffer
+        events: list[HTTPEvent] = []
+
+        buffer.extend(chunk)
+
+        start = 0
+
+
+        while True:
+
+            index = buffer.find(
+                b'\n', start)
+
+            if index == -1:
+                break
+
+            finish = index
+
+            if (finish > start
+                    and buffer[finish - 1] == 13):
+                finish -= 1
+
+            event = self.__line(
+                bytes(buffer[start:finish]))
+
+            if event is not None:
+                events.append(event)
+
+            start = index + 1
+
+
+        del buffer[:start]
+
+        return events
+
+
+    def __line(
+        self,
+        line: bytes,
+    ) -> Optional[HTTPEvent]:
+        """
+        Process the line updating the event currently pending.
+
+        :param line: Line from the stream without the separator.
+        :returns: Event when the line completes pending event.
+        """
+
+        if not line:
+            return self.__dispatch()
+
+        if line[0] == 58:
+            return None
+
+
+        field, _, value = (
+            line.partition(b':'))
+
+        if value[:1] == b' ':
+            value = value[1:]
+
+
+        if field == b'data':
+            self.__data.append(value)
+
+        elif field == b'event':
+            self.__event = (
+                value.decode('utf-8'))
+
+        elif (field == b'id'
+                and b'\0' not in value):
+            self.__ident = (
+                value.decode('utf-8'))
+
+        elif (field == b'retry'
+                and value.isdigit()):
+            self.__retry = int(value)
+
+
+        return None
+
+
+    def __dispatch(
+        self,
+    ) -> Optional[HTTPEvent]:
+        """
+        Return the event pending and reset for the next event.
+
+        :returns: Event pending when data was received for it.
+        """
+
+        data = self.__data
+        event = self.__event
+
+        self.__data = []
+        self.__event = None
+
+        if not data:
+            return None
+
+        joined = (
+            b'\n'.join(data)
+            .decode('utf-8'))
+
+        return HTTPEvent(
+            data=joined,
+            event=event or 'message',
+            ident=self.__ident,
+            retry=self.__retry)
@@ -0,0 +1,268 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Request
+from httpx import Response
+
+from pytest import fixture
+
+from ..cache import HTTPCache
+
+
+
+LOCATION = 'https://enasis.net'
+
+
+
+@fixture
+def cache() -> HTTPCache:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    return HTTPCache(
+        entries=2,
+        memory=10)
+
+
+
+def _response(
+    status: int,
+    content: bytes = b'',
+    etag: str = '"mocked"',
+) -> Response:
+    """
+    Construct the response for use in the downstream tests.
+
+    :param status: Status code included within the response.
+    :param content: Content included within the response.
+    :param etag: Value for the entity tag header in response.
+    :returns: Newly constructed response for use in tests.
+    """
+
+    request = Request(
+        'GET', LOCATION)
+
+    return Response(
+        status,
+        content=content,
+        headers={'ETag': etag},
+        request=request)
+
+
+
+def test_HTTPCache(
+    cache: HTTPCache,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param cache: Class instance for caching the responses.
+    """
+
+
+    attrs = lattrs(cache)
+
+    assert attrs == [
+        '_HTTPCache__entries',
+        '_HTTPCache__memory',
+        '_HTTPCache__expire',
+        '_HTTPCache__items',
+        '_HTTPCache__usage',
+        '_HTTPCache__hits',
+        '_HTTPCache__misses',
+        '_HTTPCache__lock']
+
+
+    assert inrepr(
+        'cache.HTTPCache object',
+        cache)
+
+    assert isinstance(
+        hash(cache), int)
+
+    assert instr(
+        'cache.HTTPCache object',
+        cache)
+
+
+    assert cache.entries == 2
+
+    assert cache.memory == 10
+
+    assert cache.expire == 3600
+
+    assert cache.usage == 0
+
+    assert cache.hits == 0
+
+    assert cache.misses == 0
+
+    assert len(cache) == 0
+
+
+
+def test_HTTPCache_update(
+    cache: HTTPCache,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param cache: Class instance for caching the responses.
+    """
+
+    key = cache.keyed(
+        'get', LOCATION,
+        {'foo': 'bar'})
+
+    assert key == (
+        'GET https://enasis.net'
+        '?foo=bar')
+
+    assert not cache.select(key)
+
+
+    response = cache.update(
+        key, _response(
+            200, b'content'))
+
+    assert response.content == b'content'
+
+    item = cache.select(key)
+
+    assert item is not None
+
+    assert item.validators() == {
+        'If-None-Match': '"mocked"'}
+
+    stored = item.stored
+
+
+    response = cache.update(
+        key, _response(
+            304, etag='"update"'),
+        item)
+
+    assert response.status_code == 200
+
+    assert response.content == b'content'
+
+    assert item.stored > stored
+
+    assert item.validators() == {
+        'If-None-Match': '"update"'}
+
+
+    response = cache.update(
+        'missing', _response(304))
+
+    assert response.status_code == 304
+
+
+    assert cache.stats() == {
+        'entries': 1,
+        'usage': 7,
+        'hits': 1,
+        'misses': 2}
+
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+    assert cache.usage == 0
+
+
+
+def test_HTTPCache_evict(
+    cache: HTTPCache,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param cache: Class instance for caching the responses.
+    """
+
+    update = cache.update
+
+
+    update('one', _response(200, b'1'))
+    update('two', _response(200, b'2'))
+
+    assert cache.select('one')
+
+    update('six', _response(200, b'6'))
+
+    assert len(cache) == 2
+
+    assert not cache.select('two')
+
+
+    update('big', _response(200, b'x' * 11))
+
+    assert not cache.select('big')
+
+
+    update('many', _response(200, b'x' * 10))
+
+    assert len(cache) == 1
+
+    assert cache.usage == 10
+
+
+    update('many', _response(200, b'x' * 5))
+
+    assert cache.usage == 5
+
+
+
+def test_HTTPCache_expire() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = HTTPCache(expire=0)
+
+    cache.update(
+        'key', _response(
+            200, b'content'))
+
+    assert len(cache) == 1
+
+    assert not cache.select('key')
+
+    assert len(cache) == 0
+
+
+    cache = HTTPCache(expire=3600)
+
+    cache.update(
+        'key', _response(
+            200, b'content'))
+
+    item = cache.select('key')
+
+    assert item is not None
+
+    cache.clear()
+
+    response = cache.update(
+        'key', _response(304),
+        item)
+
+    assert response.content == (
+        b'content')
+
+    assert cache.select('key')
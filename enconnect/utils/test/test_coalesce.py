@@ -0,0 +1,224 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from threading import Event
+from threading import Thread
+from time import sleep as block_sleep
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Response
+
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+
+from ..coalesce import HTTPCoalesce
+
+
+
+@fixture
+def coalesce() -> HTTPCoalesce:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    return HTTPCoalesce()
+
+
+
+def test_HTTPCoalesce(
+    coalesce: HTTPCoalesce,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param coalesce: Class instance for sharing the responses.
+    """
+
+
+    attrs = lattrs(coalesce)
+
+    assert attrs == [
+        '_HTTPCoalesce__block',
+        '_HTTPCoalesce__async',
+        '_HTTPCoalesce__joined',
+        '_HTTPCoalesce__lock']
+
+
+    assert inrepr(
+        'coalesce.HTTPCoalesce object',
+        coalesce)
+
+    assert isinstance(
+        hash(coalesce), int)
+
+    assert instr(
+        'coalesce.HTTPCoalesce object',
+        coalesce)
+
+
+    assert coalesce.joined == 0
+
+    assert coalesce.pending == 0
+
+
+
+def test_HTTPCoalesce_keyed(
+    coalesce: HTTPCoalesce,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param coalesce: Class instance for sharing the responses.
+    """
+
+    keyed = coalesce.keyed
+
+    assert keyed(
+        'get', 'https://enasis.net',
+        params={'a': 1, 'b': 2}) == keyed(
+        'get', 'https://enasis.net',
+        params={'b': 2, 'a': 1})
+
+    assert keyed(
+        'get', 'https://enasis.net',
+        params={'a': 1}) != keyed(
+        'get', 'https://enasis.net',
+        params={'a': 2})
+
+    assert not keyed(
+        'post', 'https://enasis.net')
+
+    assert not keyed(
+        'get', 'https://enasis.net',
+        json={'a': 1})
+
+
+
+def test_HTTPCoalesce_block(
+    coalesce: HTTPCoalesce,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param coalesce: Class instance for sharing the responses.
+    """
+
+    perform = coalesce.perform_block
+
+    started = Event()
+    release = Event()
+
+    calls: list[int] = []
+
+    results: list[Response] = []
+
+
+    def _runner() -> Response:
+
+        calls.append(1)
+
+        started.set()
+        release.wait(5)
+
+        return Response(200)
+
+
+    def _perform() -> None:
+
+        results.append(
+            perform('key', _runner))
+
+
+    leader = Thread(
+        target=_perform)
+
+    leader.start()
+
+    started.wait(5)
+
+    follow = Thread(
+        target=_perform)
+
+    follow.start()
+
+    while coalesce.joined == 0:
+        block_sleep(0.01)
+
+    release.set()
+
+    leader.join(5)
+    follow.join(5)
+
+
+    assert len(calls) == 1
+
+    assert len(results) == 2
+
+    assert results[0] is results[1]
+
+    assert coalesce.joined == 1
+
+    assert coalesce.pending == 0
+
+
+    def _raises() -> Response:
+        raise ConnectionError
+
+    with raises(ConnectionError):
+        perform('key', _raises)
+
+    assert coalesce.pending == 0
+
+
+
+@mark.asyncio
+async def test_HTTPCoalesce_async(
+    coalesce: HTTPCoalesce,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param coalesce: Class instance for sharing the responses.
+    """
+
+    perform = coalesce.perform_async
+
+    calls: list[int] = []
+
+
+    async def _runner() -> Response:
+
+        calls.append(1)
+
+        await asyncio.sleep(0.01)
+
+        return Response(200)
+
+
+    results = await asyncio.gather(
+        perform('key', _runner),
+        perform('key', _runner),
+        perform('key', _runner))
+
+
+    assert len(calls) == 1
+
+    assert results[0] is results[1]
+    assert results[1] is results[2]
+
+    assert coalesce.joined == 2
+
+    assert coalesce.pending == 0
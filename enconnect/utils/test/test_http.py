@@ -8,9 +8,13 @@ is permitted, for more information consult the project license file.
 
 
 import asyncio
+from threading import Lock
+from time import sleep as block_sleep
+from typing import Any
 from typing import AsyncIterator
 from typing import Iterator
 from unittest.mock import AsyncMock
+from unittest.mock import Mock
 from unittest.mock import patch
 
 from encommon.types import inrepr
@@ -18,15 +22,21 @@ from encommon.types import instr
 from encommon.types import lattrs
 
 from httpx import AsyncByteStream
+from httpx import ConnectError
+from httpx import Request
 from httpx import Response
 from httpx import SyncByteStream
 
 from pytest import fixture
 from pytest import mark
+from pytest import raises
 
 from respx import MockRouter
 
+from ..cache import HTTPCache
 from ..http import HTTPClient
+from ..limiter import HTTPLimiter
+from ..timing import HTTPTiming
 
 
 
@@ -60,11 +70,17 @@ def test_HTTPClient(
         '_HTTPClient__verify',
         '_HTTPClient__capem',
         '_HTTPClient__httpauth',
-        '_HTTPClient__retry',
-        '_HTTPClient__backoff',
-        '_HTTPClient__states',
+        '_HTTPClient__policy',
+        '_HTTPClient__logger',
+        '_HTTPClient__limits',
+        '_HTTPClient__http2',
+        '_HTTPClient__cache',
+        '_HTTPClient__coalesce',
+        '_HTTPClient__timing',
+        '_HTTPClient__limiter',
         '_HTTPClient__client_block',
-        '_HTTPClient__client_async']
+        '_HTTPClient__client_async',
+        '_HTTPClient__lock']
 
 
     assert inrepr(
@@ -95,13 +111,677 @@ def test_HTTPClient(
 
     assert client.states == {429}
 
+    assert client.backmax == 60.0
+
+    assert client.policy
+
+    assert client.limits.max_connections == 100
+
+    assert not client.http2
+
+    assert not client.cache
+
+    assert not client.coalesce
+
+    assert not client.timing
+
+    assert not client.limiter
+
     assert client.client_block
 
-    assert client.client_async
+    assert client.client_async
+
+
+
+def test_HTTPClient_lazy() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    client1 = HTTPClient()
+    client2 = HTTPClient()
+
+    assert not client1._HTTPClient__client_block  # type: ignore
+    assert not client1._HTTPClient__client_async  # type: ignore
+
+
+    block = client1.client_block
+
+    assert client1.client_block is block
+
+    assert not client1._HTTPClient__client_async  # type: ignore
+
+
+    context1 = (
+        block._transport
+        ._pool._ssl_context)  # type: ignore
+
+    context2 = (
+        client2.client_async._transport
+        ._pool._ssl_context)  # type: ignore
+
+    assert context1 is context2
+
+
+    client3 = HTTPClient(verify=False)
+
+    context3 = (
+        client3.client_block._transport
+        ._pool._ssl_context)  # type: ignore
+
+    assert context3 is not context1
+
+
+    with client1 as _client:
+        assert _client is client1
+
+    assert block.is_closed
+
+    assert client1.client_block is not block
+
+
+
+@mark.asyncio
+async def test_HTTPClient_aclose() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    client = HTTPClient()
+
+    block = client.client_block
+    _async = client.client_async
+
+    async with client as _client:
+        assert _client is client
+
+    assert block.is_closed
+    assert _async.is_closed
+
+    await client.aclose()
+
+
+
+def test_HTTPClient_http2() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    client = HTTPClient(
+        connections=5,
+        keepalive=2,
+        expiry=1.0,
+        http2=True)
+
+    assert client.http2
+
+    limits = client.limits
+
+    assert limits.max_connections == 5
+
+    assert limits.max_keepalive_connections == 2
+
+    assert limits.keepalive_expiry == 1.0
+
+    transport = (
+        client.client_block
+        ._transport)
+
+    pool = getattr(
+        transport, '_pool')
+
+    assert pool._http2
+
+
+
+def test_HTTPClient_poolstats(
+    client: HTTPClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting with server.
+    """
+
+    empty = {
+        'total': 0,
+        'active': 0,
+        'idle': 0,
+        'queued': 0}
+
+    assert client.poolstats() == {
+        'block': empty,
+        'async': empty}
+
+
+    conns = [
+        Mock(**{
+            'is_idle.return_value': x,
+            'is_closed.return_value': False})
+        for x in [True, False, False]]
+
+    reqs = [
+        Mock(**{
+            'is_queued.return_value': True})]
+
+    pool = Mock(
+        connections=conns,
+        _requests=reqs)
+
+    transport = (
+        client.client_block
+        ._transport)
+
+    with patch.object(
+            transport, '_pool', pool):
+
+        stats = client.poolstats()
+
+    assert stats['block'] == {
+        'total': 3,
+        'active': 2,
+        'idle': 1,
+        'queued': 1}
+
+
+
+def test_HTTPClient_request_block(
+    client: HTTPClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting with server.
+    """
+
+    patched = patch(
+        'httpx.Client.request')
+
+    request = client.request_block
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(429),
+            Response(200)]
+
+        response = request(
+            'get', 'https://enasis.net')
+
+        status = response.status_code
+
+        assert status == 200
+
+        assert mocker.call_count == 2
+
+
+    headers = {'Retry-After': '0'}
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(429, headers=headers),
+            Response(429, headers=headers),
+            Response(429, headers=headers)]
+
+        response = request(
+            'get', 'https://enasis.net')
+
+        status = response.status_code
+
+        assert status == 429
+
+        assert mocker.call_count == 3
+
+
+
+def test_HTTPClient_request_failure() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    logger = Mock()
+
+    client = HTTPClient(
+        backoff=0.01,
+        logger=logger)
+
+    patched = patch(
+        'httpx.Client.request')
+
+    request = client.request_block
+
+    location = 'https://enasis.net'
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            ConnectError('mocked'),
+            Response(503),
+            Response(200)]
+
+        response = request(
+            'get', location)
+
+        assert response.status_code == 200
+
+        assert mocker.call_count == 3
+
+
+    assert logger.call_count == 2
+
+    call = logger.call_args_list[0]
+
+    assert call.kwargs['status'] is None
+    assert call.kwargs['source'] == 'backoff'
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            ConnectError('mocked'),
+            ConnectError('mocked'),
+            ConnectError('mocked')]
+
+        _raises = raises(ConnectError)
+
+        with _raises:
+            request('get', location)
+
+        assert mocker.call_count == 3
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            ConnectError('mocked'),
+            Response(200)]
+
+        _raises = raises(ConnectError)
+
+        with _raises:
+            request('post', location)
+
+        assert mocker.call_count == 1
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(503),
+            Response(200)]
+
+        response = request(
+            'post', location)
+
+        assert response.status_code == 503
+
+        assert mocker.call_count == 1
+
+
+
+@mark.asyncio
+async def test_HTTPClient_request_deadline() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    logger = Mock()
+
+    client = HTTPClient(
+        timeout=30,
+        backoff=5.0,
+        deadline=2.0,
+        logger=logger)
+
+    assert client.deadline == 2.0
+
+    patched = patch(
+        'httpx.AsyncClient.request',
+        new_callable=AsyncMock)
+
+    request = client.request_async
+
+    location = 'https://enasis.net'
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(503),
+            Response(200)]
+
+        response = await request(
+            'get', location)
+
+        assert response.status_code == 503
+
+        assert mocker.call_count == 1
+
+        timeout = (
+            mocker.call_args
+            .kwargs['timeout'])
+
+        assert timeout <= 2.0
+
+
+    call = logger.call_args
+
+    assert call.kwargs['source'] == 'deadline'
+
+
+
+@mark.asyncio
+async def test_HTTPClient_request_async(
+    client: HTTPClient,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting with server.
+    """
+
+    patched = patch(
+        'httpx.AsyncClient.request',
+        new_callable=AsyncMock)
+
+    request = client.request_async
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(429),
+            Response(200)]
+
+        response = await request(
+            'get', 'https://enasis.net')
+
+        status = response.status_code
+
+        assert status == 200
+
+        assert mocker.call_count == 2
+
+
+
+@mark.asyncio
+async def test_HTTPClient_request_hinted() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    logger = Mock()
+
+    client = HTTPClient(
+        backmax=10,
+        logger=logger)
+
+    patched = patch(
+        'httpx.AsyncClient.request',
+        new_callable=AsyncMock)
+
+    request = client.request_async
+
+    location = 'https://enasis.net'
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(
+                429, headers={
+                    'Retry-After': '0'}),
+            Response(200)]
+
+        response = await request(
+            'get', location)
+
+        assert response.status_code == 200
+
+        assert mocker.call_count == 2
+
+
+    logger.assert_called_once_with(
+        item='backoff',
+        method='get',
+        location=location,
+        status=429,
+        attempt=0,
+        source='retry-after',
+        wait=0.0)
+
+    logger.reset_mock()
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(
+                429, headers={
+                    'Retry-After': '60'}),
+            Response(200)]
+
+        response = await request(
+            'get', location)
+
+        assert response.status_code == 429
+
+        assert mocker.call_count == 1
+
+
+    logger.assert_called_once_with(
+        item='backoff',
+        method='get',
+        location=location,
+        status=429,
+        attempt=0,
+        source='abandon',
+        wait=60.0)
+
+
+
+def test_HTTPClient_request_cache() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = HTTPCache()
+
+    client = HTTPClient(
+        cache=cache)
+
+    patched = patch(
+        'httpx.Client.request')
+
+    request = client.request_block
+
+    location = 'https://enasis.net'
+
+    _request = Request(
+        'GET', location)
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(
+                200,
+                content=b'content',
+                headers={'ETag': 'mocked'},
+                request=_request),
+            Response(
+                304,
+                request=_request)]
+
+        response = request(
+            'get', location)
+
+        assert response.content == (
+            b'content')
+
+        response = request(
+            'get', location)
+
+        assert response.status_code == 200
+
+        assert response.content == (
+            b'content')
+
+
+        call = mocker.call_args_list[1]
+
+        headers = call.kwargs['headers']
+
+        assert headers == {
+            'If-None-Match': 'mocked'}
 
 
+    assert cache.hits == 1
 
-def test_HTTPClient_request_block(
+    assert cache.misses == 1
+
+
+    def _evicted(
+        **kwargs: Any,
+    ) -> Response:
+
+        cache.clear()
+
+        return Response(
+            304, request=_request)
+
+
+    with patched as mocker:
+
+        mocker.side_effect = _evicted
+
+        response = request(
+            'get', location)
+
+        assert response.status_code == 200
+
+        assert response.content == (
+            b'content')
+
+
+    assert cache.hits == 2
+
+
+
+@mark.asyncio
+async def test_HTTPClient_request_cache_async() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    cache = HTTPCache()
+
+    client = HTTPClient(
+        cache=cache)
+
+    patched = patch(
+        'httpx.AsyncClient.request',
+        new_callable=AsyncMock)
+
+    request = client.request_async
+
+    location = 'https://enasis.net'
+
+    _request = Request(
+        'GET', location)
+
+    modified = (
+        'Wed, 21 Oct 2015'
+        ' 07:28:00 GMT')
+
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(
+                200,
+                content=b'content',
+                headers={
+                    'Last-Modified': modified},
+                request=_request),
+            Response(
+                304,
+                request=_request)]
+
+        await request('get', location)
+
+        response = await request(
+            'get', location)
+
+        assert response.content == (
+            b'content')
+
+
+        call = mocker.call_args_list[1]
+
+        headers = call.kwargs['headers']
+
+        assert headers == {
+            'If-Modified-Since': modified}
+
+
+    assert cache.hits == 1
+
+
+
+@mark.asyncio
+async def test_HTTPClient_request_coalesce() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    client = HTTPClient(
+        coalesce=True)
+
+    patched = patch(
+        'httpx.AsyncClient.request',
+        new_callable=AsyncMock)
+
+    request = client.request_async
+
+    location = 'https://enasis.net'
+
+
+    async def _request(
+        **kwargs: Any,
+    ) -> Response:
+
+        await asyncio.sleep(0.01)
+
+        return Response(200)
+
+
+    with patched as mocker:
+
+        mocker.side_effect = _request
+
+        results = await asyncio.gather(
+            request('get', location),
+            request('get', location),
+            request('post', location))
+
+        assert mocker.call_count == 2
+
+
+    assert results[0] is results[1]
+
+    assert results[1] is not results[2]
+
+    coalesce = client.coalesce
+
+    assert coalesce is not None
+
+    assert coalesce.joined == 1
+
+
+
+def test_HTTPClient_request_many_block(
     client: HTTPClient,
 ) -> None:
     """
@@ -113,27 +793,75 @@ def test_HTTPClient_request_block(
     patched = patch(
         'httpx.Client.request')
 
-    request = client.request_block
+    request = client.request_many_block
+
+    requests = [
+        {'method': 'get',
+         'location': f'https://enasis.net/{x}'}
+        for x in range(5)]
+
+
+    lock = Lock()
+
+    flight = [0, 0]
+
+
+    def _request(
+        **kwargs: Any,
+    ) -> Response:
+
+        with lock:
+            flight[0] += 1
+            flight[1] = max(flight)
+
+        block_sleep(0.05)
+
+        with lock:
+            flight[0] -= 1
+
+        if kwargs['url'][-1] == '3':
+            raise ValueError('mocked')
+
+        return Response(
+            200, text=kwargs['url'])
+
 
     with patched as mocker:
 
-        mocker.side_effect = [
-            Response(429),
-            Response(200)]
+        mocker.side_effect = _request
 
-        response = request(
-            'get', 'https://enasis.net')
+        results = request(
+            requests, concurrency=2)
 
-        status = response.status_code
+        assert mocker.call_count == 5
 
-        assert status == 200
+    assert flight[1] == 2
 
-        assert mocker.call_count == 2
+
+    assert len(results) == 5
+
+    for index, result in enumerate(results):
+
+        if index == 3:
+            assert isinstance(
+                result, ValueError)
+            continue
+
+        assert isinstance(
+            result, Response)
+
+        assert result.text[-1] == str(index)
+
+
+    assert request([]) == []
+
+    with raises(ValueError):
+        request(requests, 0)
 
 
 
 @mark.asyncio
-async def test_HTTPClient_request_async(
+async def test_HTTPClient_request_many_async(
     client: HTTPClient,
 ) -> None:
     """
@@ -146,23 +874,160 @@ async def test_HTTPClient_request_async(
         'httpx.AsyncClient.request',
         new_callable=AsyncMock)
 
-    request = client.request_async
+    request = client.request_many_async
+
+    requests = [
+        {'method': 'get',
+         'location': f'https://enasis.net/{x}'}
+        for x in range(5)]
+
+
+    flight = [0, 0]
+
+
+    async def _request(
+        **kwargs: Any,
+    ) -> Response:
+
+        flight[0] += 1
+        flight[1] = max(flight)
+
+        await asyncio.sleep(0.01)
+
+        flight[0] -= 1
+
+        if kwargs['url'][-1] == '3':
+            raise ValueError('mocked')
+
+        return Response(
+            200, text=kwargs['url'])
+
 
     with patched as mocker:
 
-        mocker.side_effect = [
-            Response(429),
-            Response(200)]
+        mocker.side_effect = _request
 
-        response = await request(
-            'get', 'https://enasis.net')
+        results = await request(
+            requests, concurrency=2)
 
-        status = response.status_code
+        assert mocker.call_count == 5
 
-        assert status == 200
+    assert flight[1] == 2
+
+
+    assert len(results) == 5
+
+    for index, result in enumerate(results):
+
+        if index == 3:
+            assert isinstance(
+                result, ValueError)
+            continue
+
+        assert isinstance(
+            result, Response)
+
+        assert result.text[-1] == str(index)
+
+
+    with raises(ValueError):
+        await request(requests, 0)
+
+
+
+def test_HTTPClient_timing(
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    hook = Mock()
+
+    timing = HTTPTiming(
+        hooks=[hook])
+
+    client = HTTPClient(
+        backoff=0.01,
+        timing=timing)
+
+    assert client.timing is timing
+
+    location = (
+        'https://enasis.net'
+        '/api/users/12345')
+
+
+    (respx_mock
+     .get(location)
+     .mock(side_effect=[
+         Response(503),
+         Response(200, text='mocked')]))
+
+    request = client.request_block
+
+    response = request(
+        'get', location)
+
+    assert response.status_code == 200
+
+
+    assert hook.call_count == 2
+
+    call = hook.call_args_list[0]
+
+    assert call.kwargs['status'] == 503
+    assert call.kwargs['attempt'] == 0
+
+    call = hook.call_args_list[1]
+
+    assert call.kwargs['status'] == 200
+    assert call.kwargs['attempt'] == 1
+    assert call.kwargs['bytes_in'] == 6
+
+
+    histograms = timing.histograms()
+
+    histogram = histograms[
+        'GET /api/users/{id}']
+
+    assert histogram['count'] == 2
+
+
+
+def test_HTTPClient_limiter() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    limiter = HTTPLimiter(
+        rate=100, burst=1)
+
+    client = HTTPClient(
+        limiter=limiter)
+
+    assert client.limiter is limiter
+
+    patched = patch(
+        'httpx.Client.request')
+
+    request = client.request_block
+
+    with patched as mocker:
+
+        mocker.side_effect = [
+            Response(200),
+            Response(200)]
+
+        request('get', 'https://enasis.net')
+        request('get', 'https://enasis.net')
 
         assert mocker.call_count == 2
 
+    assert limiter.waited > 0
+
 
 
 def test_HTTPClient_stream_block(
@@ -286,3 +1151,94 @@ async def test_HTTPClient_stream_async(
 
 
     await asyncio.sleep(0)
+
+
+
+def test_HTTPClient_events_block(
+    client: HTTPClient,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting with server.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    location = (
+        'https://192.168.1.10'
+        '/eventstream/clip/v2')
+
+    (respx_mock
+     .get(location)
+     .mock(Response(
+         status_code=200,
+         content=(
+             b'id: 1\ndata: first\n\n'
+             b'id: 2\ndata: second\n\n'))))
+
+
+    chunks = list(
+        client.chunks_block(
+            'get', location, chunk=8))
+
+    assert chunks[0] == b'id: 1\nda'
+
+    assert len(chunks) == 5
+
+
+    events = list(
+        client.events_block(
+            'get', location, chunk=8))
+
+    assert len(events) == 2
+
+    assert events[0].data == 'first'
+
+    assert events[1].ident == '2'
+
+
+
+@mark.asyncio
+async def test_HTTPClient_events_async(
+    client: HTTPClient,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param client: Class instance for connecting with server.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    location = (
+        'https://192.168.1.10'
+        '/eventstream/clip/v2')
+
+    (respx_mock
+     .get(location)
+     .mock(Response(
+         status_code=200,
+         content=(
+             b'id: 1\ndata: first\n\n'
+             b'id: 2\ndata: second\n\n'))))
+
+
+    chunks = [
+        x async for x in
+        client.chunks_async(
+            'get', location)]
+
+    assert len(chunks) == 1
+
+
+    events = [
+        x async for x in
+        client.events_async(
+            'get', location, chunk=8)]
+
+    assert len(events) == 2
+
+    assert events[0].data == 'first'
+
+    assert events[1].ident == '2'
@@ -0,0 +1,252 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from unittest.mock import patch
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+
+from ..limiter import HTTPBucket
+from ..limiter import HTTPLimiter
+
+
+
+LOCATION = (
+    'https://192.168.1.10'
+    '/clip/v2/resource/light/123456')
+
+
+
+@fixture
+def limiter() -> HTTPLimiter:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    return HTTPLimiter(
+        rate=10, burst=2,
+        rules={
+            '192.168.1.10/clip/v2'
+            '/resource/light/{id}': (
+                1, 1)})
+
+
+
+def test_HTTPLimiter(
+    limiter: HTTPLimiter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param limiter: Class instance for limiting the requests.
+    """
+
+
+    attrs = lattrs(limiter)
+
+    assert attrs == [
+        '_HTTPLimiter__rate',
+        '_HTTPLimiter__burst',
+        '_HTTPLimiter__scope',
+        '_HTTPLimiter__rules',
+        '_HTTPLimiter__buckets',
+        '_HTTPLimiter__waited',
+        '_HTTPLimiter__lock']
+
+
+    assert inrepr(
+        'limiter.HTTPLimiter object',
+        limiter)
+
+    assert isinstance(
+        hash(limiter), int)
+
+    assert instr(
+        'limiter.HTTPLimiter object',
+        limiter)
+
+
+    assert limiter.rate == 10
+
+    assert limiter.burst == 2
+
+    assert limiter.scope == 'host'
+
+    assert len(limiter.rules) == 1
+
+    assert limiter.waited == 0
+
+    assert limiter.stats() == {}
+
+
+
+def test_HTTPLimiter_keyed(
+    limiter: HTTPLimiter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param limiter: Class instance for limiting the requests.
+    """
+
+    keyed = limiter.keyed
+
+    assert keyed(LOCATION) == (
+        '192.168.1.10/clip/v2'
+        '/resource/light/{id}')
+
+    assert keyed(
+        'https://192.168.1.10'
+        '/clip/v2/resource/room') == (
+            '192.168.1.10')
+
+
+    limiter = HTTPLimiter(
+        rate=1, scope='route')
+
+    assert limiter.keyed(
+        'https://enasis.net/api/1') == (
+            'enasis.net/api/{id}')
+
+
+
+def test_HTTPLimiter_reserve(
+    limiter: HTTPLimiter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param limiter: Class instance for limiting the requests.
+    """
+
+    reserve = limiter.reserve
+
+    location = (
+        'https://192.168.1.10'
+        '/clip/v2/resource/room')
+
+
+    assert reserve(location) == 0
+
+    assert reserve(location) == 0
+
+    wait = reserve(location)
+
+    assert 0.09 <= wait <= 0.1
+
+
+    assert reserve(LOCATION) == 0
+
+    wait = reserve(LOCATION)
+
+    assert 0.99 <= wait <= 1.0
+
+    wait = reserve(LOCATION)
+
+    assert 1.99 <= wait <= 2.0
+
+
+    assert limiter.waited > 3
+
+    stats = limiter.stats()
+
+    assert len(stats) == 2
+
+
+
+def test_HTTPLimiter_acquire(
+    limiter: HTTPLimiter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param limiter: Class instance for limiting the requests.
+    """
+
+    patched = patch(
+        'enconnect.utils.limiter.sleep')
+
+    acquire = limiter.acquire_block
+
+    with patched as mocker:
+
+        assert acquire(LOCATION) == 0
+
+        wait = acquire(LOCATION)
+
+        mocker.assert_called_once_with(wait)
+
+
+
+@mark.asyncio
+async def test_HTTPLimiter_acquire_async() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    limiter = HTTPLimiter(
+        rate=100, burst=1)
+
+    acquire = limiter.acquire_async
+
+    assert await acquire(LOCATION) == 0
+
+    wait = await acquire(LOCATION)
+
+    assert 0 < wait <= 0.01
+
+
+
+def test_HTTPLimiter_shared() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    shared = HTTPLimiter.shared
+
+    limiter1 = shared('mocked', 5)
+    limiter2 = shared('mocked', 5)
+    limiter3 = shared('other', 5)
+
+    assert limiter1 is limiter2
+
+    assert limiter1 is not limiter3
+
+    with raises(ValueError):
+        shared('mocked', 10)
+
+    with raises(ValueError):
+        shared('mocked', 5, 2)
+
+
+
+def test_HTTPBucket() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    bucket = HTTPBucket(
+        rate=2, burst=4)
+
+    assert bucket.reserve(4) == 0
+
+    bucket.updated -= 1
+
+    assert bucket.reserve(2) == 0
+
+    wait = bucket.reserve(1)
+
+    assert 0.49 <= wait <= 0.5
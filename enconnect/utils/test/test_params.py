@@ -0,0 +1,100 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from typing import Any
+
+from ..params import HTTPCacheParams
+from ..params import HTTPLimitParams
+from ..params import HTTPParams
+from ..params import http_client
+
+
+
+class _Params(
+    HTTPParams,
+    HTTPCacheParams,
+    HTTPLimitParams,
+    extra='forbid',
+):
+    """
+    Process and validate the class configuration parameters.
+    """
+
+    def __init__(
+        self,
+        /,
+        **data: Any,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        super().__init__(**data)
+
+
+
+def test_http_client() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = HTTPParams(
+        timeout=10,
+        ssl_verify=False,
+        pool_connections=5,
+        http2=True,
+        timing=True)
+
+    client = http_client(params)
+
+    assert client.timeout == 10
+    assert client.verify is False
+    assert client.http2 is True
+    assert client.timing is not None
+    assert client.cache is None
+    assert client.limiter is None
+
+    client.close()
+
+
+
+def test_http_client_features() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    params = _Params(
+        cache_enable=True,
+        cache_entries=5,
+        limit_rate=5,
+        limit_burst=2)
+
+    client = http_client(
+        params, 'params/mocked')
+
+    cache = client.cache
+    limiter = client.limiter
+
+    assert cache is not None
+    assert limiter is not None
+
+    assert limiter.rate == 5
+    assert limiter.burst == 2
+
+    client.close()
+
+
+    params = _Params()
+
+    client = http_client(params)
+
+    assert client.cache is None
+    assert client.limiter is None
+
+    client.close()
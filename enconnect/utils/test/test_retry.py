@@ -0,0 +1,315 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from email.utils import formatdate
+from time import time
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import ConnectError
+from httpx import ReadTimeout
+from httpx import Response
+
+from pytest import fixture
+
+from ..retry import HTTPRetry
+
+
+
+@fixture
+def policy() -> HTTPRetry:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    return HTTPRetry(
+        backoff=1.0,
+        backmax=10.0)
+
+
+
+def test_HTTPRetry(
+    policy: HTTPRetry,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param policy: Class instance for the retry decisions.
+    """
+
+
+    attrs = lattrs(policy)
+
+    assert attrs == [
+        '_HTTPRetry__retry',
+        '_HTTPRetry__backoff',
+        '_HTTPRetry__backmax',
+        '_HTTPRetry__jitter',
+        '_HTTPRetry__states',
+        '_HTTPRetry__failures',
+        '_HTTPRetry__methods',
+        '_HTTPRetry__deadline']
+
+
+    assert inrepr(
+        'retry.HTTPRetry object',
+        policy)
+
+    assert isinstance(
+        hash(policy), int)
+
+    assert instr(
+        'retry.HTTPRetry object',
+        policy)
+
+
+    assert policy.retry == 3
+
+    assert policy.backoff == 1.0
+
+    assert policy.backmax == 10.0
+
+    assert policy.jitter == 0.5
+
+    assert policy.states == {429}
+
+    assert policy.failures == {
+        500, 502, 503, 504}
+
+    assert policy.methods == {
+        'delete', 'get', 'put'}
+
+    assert policy.deadline is None
+
+
+
+def test_HTTPRetry_hinted(
+    policy: HTTPRetry,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param policy: Class instance for the retry decisions.
+    """
+
+    hinted = policy.hinted
+
+
+    response = Response(
+        429, headers={
+            'Retry-After': '5'})
+
+    assert hinted(response) == (
+        'retry-after', 5.0)
+
+
+    response = Response(
+        429, headers={
+            'X-RateLimit-Reset-After': '1.5'})
+
+    assert hinted(response) == (
+        'x-ratelimit-reset-after', 1.5)
+
+
+    reset = str(int(time() + 30))
+
+    response = Response(
+        429, headers={
+            'X-Ratelimit-Reset': reset})
+
+    result = hinted(response)
+
+    assert result is not None
+
+    assert 25 <= result[1] <= 30
+
+
+    header = formatdate(
+        time() + 30, usegmt=True)
+
+    response = Response(
+        429, headers={
+            'Retry-After': header})
+
+    result = hinted(response)
+
+    assert result is not None
+
+    assert 25 <= result[1] <= 30
+
+
+    response = Response(
+        429, headers={
+            'Retry-After': 'invalid'})
+
+    assert hinted(response) is None
+
+
+    response = Response(429)
+
+    assert hinted(response) is None
+
+
+
+def test_HTTPRetry_waiting(
+    policy: HTTPRetry,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param policy: Class instance for the retry decisions.
+    """
+
+    waiting = policy.waiting
+
+
+    response = Response(200)
+
+    assert not waiting(0, response)
+
+
+    response = Response(429)
+
+    result = waiting(0, response)
+
+    assert result is not None
+
+    assert result[0] == 'backoff'
+
+    assert 0.5 <= result[1] <= 1.0
+
+    result = waiting(1, response)
+
+    assert result is not None
+
+    assert 1.0 <= result[1] <= 2.0
+
+    assert not waiting(2, response)
+
+
+    response = Response(
+        429, headers={
+            'Retry-After': '2'})
+
+    assert waiting(0, response) == (
+        'retry-after', 2.0)
+
+
+    response = Response(
+        429, headers={
+            'Retry-After': '3600'})
+
+    assert waiting(0, response) == (
+        'abandon', 3600.0)
+
+
+
+def test_HTTPRetry_expected() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    policy = HTTPRetry(
+        backoff=1.0,
+        backmax=5.0,
+        jitter=0)
+
+    expected = policy.expected
+
+    assert expected(0) == 1.0
+    assert expected(1) == 2.0
+    assert expected(2) == 4.0
+    assert expected(3) == 5.0
+
+
+
+def test_HTTPRetry_retryable(
+    policy: HTTPRetry,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param policy: Class instance for the retry decisions.
+    """
+
+    retryable = policy.retryable
+
+
+    response = Response(429)
+
+    assert retryable('get', response)
+    assert retryable('post', response)
+
+
+    response = Response(503)
+
+    assert retryable('get', response)
+    assert not retryable('post', response)
+
+
+    response = Response(501)
+
+    assert not retryable('get', response)
+
+
+    assert retryable(
+        'GET', ConnectError('failed'))
+
+    assert not retryable(
+        'patch', ConnectError('failed'))
+
+    assert retryable(
+        'put', ReadTimeout('failed'))
+
+    assert not retryable(
+        'get', ValueError('failed'))
+
+
+
+def test_HTTPRetry_deadline() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    policy = HTTPRetry(
+        backoff=4.0,
+        jitter=0,
+        deadline=10.0)
+
+    waiting = policy.waiting
+
+
+    assert policy.remains(3.0) == 7.0
+    assert policy.remains(12.0) == 0.0
+
+
+    reason = ConnectError('failed')
+
+    assert waiting(0, reason) == (
+        'backoff', 4.0)
+
+    assert waiting(0, reason, 'get', 7.0) == (
+        'deadline', 4.0)
+
+    assert not waiting(0, reason, 'post')
+
+
+    response = Response(
+        503, headers={
+            'Retry-After': '2'})
+
+    assert waiting(0, response, 'get', 1.0) == (
+        'retry-after', 2.0)
+
+    assert waiting(0, response, 'get', 9.0) == (
+        'deadline', 2.0)
@@ -0,0 +1,114 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from ..stream import HTTPEventParser
+
+
+
+def test_HTTPEventParser() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    parser = HTTPEventParser()
+
+
+    attrs = lattrs(parser)
+
+    assert attrs == [
+        '_HTTPEventParser__buffer',
+        '_HTTPEventParser__data',
+        '_HTTPEventParser__event',
+        '_HTTPEventParser__ident',
+        '_HTTPEventParser__retry']
+
+
+    assert inrepr(
+        'stream.HTTPEventParser object',
+        parser)
+
+    assert isinstance(
+        hash(parser), int)
+
+    assert instr(
+        'stream.HTTPEventParser object',
+        parser)
+
+
+    assert parser.ident is None
+
+    assert parser.retry is None
+
+
+
+def test_HTTPEventParser_feed() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    parser = HTTPEventParser()
+
+    feed = parser.feed
+
+
+    assert feed(b': comment\n\n') == []
+
+    assert feed(b'data: fir') == []
+
+    assert feed(b'st\r\ndata:second') == []
+
+    events = feed(b'\n\n')
+
+    assert len(events) == 1
+
+    event = events[0]
+
+    assert event.data == 'first\nsecond'
+    assert event.event == 'message'
+    assert event.ident is None
+    assert event.retry is None
+
+
+    events = feed(
+        b'event: update\n'
+        b'id: 1:0\n'
+        b'retry: 5000\n'
+        b'data: {"key": "value"}\n'
+        b'\n'
+        b'retry: invalid\n'
+        b'id\n'
+        b'data\n'
+        b'\n')
+
+    assert len(events) == 2
+
+    event = events[0]
+
+    assert event.data == '{"key": "value"}'
+    assert event.event == 'update'
+    assert event.ident == '1:0'
+    assert event.retry == 5000
+
+    event = events[1]
+
+    assert event.data == ''
+    assert event.event == 'message'
+    assert event.ident == ''
+    assert event.retry == 5000
+
+
+    assert feed(b'event: empty\n\n') == []
+
+    events = feed(b'data: next\n\n')
+
+    assert events[0].event == 'message'
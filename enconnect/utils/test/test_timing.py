@@ -0,0 +1,211 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from unittest.mock import Mock
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import ConnectError
+from httpx import Request
+from httpx import Response
+
+from pytest import fixture
+from pytest import mark
+
+from ..timing import HTTPTiming
+from ..timing import HTTPTracer
+from ..timing import templated
+
+
+
+HOOK = Mock()
+
+
+
+@fixture
+def timing() -> HTTPTiming:
+    """
+    Construct the instance for use in the downstream tests.
+
+    :returns: Newly constructed instance of related class.
+    """
+
+    HOOK.reset_mock()
+
+    return HTTPTiming(
+        hooks=[HOOK],
+        buckets=(1.0, 0.1))
+
+
+
+def test_HTTPTiming(
+    timing: HTTPTiming,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param timing: Class instance for collecting the timing.
+    """
+
+
+    attrs = lattrs(timing)
+
+    assert attrs == [
+        '_HTTPTiming__hooks',
+        '_HTTPTiming__buckets',
+        '_HTTPTiming__histograms',
+        '_HTTPTiming__lock']
+
+
+    assert inrepr(
+        'timing.HTTPTiming object',
+        timing)
+
+    assert isinstance(
+        hash(timing), int)
+
+    assert instr(
+        'timing.HTTPTiming object',
+        timing)
+
+
+    assert len(timing.hooks) == 1
+
+    assert timing.buckets == (0.1, 1.0)
+
+    assert timing.histograms() == {}
+
+
+
+def test_HTTPTiming_observe(
+    timing: HTTPTiming,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param timing: Class instance for collecting the timing.
+    """
+
+    location = (
+        'https://enasis.net'
+        '/channels/1234567/messages')
+
+
+    tracer = HTTPTracer()
+
+    tracer.events |= {
+        'connection.connect_tcp.started': 1.0,
+        'connection.connect_tcp.complete': 1.25,
+        'http11.send_request_headers.started': 2.0,
+        'http11.receive_response_headers'
+        '.complete': 2.5}
+
+    request = Request(
+        'POST', location,
+        content=b'mocked')
+
+    response = Response(
+        200, request=request,
+        content=b'response')
+
+    record = timing.observe(
+        'post', location, 0,
+        tracer, response)
+
+    assert record['route'] == (
+        '/channels/{id}/messages')
+
+    assert record['status'] == 200
+    assert record['bytes_out'] == 6
+    assert record['connect'] == 0.25
+    assert record['tls'] is None
+    assert record['ttfb'] == 0.5
+    assert record['reason'] is None
+
+    HOOK.assert_called_once_with(**record)
+
+
+    tracer = HTTPTracer()
+
+    record = timing.observe(
+        'post', location, 1,
+        tracer, ConnectError('mocked'))
+
+    assert record['status'] is None
+    assert record['attempt'] == 1
+    assert record['reason'] == 'ConnectError'
+
+
+    histograms = timing.histograms()
+
+    histogram = histograms[
+        'POST /channels/{id}/messages']
+
+    assert histogram['count'] == 2
+
+    assert histogram['buckets'] == {
+        0.1: 2, 1.0: 2}
+
+
+    timing.clear()
+
+    assert timing.histograms() == {}
+
+
+
+@mark.asyncio
+async def test_HTTPTracer() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    tracer = HTTPTracer()
+
+    tracer.trace_block(
+        'connection.start_tls.started', {})
+
+    await tracer.trace_async(
+        'connection.start_tls.complete', {})
+
+    between = tracer.between(
+        'start_tls.started',
+        'start_tls.complete')
+
+    assert between is not None
+
+    assert between >= 0
+
+    assert not tracer.between(
+        'start_tls.started',
+        'connect_tcp.complete')
+
+
+
+def test_templated() -> None:
+    """
+    Perform various tests associated with relevant routines.
+    """
+
+    assert templated(
+        'https://enasis.net/api/'
+        'users/12345') == (
+            '/api/users/{id}')
+
+    assert templated(
+        'https://enasis.net/api/'
+        'devices/0123456789abcdef01'
+        '?param=value') == (
+            '/api/devices/{id}')
+
+    assert templated(
+        'https://enasis.net/api/'
+        'v2/latest') == (
+            '/api/v2/latest')
@@ -0,0 +1,158 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from io import BytesIO
+from pathlib import Path
+
+from encommon.types import inrepr
+from encommon.types import instr
+from encommon.types import lattrs
+
+from httpx import Response
+
+from pytest import raises
+
+from respx import MockRouter
+
+from ..http import HTTPClient
+from ..upload import HTTPUpload
+
+
+
+def test_HTTPUpload(
+    tmp_path: Path,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param tmp_path: pytest object for temporal filesystem.
+    """
+
+    upload = HTTPUpload()
+
+
+    attrs = lattrs(upload)
+
+    assert attrs == [
+        '_HTTPUpload__sources',
+        '_HTTPUpload__handles',
+        '_HTTPUpload__opened']
+
+
+    assert inrepr(
+        'upload.HTTPUpload object',
+        upload)
+
+    assert isinstance(
+        hash(upload), int)
+
+    assert instr(
+        'upload.HTTPUpload object',
+        upload)
+
+
+    path = tmp_path / 'bundle.txt'
+
+    path.write_bytes(b'content')
+
+    buffer = BytesIO(b'skip:memory')
+    buffer.seek(5)
+
+    upload.add(path)
+    upload.add(
+        buffer,
+        field='other',
+        name='image.png')
+    upload.add(str(path), mimetype='a/b')
+
+    assert upload.names == [
+        'bundle.txt',
+        'image.png',
+        'bundle.txt']
+
+
+    with upload:
+
+        fields = upload.fields()
+
+        assert fields[0][0] == 'files'
+        assert fields[1][0] == 'other'
+
+        assert fields[0][1][2] == 'text/plain'
+        assert fields[1][1][2] == 'image/png'
+        assert fields[2][1][2] == 'a/b'
+
+        handle = fields[0][1][1]
+
+        assert handle.read() == b'content'
+        assert buffer.read() == b'memory'
+
+        with raises(ValueError):
+            upload.add(path)
+
+        fields = upload.fields()
+
+        assert handle.read() == b'content'
+        assert buffer.read() == b'memory'
+
+
+    assert handle.closed
+
+    assert not buffer.closed
+
+
+
+def test_HTTPUpload_request(
+    tmp_path: Path,
+    respx_mock: MockRouter,
+) -> None:
+    """
+    Perform various tests associated with relevant routines.
+
+    :param tmp_path: pytest object for temporal filesystem.
+    :param respx_mock: Object for mocking request operation.
+    """
+
+    client = HTTPClient()
+
+    location = 'https://enasis.net'
+
+    path = tmp_path / 'bundle.log'
+
+    path.write_bytes(
+        b'content' * 100000)
+
+    route = (
+        respx_mock
+        .post(location)
+        .mock(Response(200)))
+
+
+    with HTTPUpload() as upload:
+
+        upload.add(path)
+
+        client.request_block(
+            'post', location,
+            data={'key': 'value'},
+            files=upload)
+
+
+    request = route.calls[0].request
+
+    content = request.read()
+
+    assert b'name="key"' in content
+    assert b'filename="bundle.log"' in content
+
+    assert content.count(b'content') == 100000
+
+    assert int(
+        request.headers[
+            'content-length']) == len(content)
@@ -0,0 +1,396 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+import asyncio
+from re import compile as re_compile
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+from encommon.types import DictStrAny
+
+from httpx import RequestNotRead
+from httpx import Response
+from httpx import URL
+
+
+
+_HOOKS = list[Callable[..., None]]
+
+_OUTCOME = Response | Exception
+
+
+
+BUCKETS = (
+    0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0,
+    2.5, 5.0, 10.0, 30.0)
+
+TEMPLATED = re_compile(
+    r'^(\d+|[0-9a-fA-F-]{16,})$')
+
+
+
+class HTTPTracer:
+    """
+    Record when the events occur within the underlying library.
+
+    .. note::
+       Callbacks are provided to the library using the trace
+       extension, with separate callback for block and async.
+    """
+
+    started: float
+    events: dict[str, float]
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.started = monotonic()
+        self.events = {}
+
+
+    def trace_block(
+        self,
+        name: str,
+        info: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Record when the event occured within underlying library.
+
+        :param name: Name of the event from underlying library.
+        :param info: Information about the event from library.
+        """
+
+        self.events[name] = monotonic()
+
+
+    async def trace_async(
+        self,
+        name: str,
+        info: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Record when the event occured within underlying library.
+
+        :param name: Name of the event from underlying library.
+        :param info: Information about the event from library.
+        """
+
+        self.events[name] = monotonic()
+
+        await asyncio.sleep(0)
+
+
+    def between(
+        self,
+        start: str,
+        finish: str,
+    ) -> Optional[float]:
+        """
+        Return the seconds between the events when both occured.
+
+        .. note::
+           Names are matched by suffix ignoring the protocol, so
+           the same name works with both HTTP/1.1 and HTTP/2.
+
+        :param start: Suffix for name of the starting event.
+        :param finish: Suffix for name of the finishing event.
+        :returns: Seconds between the events when both occured.
+        """
+
+        began = self.__moment(start)
+        ended = self.__moment(finish)
+
+        if began is None or ended is None:
+            return None
+
+        return ended - began
+
+
+    def __moment(
+        self,
+        suffix: str,
+    ) -> Optional[float]:
+        """
+        Return the time when the event with suffix has occured.
+
+        :param suffix: Suffix for name of the event from library.
+        :returns: Time when the event with suffix has occured.
+        """
+
+        for name, moment in (
+                self.events.items()):
+
+            if name.endswith(suffix):
+                return moment
+
+        return None
+
+
+
+class HTTPTiming:
+    """
+    Collect the timing records and histograms for requests.
+
+    .. note::
+       One record is emitted to each hook for every attempt,
+       including those which are retried or raise exception.
+
+    :param hooks: Optional callbacks which receive the records.
+    :param buckets: Upper bounds in seconds for the histograms.
+    """
+
+    __hooks: _HOOKS
+    __buckets: tuple[float, ...]
+
+    __histograms: dict[str, DictStrAny]
+    __lock: Lock
+
+
+    def __init__(
+        self,
+        hooks: Optional[_HOOKS] = None,
+        buckets: tuple[float, ...] = BUCKETS,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__hooks = list(hooks or [])
+        self.__buckets = tuple(
+            sorted(buckets))
+
+        self.__histograms = {}
+        self.__lock = Lock()
+
+
+    @property
+    def hooks(
+        self,
+    ) -> _HOOKS:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return list(self.__hooks)
+
+
+    @property
+    def buckets(
+        self,
+    ) -> tuple[float, ...]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return self.__buckets
+
+
+    def observe(
+        self,
+        method: str,
+        location: str,
+        attempt: int,
+        tracer: HTTPTracer,
+        outcome: _OUTCOME,
+    ) -> DictStrAny:
+        """
+        Construct the record for attempt and update histograms.
+
+        :param method: Method for operation with the API server.
+        :param location: Location with path for server request.
+        :param attempt: Which attempt was made with the server.
+        :param tracer: Tracer which recorded the library events.
+        :param outcome: Response or exception from the attempt.
+        :returns: Record which was provided to each of the hooks.
+        """
+
+        between = tracer.between
+
+        total = (
+            monotonic()
+            - tracer.started)
+
+        record: DictStrAny = {
+            'method': method,
+            'route': templated(location),
+            'status': None,
+            'attempt': attempt,
+            'bytes_out': None,
+            'bytes_in': None,
+            'connect': between(
+                'connect_tcp.started',
+                'connect_tcp.complete'),
+            'tls': between(
+                'start_tls.started',
+                'start_tls.complete'),
+            'ttfb': between(
+                'send_request_headers.started',
+                'receive_response_headers.complete'),
+            'total': total,
+            'reason': None}
+
+
+        if isinstance(outcome, Response):
+
+            record |= {
+                'status': outcome.status_code,
+                'bytes_out': _sent(outcome),
+                'bytes_in': (
+                    outcome.num_bytes_downloaded)}
+
+        else:
+
+            record['reason'] = (
+                type(outcome).__name__)
+
+
+        self.__observe(
+            f"{method.upper()} {record['route']}",
+            total)
+
+        for hook in self.__hooks:
+            hook(**record)
+
+        return record
+
+
+    def __observe(
+        self,
+        key: str,
+        value: float,
+    ) -> None:
+        """
+        Update the histogram for the key using provided value.
+
+        :param key: Unique key for the histogram to be updated.
+        :param value: Value in seconds which will be observed.
+        """
+
+        buckets = self.__buckets
+        histograms = self.__histograms
+
+        with self.__lock:
+
+            if key not in histograms:
+                histograms[key] = {
+                    'buckets': [0] * len(buckets),
+                    'count': 0,
+                    'sum': 0.0}
+
+            histogram = histograms[key]
+
+            histogram['count'] += 1
+            histogram['sum'] += value
+
+            counts = histogram['buckets']
+
+            for index, bound in (
+                    enumerate(buckets)):
+
+                if value <= bound:
+                    counts[index] += 1
+
+
+    def histograms(
+        self,
+    ) -> DictStrAny:
+        """
+        Return the histograms with the cumulative bucket counts.
+
+        :returns: Histograms with the cumulative bucket counts.
+        """
+
+        buckets = self.__buckets
+
+        with self.__lock:
+
+            return {
+                key: {
+                    'buckets': dict(zip(
+                        buckets,
+                        value['buckets'],
+                        strict=True)),
+                    'count': value['count'],
+                    'sum': value['sum']}
+                for key, value in
+                self.__histograms.items()}
+
+
+    def clear(
+        self,
+    ) -> None:
+        """
+        Remove all of the histograms collected from the requests.
+        """
+
+        with self.__lock:
+            self.__histograms.clear()
+
+
+
+def templated(
+    location: str,
+) -> str:
+    """
+    Return the path with unique identifiers replaced by token.
+
+    .. note::
+       Segments that are numeric or lengthy hexadecimal values
+       are replaced, keeping the cardinality of routes bounded.
+
+    :param location: Location with path for server request.
+    :returns: Path with unique identifiers replaced by token.
+    """
+
+    path = URL(location).path
+
+    segments = [
+        '{id}'
+        if TEMPLATED.match(x)
+        else x
+        for x in path.split('/')]
+
+    return '/'.join(segments)
+
+
+
+def _sent(
+    response: Response,
+) -> Optional[int]:
+    """
+    Return the bytes sent within body of request to the server.
+
+    :param response: Response from upstream request to the server.
+    :returns: Bytes sent within body of request to the server.
+    """
+
+    try:
+        request = response.request
+
+    except RuntimeError:
+        return None
+
+    try:
+        return len(request.content)
+
+    except RequestNotRead:
+        return None
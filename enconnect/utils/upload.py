@@ -0,0 +1,215 @@
+"""
+Functions and routines associated with Enasis Network Remote Connect.
+
+This file is part of Enasis Network software eco-system. Distribution
+is permitted, for more information consult the project license file.
+"""
+
+
+
+from mimetypes import guess_type
+from pathlib import Path
+from typing import BinaryIO
+from typing import Optional
+from typing import Self
+
+
+
+_SOURCE = str | Path | BinaryIO
+
+_FIELD = tuple[str, tuple[str, BinaryIO, str]]
+
+
+
+class HTTPUpload:
+    """
+    Stream the files from disk into multipart request bodies.
+
+    .. note::
+       Files are opened when the fields are first requested and
+       read in chunks by the transport while request is sent, so
+       no copy of the content is retained within the memory.
+
+    .. note::
+       Handles are rewound to their original offset each time
+       the fields are requested, allowing for request retries.
+    """
+
+    __sources: list[tuple[str, str, _SOURCE, str]]
+    __handles: list[tuple[BinaryIO, int]]
+    __opened: list[BinaryIO]
+
+
+    def __init__(
+        self,
+    ) -> None:
+        """
+        Initialize instance for class using provided parameters.
+        """
+
+        self.__sources = []
+        self.__handles = []
+        self.__opened = []
+
+
+    def __enter__(
+        self,
+    ) -> Self:
+        """
+        Return the instance for use within the context manager.
+
+        :returns: Instance for use within the context manager.
+        """
+
+        return self
+
+
+    def __exit__(
+        self,
+        *args: object,
+    ) -> None:
+        """
+        Close the files which were opened from provided paths.
+
+        :param args: Positional arguments passed for downstream.
+        """
+
+        self.close()
+
+
+    @property
+    def names(
+        self,
+    ) -> list[str]:
+        """
+        Return the value for the attribute from class instance.
+
+        :returns: Value for the attribute from class instance.
+        """
+
+        return [
+            x[1] for x
+            in self.__sources]
+
+
+    def add(
+        self,
+        source: _SOURCE,
+        *,
+        field: str = 'files',
+        name: Optional[str] = None,
+        mimetype: Optional[str] = None,
+    ) -> None:
+        """
+        Include the file path or binary object within the upload.
+
+        :param source: Path to file or the binary file object.
+        :param field: Name of the field within the multipart.
+        :param name: Optional name for file when not from path.
+        :param mimetype: Optional type, otherwise will be guessed.
+        """
+
+        if self.__handles:
+            raise ValueError('opened')
+
+        if name is None:
+
+            path = (
+                source if isinstance(
+                    source, str | Path)
+                else getattr(
+                    source, 'name', 'file'))
+
+            name = Path(path).name
+
+        if mimetype is None:
+
+            guess = guess_type(name)[0]
+
+            mimetype = (
+                guess
+                or 'application/octet-stream')
+
+        self.__sources.append(
+            (field, name, source, mimetype))
+
+
+    def fields(
+        self,
+    ) -> list[_FIELD]:
+        """
+        Return the fields in format expected by the HTTP client.
+
+        :returns: Fields in format expected by the HTTP client.
+        """
+
+        handles = self.__handles
+        sources = self.__sources
+
+        if not handles:
+
+            for source in sources:
+
+                handle = self.__open(
+                    source[2])
+
+                handles.append(
+                    (handle, handle.tell()))
+
+        fields: list[_FIELD] = []
+
+        items = zip(
+            sources, handles,
+            strict=True)
+
+        for source, item in items:
+
+            field, name, _, mimetype = source
+            handle, offset = item
+
+            handle.seek(offset)
+
+            fields.append(
+                (field, (name, handle, mimetype)))
+
+        return fields
+
+
+    def __open(
+        self,
+        source: _SOURCE,
+    ) -> BinaryIO:
+        """
+        Return the binary file object for the provided source.
+
+        :param source: Path to file or the binary file object.
+        :returns: Binary file object for the provided source.
+        """
+
+        if not isinstance(source, str | Path):
+            return source
+
+        handle = (
+            Path(source)
+            .open('rb'))
+
+        self.__opened.append(handle)
+
+        return handle
+
+
+    def close(
+        self,
+    ) -> None:
+        """
+        Close the files which were opened from provided paths.
+        """
+
+        opened = self.__opened
+
+        for handle in opened:
+            handle.close()
+
+        opened.clear()
+
+        self.__handles = []
@@ -18,6 +18,7 @@ from .models import RESULT_KINDS
 from .models import YouTubeResult
 from .models import YouTubeVideo
 from ..utils import HTTPClient
+from ..utils import http_client
 from ..utils.http import _PAYLOAD
 
 if TYPE_CHECKING:
@@ -52,10 +53,9 @@ class YouTube:
 
         self.__params = params
 
-        client = HTTPClient(
-            timeout=params.timeout,
-            verify=params.ssl_verify,
-            capem=params.ssl_capem)
+        client = http_client(
+            params,
+            f'youtube/{params.token}')
 
         self.__client = client
 